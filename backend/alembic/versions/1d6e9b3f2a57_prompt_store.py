@@ -0,0 +1,70 @@
+"""content-addressed prompt store
+
+Revision ID: 1d6e9b3f2a57
+Revises: f3a8d0c6b1e2
+Create Date: 2026-10-16 18:55:12.640291
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '1d6e9b3f2a57'
+down_revision: str | None = 'f3a8d0c6b1e2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# request_payload key -> session filter, matching what BaseAgent.chat and AxiomChallenger.challenge store
+INTERNED = {
+    'system': "request_payload ? 'system'",
+    'prompt': "request_payload->>'type' = 'challenge' AND request_payload ? 'prompt'",
+}
+
+
+def upgrade() -> None:
+    op.create_table('prompts',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_prompts')),
+    sa.UniqueConstraint('hash', name=op.f('uq_prompts_hash'))
+    )
+
+    # lz4 is much cheaper than the default pglz for the large (TOASTed) payloads and prompts.
+    # Applies to values written from now on; partitions created later inherit it.
+    for column in ('request_payload', 'response_payload'):
+        op.execute(f'ALTER TABLE agent_sessions ALTER COLUMN {column} SET COMPRESSION lz4')
+    op.execute('ALTER TABLE prompts ALTER COLUMN content SET COMPRESSION lz4')
+
+    # Move inline prompts into the store; hashes match app.services.agents.prompt_store.prompt_hash
+    for key, where in INTERNED.items():
+        digest = f"encode(sha256(convert_to(request_payload->>'{key}', 'UTF8')), 'hex')"
+        op.execute(f"""
+            INSERT INTO prompts (id, hash, content)
+            SELECT gen_random_uuid(), {digest}, request_payload->>'{key}'
+            FROM (SELECT DISTINCT ON ({digest}) request_payload FROM agent_sessions WHERE {where}) s
+            ON CONFLICT (hash) DO NOTHING
+        """)
+        op.execute(f"""
+            UPDATE agent_sessions
+            SET request_payload = (request_payload - '{key}') || jsonb_build_object('{key}_ref', {digest})
+            WHERE {where}
+        """)
+
+
+def downgrade() -> None:
+    for key in INTERNED:
+        op.execute(f"""
+            UPDATE agent_sessions a
+            SET request_payload = (a.request_payload - '{key}_ref') || jsonb_build_object('{key}', p.content)
+            FROM prompts p
+            WHERE a.request_payload->>'{key}_ref' = p.hash
+        """)
+    for column in ('request_payload', 'response_payload'):
+        op.execute(f'ALTER TABLE agent_sessions ALTER COLUMN {column} SET COMPRESSION default')
+    op.drop_table('prompts')
@@ -0,0 +1,26 @@
+"""api_usage cached flag
+
+Revision ID: 3f9a1c2d7e84
+Revises: bd152577552d
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7e84'
+down_revision: str | None = 'bd152577552d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('api_usage', sa.Column('cached', sa.Boolean(), server_default='false', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('api_usage', 'cached')
@@ -0,0 +1,28 @@
+"""vibe sessions keyset index
+
+Revision ID: 4c7a1e5d8b23
+Revises: 8b2f4e1c9d60
+Create Date: 2026-10-16 20:04:31.582046
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4c7a1e5d8b23'
+down_revision: str | None = '8b2f4e1c9d60'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_vibe_sessions_perspective_created', 'vibe_sessions', ['perspective_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.drop_index('idx_vibe_sessions_perspective', table_name='vibe_sessions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_vibe_sessions_perspective', 'vibe_sessions', ['perspective_id'], unique=False)
+    op.drop_index('idx_vibe_sessions_perspective_created', table_name='vibe_sessions')
@@ -0,0 +1,43 @@
+"""exact journey costs
+
+Revision ID: 5d2f8a1c9e47
+Revises: 7b3e9f2c4a81
+Create Date: 2026-10-17 09:12:37.418204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8a1c9e47'
+down_revision: str | None = '7b3e9f2c4a81'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column('journeys', 'total_cost_cents',
+               existing_type=sa.INTEGER(),
+               type_=sa.Numeric(precision=14, scale=4),
+               existing_nullable=False,
+               existing_server_default=sa.text('0'))
+    # Costs are now added as sessions are recorded; start from the exact (unrounded) totals
+    op.execute("""
+        UPDATE journeys j SET total_cost_cents = j.archived_cost_cents + COALESCE((
+            SELECT SUM(a.cost_cents)
+            FROM agent_sessions a JOIN perspectives p ON a.perspective_id = p.id
+            WHERE p.journey_id = j.id AND a.created_at >= j.created_at
+        ), 0)
+    """)
+
+
+def downgrade() -> None:
+    op.alter_column('journeys', 'total_cost_cents',
+               existing_type=sa.Numeric(precision=14, scale=4),
+               type_=sa.INTEGER(),
+               existing_nullable=False,
+               existing_server_default=sa.text('0'),
+               postgresql_using='ROUND(total_cost_cents)::integer')
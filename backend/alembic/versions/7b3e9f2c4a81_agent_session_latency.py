@@ -0,0 +1,35 @@
+"""agent session latency
+
+Revision ID: 7b3e9f2c4a81
+Revises: 9e4d2b7a6c15
+Create Date: 2026-10-16 23:58:14.602913
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9f2c4a81'
+down_revision: str | None = '9e4d2b7a6c15'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Added to the partitioned parent, so every monthly partition gets the columns
+    op.add_column('agent_sessions', sa.Column('ttft_ms', sa.Integer(), nullable=True))
+    op.add_column('agent_sessions', sa.Column('inter_token_p50_ms', sa.Float(), nullable=True))
+    op.add_column('agent_sessions', sa.Column('inter_token_p95_ms', sa.Float(), nullable=True))
+    op.add_column('agent_sessions', sa.Column('inter_token_p99_ms', sa.Float(), nullable=True))
+    op.add_column('agent_sessions', sa.Column('output_tokens_per_second', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('agent_sessions', 'output_tokens_per_second')
+    op.drop_column('agent_sessions', 'inter_token_p99_ms')
+    op.drop_column('agent_sessions', 'inter_token_p95_ms')
+    op.drop_column('agent_sessions', 'inter_token_p50_ms')
+    op.drop_column('agent_sessions', 'ttft_ms')
@@ -0,0 +1,32 @@
+"""prompt cache token columns
+
+Revision ID: 7c2e5b9a4d13
+Revises: 3f9a1c2d7e84
+Create Date: 2026-10-16 11:03:27.540918
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5b9a4d13'
+down_revision: str | None = '3f9a1c2d7e84'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('agent_sessions', sa.Column('cache_read_tokens', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('agent_sessions', sa.Column('cache_write_tokens', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('api_usage', sa.Column('cache_read_tokens', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('api_usage', sa.Column('cache_write_tokens', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('api_usage', 'cache_write_tokens')
+    op.drop_column('api_usage', 'cache_read_tokens')
+    op.drop_column('agent_sessions', 'cache_write_tokens')
+    op.drop_column('agent_sessions', 'cache_read_tokens')
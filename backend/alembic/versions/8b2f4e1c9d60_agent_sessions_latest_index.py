@@ -0,0 +1,29 @@
+"""agent sessions latest-per-agent index
+
+Revision ID: 8b2f4e1c9d60
+Revises: 1d6e9b3f2a57
+Create Date: 2026-10-16 19:32:48.117530
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2f4e1c9d60'
+down_revision: str | None = '1d6e9b3f2a57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_agent_sessions_perspective_agent', 'agent_sessions', ['perspective_id', 'agent_name', sa.text('created_at DESC')], unique=False)
+    # Its leading column covers every lookup the single-column index served
+    op.drop_index('idx_agent_sessions_perspective', table_name='agent_sessions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_agent_sessions_perspective', 'agent_sessions', ['perspective_id'], unique=False)
+    op.drop_index('idx_agent_sessions_perspective_agent', table_name='agent_sessions')
@@ -0,0 +1,44 @@
+"""list keyset indexes
+
+Revision ID: 9e4d2b7a6c15
+Revises: 4c7a1e5d8b23
+Create Date: 2026-10-16 23:41:52.304718
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4d2b7a6c15'
+down_revision: str | None = '4c7a1e5d8b23'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_journeys_organization_created', 'journeys', ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.drop_index('idx_journeys_organization', table_name='journeys')
+    op.create_index('idx_goals_organization_created', 'goals', ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.drop_index('idx_goals_organization', table_name='goals')
+    op.create_index('idx_vdbas_organization_published', 'vdbas', ['organization_id', sa.text('published_at DESC'), sa.text('id DESC')], unique=False)
+    op.drop_index('idx_vdbas_organization', table_name='vdbas')
+    op.create_index('idx_notifications_user_created', 'notifications', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('idx_axiom_challenges_perspective_created', 'axiom_challenges', ['perspective_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.drop_index('idx_axiom_challenges_perspective', table_name='axiom_challenges')
+    op.create_index('idx_agent_sessions_perspective_created', 'agent_sessions', ['perspective_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_agent_sessions_perspective_created', table_name='agent_sessions')
+    op.create_index('idx_axiom_challenges_perspective', 'axiom_challenges', ['perspective_id'], unique=False)
+    op.drop_index('idx_axiom_challenges_perspective_created', table_name='axiom_challenges')
+    op.drop_index('idx_notifications_user_created', table_name='notifications')
+    op.create_index('idx_vdbas_organization', 'vdbas', ['organization_id'], unique=False)
+    op.drop_index('idx_vdbas_organization_published', table_name='vdbas')
+    op.create_index('idx_goals_organization', 'goals', ['organization_id'], unique=False)
+    op.drop_index('idx_goals_organization_created', table_name='goals')
+    op.create_index('idx_journeys_organization', 'journeys', ['organization_id'], unique=False)
+    op.drop_index('idx_journeys_organization_created', table_name='journeys')
@@ -0,0 +1,46 @@
+"""boomerang runs
+
+Revision ID: a41d8e6f2b90
+Revises: 7c2e5b9a4d13
+Create Date: 2026-10-16 13:41:09.227351
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d8e6f2b90'
+down_revision: str | None = '7c2e5b9a4d13'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('boomerang_runs',
+    sa.Column('perspective_id', sa.UUID(), nullable=False),
+    sa.Column('organization_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+    sa.Column('request', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
+    sa.Column('checkpoint', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.CheckConstraint("status IN ('queued', 'running', 'complete', 'failed')", name=op.f('ck_boomerang_runs_boomerang_run_status_check')),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], name=op.f('fk_boomerang_runs_organization_id_organizations'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['perspective_id'], ['perspectives.id'], name=op.f('fk_boomerang_runs_perspective_id_perspectives'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_boomerang_runs_user_id_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_boomerang_runs'))
+    )
+    op.create_index('idx_boomerang_runs_perspective', 'boomerang_runs', ['perspective_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_boomerang_runs_perspective', table_name='boomerang_runs')
+    op.drop_table('boomerang_runs')
@@ -0,0 +1,76 @@
+"""organization stats
+
+Revision ID: c58e2a7f1d36
+Revises: a41d8e6f2b90
+Create Date: 2026-10-16 15:02:44.518820
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58e2a7f1d36'
+down_revision: str | None = 'a41d8e6f2b90'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('organization_stats',
+    sa.Column('organization_id', sa.UUID(), nullable=False),
+    sa.Column('total_journeys', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('active_journeys', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('completed_journeys', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_vdbas', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_vibes', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_emails', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_cost_cents', sa.Numeric(precision=14, scale=4), server_default='0', nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], name=op.f('fk_organization_stats_organization_id_organizations'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_organization_stats')),
+    sa.UniqueConstraint('organization_id', name=op.f('uq_organization_stats_organization_id'))
+    )
+
+    # Journey costs were never maintained; derive them from the agent sessions
+    op.execute("""
+        UPDATE journeys j SET total_cost_cents = COALESCE((
+            SELECT ROUND(SUM(a.cost_cents))
+            FROM agent_sessions a JOIN perspectives p ON a.perspective_id = p.id
+            WHERE p.journey_id = j.id
+        ), 0)
+    """)
+    # Backfill from existing data (same aggregates as app.services.dashboard_stats.rebuild_stats)
+    op.execute("""
+        INSERT INTO organization_stats (
+            id, organization_id, total_journeys, active_journeys, completed_journeys,
+            total_vdbas, total_vibes, total_emails, total_cost_cents
+        )
+        SELECT
+            gen_random_uuid(), o.id,
+            (SELECT COUNT(*) FROM journeys j WHERE j.organization_id = o.id),
+            (SELECT COUNT(*) FROM journeys j WHERE j.organization_id = o.id AND j.status = 'active'),
+            (SELECT COUNT(*) FROM journeys j WHERE j.organization_id = o.id AND j.status = 'completed'),
+            (SELECT COUNT(*) FROM vdbas v WHERE v.organization_id = o.id),
+            (SELECT COUNT(*) FROM vibe_sessions vs
+                JOIN perspectives p ON vs.perspective_id = p.id
+                JOIN journeys j ON p.journey_id = j.id
+                WHERE j.organization_id = o.id),
+            (SELECT COUNT(*) FROM email_log e
+                JOIN perspectives p ON e.perspective_id = p.id
+                JOIN journeys j ON p.journey_id = j.id
+                WHERE j.organization_id = o.id),
+            (SELECT COALESCE(SUM(a.cost_cents), 0) FROM agent_sessions a
+                JOIN perspectives p ON a.perspective_id = p.id
+                JOIN journeys j ON p.journey_id = j.id
+                WHERE j.organization_id = o.id)
+        FROM organizations o
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('organization_stats')
@@ -0,0 +1,50 @@
+"""api usage daily rollup
+
+Revision ID: e2b7c4a9f051
+Revises: c58e2a7f1d36
+Create Date: 2026-10-16 16:20:37.904116
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4a9f051'
+down_revision: str | None = 'c58e2a7f1d36'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('api_usage_daily',
+    sa.Column('organization_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('service', postgresql.ENUM('claude', 'whisper', 'resend', name='api_service', create_type=False), nullable=False),
+    sa.Column('model_name', sa.String(length=50), server_default='', nullable=False),
+    sa.Column('endpoint', sa.String(length=200), server_default='', nullable=False),
+    sa.Column('calls', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('tokens_in', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('tokens_out', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('cache_read_tokens', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('cache_write_tokens', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('cost_cents', sa.Numeric(precision=14, scale=4), server_default='0', nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], name=op.f('fk_api_usage_daily_organization_id_organizations'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_api_usage_daily')),
+    sa.UniqueConstraint('organization_id', 'day', 'service', 'model_name', 'endpoint', name=op.f('uq_api_usage_daily_organization_id'))
+    )
+    op.create_index('idx_api_usage_daily_day', 'api_usage_daily', ['day'], unique=False)
+    op.create_index('idx_api_usage_created_brin', 'api_usage', ['created_at'], unique=False, postgresql_using='brin')
+    # Existing history is compacted by the first run of the usage.rollup job
+
+
+def downgrade() -> None:
+    op.drop_index('idx_api_usage_created_brin', table_name='api_usage', postgresql_using='brin')
+    op.drop_index('idx_api_usage_daily_day', table_name='api_usage_daily')
+    op.drop_table('api_usage_daily')
@@ -0,0 +1,139 @@
+"""partition agent_sessions and api_usage by month
+
+Revision ID: f3a8d0c6b1e2
+Revises: e2b7c4a9f051
+Create Date: 2026-10-16 17:41:09.226315
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d0c6b1e2'
+down_revision: str | None = 'e2b7c4a9f051'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Matches the default of settings.partition_premake_months; the partitions.maintain job keeps it topped up
+PREMAKE_MONTHS = 3
+
+TABLES = {
+    'agent_sessions': {
+        'foreign_keys': [
+            ('fk_agent_sessions_perspective_id_perspectives', 'perspective_id', 'perspectives', 'CASCADE'),
+        ],
+        'indexes': [
+            ('idx_agent_sessions_perspective', 'perspective_id', None),
+            ('idx_agent_sessions_agent', 'agent_name, created_at', None),
+            ('idx_agent_sessions_cost', 'created_at, cost_cents', None),
+        ],
+    },
+    'api_usage': {
+        'foreign_keys': [
+            ('fk_api_usage_organization_id_organizations', 'organization_id', 'organizations', 'CASCADE'),
+            ('fk_api_usage_user_id_users', 'user_id', 'users', 'SET NULL'),
+        ],
+        'indexes': [
+            ('idx_api_usage_org_date', 'organization_id, created_at', None),
+            ('idx_api_usage_service', 'service, created_at', None),
+            ('idx_api_usage_created_brin', 'created_at', 'brin'),
+        ],
+    },
+}
+
+# A foreign key must reference a unique key, and on a partitioned table every unique
+# key includes the partition column; agent_session_id becomes a soft reference
+SESSION_REFERENCES = [
+    ('axiom_challenges', 'fk_axiom_challenges_agent_session_id_agent_sessions'),
+    ('vibe_analyses', 'fk_vibe_analyses_agent_session_id_agent_sessions'),
+]
+
+
+def _create_indexes(table: str) -> None:
+    for name, columns, using in TABLES[table]['indexes']:
+        op.execute(f"CREATE INDEX {name} ON {table} {'USING ' + using + ' ' if using else ''}({columns})")
+
+
+def _create_foreign_keys(table: str) -> None:
+    for name, column, referred, ondelete in TABLES[table]['foreign_keys']:
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def _partition(table: str) -> None:
+    old = f'{table}_unpartitioned'
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT pk_{table} TO pk_{old}')
+    for name, _, _ in TABLES[table]['indexes']:
+        op.execute(f'DROP INDEX {name}')
+
+    # Same columns, defaults, NOT NULLs and CHECK constraints
+    op.execute(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (created_at)'
+    )
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT pk_{table} PRIMARY KEY (id, created_at)')
+    _create_foreign_keys(table)
+    _create_indexes(table)
+
+    # One partition per UTC month, from the oldest row through PREMAKE_MONTHS ahead
+    op.execute(f"""
+        DO $$
+        DECLARE
+            cur date;
+            last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PREMAKE_MONTHS} months')::date;
+        BEGIN
+            SELECT date_trunc('month', COALESCE(MIN(created_at), now()) AT TIME ZONE 'UTC')::date
+            INTO cur FROM {old};
+            WHILE cur <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(cur, 'YYYY_MM'),
+                    cur::timestamp AT TIME ZONE 'UTC',
+                    (cur + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+                cur := (cur + interval '1 month')::date;
+            END LOOP;
+        END $$
+    """)
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    op.execute(f'DROP TABLE {old}')
+
+
+def _unpartition(table: str) -> None:
+    old = f'{table}_partitioned'
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT pk_{table} TO pk_{old}')
+    for name, _, _ in TABLES[table]['indexes']:
+        op.execute(f'DROP INDEX {name}')
+
+    op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT pk_{table} PRIMARY KEY (id)')
+    _create_foreign_keys(table)
+    _create_indexes(table)
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    # Drops the partitions with it
+    op.execute(f'DROP TABLE {old}')
+
+
+def upgrade() -> None:
+    op.add_column('journeys', sa.Column('archived_cost_cents', sa.Numeric(precision=14, scale=4), server_default='0', nullable=False))
+    op.add_column('journeys', sa.Column('archived_sessions', sa.Integer(), server_default='0', nullable=False))
+
+    for table, constraint in SESSION_REFERENCES:
+        op.drop_constraint(constraint, table, type_='foreignkey')
+    for table in TABLES:
+        _partition(table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        _unpartition(table)
+    # Fails if archived sessions are still referenced; clear those references first
+    for table, constraint in SESSION_REFERENCES:
+        op.create_foreign_key(constraint, table, 'agent_sessions', ['agent_session_id'], ['id'])
+
+    op.drop_column('journeys', 'archived_sessions')
+    op.drop_column('journeys', 'archived_cost_cents')
@@ -1,13 +1,15 @@
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import Callable
+from functools import cache
 
 from fastapi import Cookie, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import ForbiddenError, UnauthorizedError
-from app.db.session import async_session_factory
+from app.db.session import get_db
 from app.models.enums import UserRole
 from app.models.user import User
 from app.services import auth as auth_service
+from app.services.auth import Principal
 
 ROLE_HIERARCHY = {
     UserRole.ADMIN: 3,
@@ -16,21 +18,10 @@ ROLE_HIERARCHY = {
 }
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-
-
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
+def get_token(
     access_token: str | None = Cookie(default=None),
     authorization: str | None = Header(default=None),
-) -> User:
+) -> str:
     token = None
     if access_token:
         token = access_token
@@ -39,14 +30,25 @@ async def get_current_user(
 
     if not token:
         raise UnauthorizedError("Not authenticated")
+    return token
+
 
+async def get_current_user(db: AsyncSession = Depends(get_db), token: str = Depends(get_token)) -> User:
     return await auth_service.get_current_user(db, token)
 
 
+def get_principal(token: str = Depends(get_token)) -> Principal:
+    """The caller from the token's claims alone, for read-only routes (see ``Principal``)."""
+    return auth_service.get_token_principal(token)
+
+
+# One dependency per role, so FastAPI resolves it once per request like any other
+@cache
 def require_role(min_role: str) -> Callable:
+    required_level = ROLE_HIERARCHY.get(UserRole(min_role), 0)
+
     async def _check(current_user: User = Depends(get_current_user)) -> User:
         user_level = ROLE_HIERARCHY.get(UserRole(current_user.role), 0)
-        required_level = ROLE_HIERARCHY.get(UserRole(min_role), 0)
         if user_level < required_level:
             raise ForbiddenError("Insufficient permissions")
         return current_user
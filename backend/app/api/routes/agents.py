@@ -2,32 +2,46 @@
 
 from __future__ import annotations
 
+import logging
 import uuid
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from app.api.deps import get_current_user, get_db
-from app.core.errors import NotFoundError, ValidationError
+from app.api.deps import get_current_user, get_db, get_principal
+from app.core.errors import AppError, NotFoundError, ValidationError
 from app.core.sse import sse_event, sse_response
+from app.db.pagination import paginate
+from app.db.session import release_connection
 from app.models.agent_session import AgentSession
 from app.models.axiom_challenge import AxiomChallenge
+from app.models.boomerang_run import BoomerangRun
 from app.models.goal import Goal
 from app.models.journey import Journey
 from app.models.perspective import Perspective
 from app.models.user import User
 from app.schemas.agent import (
+    AgentSessionDetailResponse,
     AgentSessionResponse,
     AxiomChallengeResponse,
     BoomerangRequest,
+    BoomerangRunResponse,
     ChatRequest,
 )
-from app.schemas.common import PaginationMeta, ResponseEnvelope
+from app.schemas.common import CountMode, ResponseEnvelope
+from app.services import boomerang_runs
+from app.services.agent_sessions import latest_agent_outputs
 from app.services.agents.base import AGENT_REGISTRY, AgentContext
-from app.services.agents.orchestrator import BoomerangOrchestrator
+from app.services.agents.cache import org_cache_enabled
+from app.services.agents.prompt_store import expand_request_payloads
 from app.services.agents.prompts import VALID_AGENT_NAMES
+from app.services.agents.telemetry import TelemetryBuffer
+from app.services.auth import Principal
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -62,12 +76,16 @@ async def agent_chat(
         phase=perspective.phase,
         organization_id=current_user.organization_id,
         user_id=current_user.id,
+        telemetry=TelemetryBuffer(),
     )
 
     async def stream() -> AsyncGenerator[str, None]:
-        async for event in agent.chat(body.message, context, db):
-            yield event
+        async with context.telemetry:
+            async for event in agent.chat(body.message, context, db):
+                yield event
 
+    # Telemetry rows are written by the buffer's own sessions; don't pin a connection while streaming
+    await release_connection(db)
     return sse_response(stream())
 
 
@@ -78,7 +96,11 @@ async def run_boomerang(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Run the full boomerang flow (8 specialists + Axiom) via SSE."""
+    """Run the full boomerang flow (8 specialists + Axiom) via SSE.
+
+    The run executes in the job worker and continues if the client disconnects. The
+    first event carries the run id; reattach with GET /boomerang-runs/{run_id}/events.
+    """
     perspective = await _get_perspective(perspective_id, db)
 
     # Load goal via perspective -> journey -> goal
@@ -100,6 +122,7 @@ async def run_boomerang(
         goal_statement=goal_statement,
         organization_id=current_user.organization_id,
         user_id=current_user.id,
+        response_cache=await org_cache_enabled(db, current_user.organization_id),
     )
 
     # Build user message from goal context — never send empty
@@ -125,56 +148,111 @@ async def run_boomerang(
             f"within the {dim} / {phase} intersection."
         )
 
-    orchestrator = BoomerangOrchestrator()
+    run = await boomerang_runs.create_run(db, context, message)
+    # Commit before enqueueing so the worker can see the run row
+    await db.commit()
 
-    async def stream() -> AsyncGenerator[str, None]:
-        async for event in orchestrator.run(context, message, db):
-            yield event
+    try:
+        await boomerang_runs.start_run(run.id)
+    except Exception as exc:
+        logger.exception("Failed to start boomerang run %s", run.id)
+        run.status = "failed"
+        run.error = "Could not queue run"
+        # Committed here: the error below rolls the request's transaction back, which
+        # would otherwise leave the already-committed run "queued" for pollers forever
+        await db.commit()
+        raise AppError("Could not start the boomerang run. Please try again.") from exc
 
-    return sse_response(stream())
+    return sse_response(boomerang_runs.stream_run_events(run.id))
+
+
+async def _get_run(run_id: uuid.UUID, current_user: Principal, db: AsyncSession) -> BoomerangRun:
+    run = await boomerang_runs.get_run(db, run_id)
+    if not run or run.organization_id != current_user.organization_id:
+        raise NotFoundError(f"Boomerang run {run_id} not found")
+    return run
+
+
+@router.get("/boomerang-runs/{run_id}", response_model=ResponseEnvelope[BoomerangRunResponse])
+async def get_boomerang_run(
+    run_id: uuid.UUID,
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return a boomerang run's status and progress."""
+    run = await _get_run(run_id, current_user, db)
+    checkpoint = run.checkpoint or {}
+    return ResponseEnvelope(data=BoomerangRunResponse(
+        id=run.id,
+        perspective_id=run.perspective_id,
+        status=run.status,
+        error=run.error,
+        specialists_completed=sorted(checkpoint.get("specialists", {})),
+        challenges_total=len(checkpoint["challenges"]) if checkpoint.get("challenges") is not None else None,
+        verdicts_completed=len(checkpoint.get("verdicts", {})),
+        created_at=run.created_at,
+        completed_at=run.completed_at,
+    ))
+
+
+@router.get("/boomerang-runs/{run_id}/events")
+async def stream_boomerang_run_events(
+    run_id: uuid.UUID,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    after: str | None = Query(None, description="Stream entry id to resume after (if Last-Event-ID can't be set)"),
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reattach to a boomerang run's SSE stream, replaying events after Last-Event-ID."""
+    await _get_run(run_id, current_user, db)
+    resume_from = last_event_id or after
+    if resume_from and not boomerang_runs.is_stream_id(resume_from):
+        raise ValidationError(f"Invalid Last-Event-ID: {resume_from}")
+    return sse_response(boomerang_runs.stream_run_events(run_id, resume_from))
 
 
 @router.get(
     "/perspectives/{perspective_id}/agent-sessions",
-    response_model=ResponseEnvelope[list[AgentSessionResponse]],
+    response_model=ResponseEnvelope[list[AgentSessionDetailResponse | AgentSessionResponse]],
 )
 async def list_agent_sessions(
     perspective_id: uuid.UUID,
     agent: str | None = Query(None, description="Filter by agent name"),
+    expand: bool = Query(False, description="Include request/response payloads, with stored prompts expanded"),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List agent sessions for a perspective."""
+    """List agent sessions for a perspective. Payloads are only read when ``expand`` is set."""
     await _get_perspective(perspective_id, db)
 
-    base_query = select(AgentSession).where(AgentSession.perspective_id == perspective_id)
-    count_query = select(func.count()).select_from(AgentSession).where(
-        AgentSession.perspective_id == perspective_id,
-    )
-
+    query = select(AgentSession).where(AgentSession.perspective_id == perspective_id)
     if agent:
         if agent not in VALID_AGENT_NAMES:
             raise ValidationError(f"Invalid agent name: {agent}")
-        base_query = base_query.where(AgentSession.agent_name == agent)
-        count_query = count_query.where(AgentSession.agent_name == agent)
-
-    # Total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        query = query.where(AgentSession.agent_name == agent)
+    if not expand:
+        query = query.options(defer(AgentSession.request_payload), defer(AgentSession.response_payload))
 
-    # Paginated results
-    offset = (page - 1) * per_page
-    query = base_query.order_by(AgentSession.created_at.desc()).offset(offset).limit(per_page)
-    result = await db.execute(query)
-    sessions = result.scalars().all()
+    sessions, pagination = await paginate(
+        db, query, AgentSession.created_at, AgentSession.id, page=page, per_page=per_page, cursor=cursor, count=count
+    )
 
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 0
+    if expand:
+        request_payloads = await expand_request_payloads(db, sessions)
+        data = [
+            AgentSessionDetailResponse.model_validate(s).model_copy(update={"request_payload": payload})
+            for s, payload in zip(sessions, request_payloads, strict=True)
+        ]
+    else:
+        data = [AgentSessionResponse.model_validate(s) for s in sessions]
 
     return ResponseEnvelope(
-        data=[AgentSessionResponse.model_validate(s) for s in sessions],
-        meta=PaginationMeta(page=page, per_page=per_page, total=total, total_pages=total_pages).model_dump(),
+        data=data,
+        meta=pagination.model_dump(),
     )
 
 
@@ -196,24 +274,13 @@ async def trigger_axiom_challenge(
         phase=perspective.phase,
         organization_id=current_user.organization_id,
         user_id=current_user.id,
+        response_cache=await org_cache_enabled(db, current_user.organization_id),
+        telemetry=TelemetryBuffer(),
     )
 
     # Gather latest specialist outputs from stored sessions
-    specialist_outputs: dict[str, str] = {}
     specialist_names = [n for n in VALID_AGENT_NAMES if n != "axiom"]
-
-    for name in specialist_names:
-        result = await db.execute(
-            select(AgentSession)
-            .where(AgentSession.perspective_id == perspective_id, AgentSession.agent_name == name)
-            .order_by(AgentSession.created_at.desc())
-            .limit(1)
-        )
-        session = result.scalar_one_or_none()
-        if session and session.response_payload:
-            content = session.response_payload.get("content", "")
-            if content:
-                specialist_outputs[name] = content
+    specialist_outputs = await latest_agent_outputs(db, perspective_id, specialist_names)
 
     if not specialist_outputs:
         raise ValidationError("No specialist outputs found for this perspective. Run agents first.")
@@ -221,10 +288,12 @@ async def trigger_axiom_challenge(
     from app.services.agents.axiom import AxiomChallenger
 
     challenger = AxiomChallenger()
+    await release_connection(db)
 
     async def stream() -> AsyncGenerator[str, None]:
-        async for event in challenger.stream_challenge(specialist_outputs, context, db):
-            yield event
+        async with context.telemetry:
+            async for event in challenger.stream_challenge(specialist_outputs, context, db):
+                yield event
         yield sse_event("challenge_complete", {"perspective_id": str(perspective_id)})
 
     return sse_response(stream())
@@ -238,32 +307,27 @@ async def list_axiom_challenges(
     perspective_id: uuid.UUID,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """List Axiom challenges for a perspective."""
     await _get_perspective(perspective_id, db)
 
-    count_query = select(func.count()).select_from(AxiomChallenge).where(
-        AxiomChallenge.perspective_id == perspective_id,
+    query = select(AxiomChallenge).where(AxiomChallenge.perspective_id == perspective_id)
+    challenges, pagination = await paginate(
+        db,
+        query,
+        AxiomChallenge.created_at,
+        AxiomChallenge.id,
+        page=page,
+        per_page=per_page,
+        cursor=cursor,
+        count=count,
     )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    offset = (page - 1) * per_page
-    query = (
-        select(AxiomChallenge)
-        .where(AxiomChallenge.perspective_id == perspective_id)
-        .order_by(AxiomChallenge.created_at.desc())
-        .offset(offset)
-        .limit(per_page)
-    )
-    result = await db.execute(query)
-    challenges = result.scalars().all()
-
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 0
 
     return ResponseEnvelope(
         data=[AxiomChallengeResponse.model_validate(c) for c in challenges],
-        meta=PaginationMeta(page=page, per_page=per_page, total=total, total_pages=total_pages).model_dump(),
+        meta=pagination.model_dump(),
     )
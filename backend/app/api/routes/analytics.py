@@ -1,13 +1,16 @@
 import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.models.user import User
-from app.schemas.analytics import DashboardStats, JourneyAnalytics
+from app.api.deps import get_db, get_principal
+from app.core.errors import ValidationError
+from app.schemas.analytics import DashboardStats, JourneyAnalytics, LatencyReport
 from app.schemas.common import ResponseEnvelope
 from app.services import analytics as analytics_service
+from app.services.agents.prompts import VALID_AGENT_NAMES
+from app.services.auth import Principal
 
 router = APIRouter(prefix="/analytics")
 
@@ -15,7 +18,7 @@ router = APIRouter(prefix="/analytics")
 @router.get("/journeys/{journey_id}")
 async def get_journey_analytics(
     journey_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ) -> ResponseEnvelope[JourneyAnalytics]:
     analytics = await analytics_service.get_journey_analytics(
@@ -26,10 +29,30 @@ async def get_journey_analytics(
 
 @router.get("/dashboard")
 async def get_dashboard_stats(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ) -> ResponseEnvelope[DashboardStats]:
     stats = await analytics_service.get_dashboard_stats(
         db, current_user.organization_id
     )
     return ResponseEnvelope(data=stats)
+
+
+@router.get("/latency")
+async def get_latency_report(
+    start: datetime | None = Query(None),
+    end: datetime | None = Query(None),
+    agent: str | None = Query(None),
+    model: str | None = Query(None),
+    current_user: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+) -> ResponseEnvelope[LatencyReport]:
+    """p50/p95/p99 agent session latency by agent, model and intersection over ``start``..``end``."""
+    if agent and agent not in VALID_AGENT_NAMES:
+        raise ValidationError(f"Invalid agent name: {agent}")
+    if start and end and start >= end:
+        raise ValidationError("start must be before end")
+    report = await analytics_service.get_latency_report(
+        db, current_user.organization_id, start, end, agent_name=agent, model=model
+    )
+    return ResponseEnvelope(data=report)
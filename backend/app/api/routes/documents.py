@@ -1,16 +1,54 @@
+import re
 import uuid
 
-from fastapi import APIRouter, Depends, File, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, File, Header, UploadFile
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.document import DocumentListResponse, DocumentResponse
 from app.services import document as document_service
 
 router = APIRouter()
 
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiableError(Exception):
+    pass
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``Range: bytes=...`` header into inclusive ``(start, end)`` offsets.
+
+    Returns None when the whole file should be sent: no header, a malformed header,
+    or a multi-range request (which we don't serve). Raises RangeNotSatisfiableError when
+    the range lies outside the file.
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0:
+            raise RangeNotSatisfiableError
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiableError
+    if start > end:
+        return None
+    return start, end
+
 
 @router.post("/perspectives/{perspective_id}/documents", response_model=DocumentResponse, status_code=201)
 async def upload_document(
@@ -36,15 +74,33 @@ async def list_documents(
 @router.get("/documents/{document_id}/download")
 async def download_document(
     document_id: uuid.UUID,
+    range_header: str | None = Header(None, alias="Range"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Response:
-    doc, data = await document_service.get_document_content(db, document_id)
-    return Response(
-        content=data,
-        media_type=doc.file_type,
-        headers={"Content-Disposition": f'attachment; filename="{doc.filename}"'},
-    )
+    doc = await document_service.get_document(db, document_id)
+    if settings.document_download_redirect:
+        return RedirectResponse(await document_service.get_download_url(doc), status_code=307)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{doc.filename}"',
+        "Accept-Ranges": "bytes",
+    }
+    try:
+        byte_range = parse_range(range_header, doc.file_size)
+    except RangeNotSatisfiableError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{doc.file_size}"})
+
+    if byte_range is None:
+        chunks = await document_service.open_document_stream(doc)
+        headers["Content-Length"] = str(doc.file_size)
+        return StreamingResponse(chunks, media_type=doc.file_type, headers=headers)
+
+    start, end = byte_range
+    chunks = await document_service.open_document_stream(doc, start, end)
+    headers["Content-Range"] = f"bytes {start}-{end}/{doc.file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(chunks, status_code=206, media_type=doc.file_type, headers=headers)
 
 
 @router.delete("/documents/{document_id}", status_code=204)
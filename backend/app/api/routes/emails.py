@@ -10,6 +10,7 @@ from app.core.errors import ValidationError
 from app.models.email_log import EmailLog
 from app.models.user import User
 from app.schemas.email import EmailListResponse, EmailLogResponse, SendEmailRequest
+from app.services.dashboard_stats import bump_for_perspective
 from app.services.email import TEMPLATE_BUILDERS, send_email
 
 router = APIRouter()
@@ -49,6 +50,7 @@ async def send_perspective_email(
     )
     db.add(log)
     await db.flush()
+    await bump_for_perspective(db, perspective_id, total_emails=1)
 
     return EmailLogResponse.model_validate(log)
 
@@ -1,4 +1,3 @@
-import math
 import uuid
 
 from fastapi import APIRouter, Depends, Query
@@ -6,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
 from app.models.user import User
-from app.schemas.common import PaginationMeta
+from app.schemas.common import CountMode
 from app.schemas.goal import GoalCreate, GoalListResponse, GoalResponse
 from app.services import goal as goal_service
 
@@ -28,15 +27,17 @@ async def list_goals(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     type: str | None = Query(None, pattern="^(predefined|custom)$"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> GoalListResponse:
-    goals, total = await goal_service.list_goals(db, current_user.organization_id, page, per_page, type)
+    goals, pagination = await goal_service.list_goals(
+        db, current_user.organization_id, page, per_page, type, cursor=cursor, count=count
+    )
     return GoalListResponse(
         goals=[GoalResponse.model_validate(g) for g in goals],
-        pagination=PaginationMeta(
-            page=page, per_page=per_page, total=total, total_pages=math.ceil(total / per_page) if total else 0
-        ),
+        pagination=pagination,
     )
 
 
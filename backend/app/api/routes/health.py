@@ -2,12 +2,15 @@ import time
 
 import redis.asyncio as aioredis
 from fastapi import APIRouter, Response
-from miniopy_async import Minio
 from sqlalchemy import text
 
 from app.core.config import settings
-from app.db.session import async_session_factory
-from app.schemas.health import HealthResponse, ServiceCheck
+from app.core.errors import NotFoundError
+from app.core.metrics import render_metrics
+from app.db.pool import pool_snapshot
+from app.db.session import async_session_factory, engine
+from app.schemas.health import HealthResponse, PoolStatsResponse, ServiceCheck
+from app.services.minio import get_minio_client
 
 router = APIRouter()
 
@@ -45,13 +48,7 @@ async def health_check(response: Response) -> HealthResponse:
     # MinIO check
     try:
         start = time.monotonic()
-        client = Minio(
-            settings.minio_endpoint,
-            access_key=settings.minio_access_key,
-            secret_key=settings.minio_secret_key,
-            secure=False,
-        )
-        await client.list_buckets()
+        await get_minio_client().bucket_exists(settings.minio_bucket)
         latency = (time.monotonic() - start) * 1000
         checks["minio"] = ServiceCheck(status="up", latency_ms=round(latency, 1))
     except Exception:
@@ -68,3 +65,18 @@ async def health_check(response: Response) -> HealthResponse:
         version="1.0.0",
         uptime_seconds=round(time.time() - _start_time, 1),
     )
+
+
+@router.get("/health/pool", response_model=PoolStatsResponse)
+async def pool_stats() -> PoolStatsResponse:
+    """This worker's database pool: occupancy now, and checkout waits, overflow and timeouts so far."""
+    return PoolStatsResponse(**pool_snapshot(engine))
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus metrics for all workers. Sync, so reading the multiprocess files runs in the threadpool."""
+    if not settings.metrics_enabled:
+        raise NotFoundError("Metrics are disabled")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,4 +1,3 @@
-import math
 import uuid
 
 from fastapi import APIRouter, Depends, Query
@@ -7,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user, get_db, require_role
 from app.models.user import User
 from app.schemas.bank import BankInstanceResponse
-from app.schemas.common import PaginationMeta
+from app.schemas.common import CountMode
 from app.schemas.journey import (
     JourneyCreate,
     JourneyDetailResponse,
@@ -36,15 +35,17 @@ async def list_journeys(
     status: str | None = Query(None, pattern="^(active|completed|archived)$"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> JourneyListResponse:
-    journeys, total = await journey_service.list_journeys(db, current_user.organization_id, status, page, per_page)
+    journeys, pagination = await journey_service.list_journeys(
+        db, current_user.organization_id, status, page, per_page, cursor=cursor, count=count
+    )
     return JourneyListResponse(
         journeys=[JourneyResponse.model_validate(j) for j in journeys],
-        pagination=PaginationMeta(
-            page=page, per_page=per_page, total=total, total_pages=math.ceil(total / per_page) if total else 0
-        ),
+        pagination=pagination,
     )
 
 
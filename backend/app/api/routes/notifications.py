@@ -1,14 +1,14 @@
-import math
 import uuid
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, get_principal
 from app.models.user import User
-from app.schemas.common import PaginationMeta, ResponseEnvelope
+from app.schemas.common import CountMode, ResponseEnvelope
 from app.schemas.notification import NotificationCount, NotificationResponse
 from app.services import notification as notification_service
+from app.services.auth import Principal
 
 router = APIRouter(prefix="/notifications")
 
@@ -17,20 +17,23 @@ router = APIRouter(prefix="/notifications")
 async def list_notifications(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
-    notifications, total = await notification_service.list_notifications(db, current_user.id, page, per_page)
-    total_pages = math.ceil(total / per_page) if total else 0
+    notifications, pagination = await notification_service.list_notifications(
+        db, current_user.id, page, per_page, cursor=cursor, count=count
+    )
     return ResponseEnvelope(
         data=[NotificationResponse.model_validate(n) for n in notifications],
-        meta=PaginationMeta(page=page, per_page=per_page, total=total, total_pages=total_pages).model_dump(),
+        meta=pagination.model_dump(),
     )
 
 
 @router.get("/unread-count", response_model=ResponseEnvelope[NotificationCount])
 async def get_unread_count(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     count = await notification_service.get_unread_count(db, current_user.id)
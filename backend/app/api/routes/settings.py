@@ -3,7 +3,7 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db, require_role
+from app.api.deps import get_db, get_principal, require_role
 from app.models.user import User
 from app.schemas.common import ResponseEnvelope
 from app.schemas.settings import (
@@ -14,13 +14,14 @@ from app.schemas.settings import (
 )
 from app.services import settings as settings_service
 from app.services import usage as usage_service
+from app.services.auth import Principal
 
 router = APIRouter(prefix="/settings")
 
 
 @router.get("", response_model=ResponseEnvelope[SettingsResponse])
 async def get_settings(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     data = await settings_service.get_settings(db, current_user.organization_id)
@@ -42,7 +43,7 @@ async def update_setting(
 async def get_usage_summary(
     start: date | None = Query(None),
     end: date | None = Query(None),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     data = await usage_service.get_usage_summary(db, current_user.organization_id, start, end)
@@ -54,7 +55,7 @@ async def get_usage_breakdown(
     group_by: str = Query("service", pattern="^(service|model|endpoint)$"),
     start: date | None = Query(None),
     end: date | None = Query(None),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
 ):
     data = await usage_service.get_usage_breakdown(db, current_user.organization_id, group_by, start, end)
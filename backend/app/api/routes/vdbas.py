@@ -6,11 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
 from app.models.user import User
-from app.schemas.common import PaginationMeta, ResponseEnvelope
+from app.schemas.common import CountMode, ResponseEnvelope
 from app.schemas.vdba import VdbaCreate, VdbaDetailResponse, VdbaListItem, VdbaResponse
 from app.services import export as export_service
 from app.services import vdba as vdba_service
-from app.services.minio import download_file, get_minio_client
+from app.services.minio import get_minio_client, open_file_stream
 
 router = APIRouter()
 
@@ -40,18 +40,17 @@ async def publish_journey(
 async def list_vdbas(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; takes precedence over page"),
+    count: CountMode | None = Query(None, description="Total to report: exact (default for page), estimated or none"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ResponseEnvelope[list[VdbaListItem]]:
-    vdbas, total = await vdba_service.list_vdbas(
-        db, current_user.organization_id, page, per_page
+    vdbas, pagination = await vdba_service.list_vdbas(
+        db, current_user.organization_id, page, per_page, cursor=cursor, count=count
     )
-    total_pages = (total + per_page - 1) // per_page
     return ResponseEnvelope(
         data=[VdbaListItem.model_validate(v) for v in vdbas],
-        meta=PaginationMeta(
-            page=page, per_page=per_page, total=total, total_pages=total_pages
-        ).model_dump(),
+        meta=pagination.model_dump(),
     )
 
 
@@ -78,15 +77,12 @@ async def download_export(
         # Re-fetch to get updated export_url
         vdba = await vdba_service.get_vdba(db, vdba_id, current_user.organization_id)
 
-    client = get_minio_client()
-    file_bytes = await download_file(client, vdba.export_url)
+    chunks = await open_file_stream(get_minio_client(), vdba.export_url)
     content_type = EXPORT_CONTENT_TYPES.get(vdba.export_format, "application/octet-stream")
     extension = vdba.export_format or "json"
 
-    import io
-
     return StreamingResponse(
-        io.BytesIO(file_bytes),
+        chunks,
         media_type=content_type,
         headers={
             "Content-Disposition": f'attachment; filename="vdba-{vdba.id}.{extension}"'
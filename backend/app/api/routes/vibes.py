@@ -5,31 +5,28 @@ from __future__ import annotations
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, Form, UploadFile
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Form, Query, UploadFile
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.core.errors import NotFoundError, ValidationError
 from app.models.perspective import Perspective
 from app.models.user import User
-from app.models.vibe_analysis import VibeAnalysis
 from app.models.vibe_session import VibeSession
 from app.schemas.common import ResponseEnvelope
 from app.schemas.vibe import (
     VibeAnalysisItem,
     VibeDetailResponse,
     VibeListResponse,
-    VibeSessionResponse,
     VibeUploadResponse,
 )
 from app.services.vibe import (
     create_vibe_session,
     get_vibe_session_detail,
     list_vibe_sessions,
-    run_post_vibe_analysis,
-    transcribe_vibe,
 )
+from app.services.vibe_jobs import enqueue_analysis, enqueue_transcription
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +48,7 @@ async def _get_perspective(perspective_id: uuid.UUID, db: AsyncSession) -> Persp
 @router.post(
     "/perspectives/{perspective_id}/vibes",
     response_model=ResponseEnvelope[VibeUploadResponse],
-    status_code=201,
+    status_code=202,
 )
 async def upload_vibe(
     perspective_id: uuid.UUID,
@@ -62,8 +59,8 @@ async def upload_vibe(
 ):
     """Upload a voice recording for a perspective.
 
-    Accepts webm/wav/mp3 audio up to 100 MB. Runs transcription synchronously
-    and then triggers post-vibe analysis on the transcript.
+    Accepts webm/wav/mp3 audio up to 100 MB. Transcription and post-vibe analysis
+    run on the background worker; poll the vibe session status for progress.
     """
     await _get_perspective(perspective_id, db)
 
@@ -81,15 +78,18 @@ async def upload_vibe(
     # Create vibe session (uploads to MinIO)
     vibe = await create_vibe_session(db, perspective_id, current_user.id, audio_data, duration_seconds)
 
-    # Run transcription synchronously — will be moved to background jobs later
+    # Commit before enqueueing so the worker can see the session row
+    await db.commit()
+
+    job_id: str | None = None
     try:
-        await transcribe_vibe(db, vibe.id)
+        job_id = await enqueue_transcription(vibe.id)
     except Exception:
-        logger.exception("Transcription failed for vibe session %s", vibe.id)
+        logger.exception("Failed to enqueue transcription for vibe session %s", vibe.id)
         vibe.status = "failed"
         await db.flush()
 
-    return ResponseEnvelope(data=VibeUploadResponse.model_validate(vibe))
+    return ResponseEnvelope(data=VibeUploadResponse.model_validate(vibe).model_copy(update={"job_id": job_id}))
 
 
 @router.get(
@@ -98,33 +98,17 @@ async def upload_vibe(
 )
 async def list_vibes(
     perspective_id: uuid.UUID,
+    limit: int | None = Query(None, ge=1, le=200, description="Page size; omit to list every session"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List vibe sessions for a perspective."""
+    """List vibe sessions for a perspective, newest first, optionally a page at a time."""
     await _get_perspective(perspective_id, db)
 
-    sessions = await list_vibe_sessions(db, perspective_id)
-
-    # Build response with analysis counts
-    items = []
-    for s in sessions:
-        count_result = await db.execute(
-            select(func.count()).select_from(VibeAnalysis).where(VibeAnalysis.vibe_session_id == s.id)
-        )
-        count = count_result.scalar() or 0
-        items.append(
-            VibeSessionResponse(
-                id=s.id,
-                duration_seconds=s.duration_seconds,
-                status=s.status,
-                has_transcript=s.transcript_text is not None,
-                analyses_count=count,
-                created_at=s.created_at,
-            )
-        )
+    items, next_cursor = await list_vibe_sessions(db, perspective_id, limit=limit, cursor=cursor)
 
-    return ResponseEnvelope(data=VibeListResponse(vibe_sessions=items))
+    return ResponseEnvelope(data=VibeListResponse(vibe_sessions=items, next_cursor=next_cursor))
 
 
 @router.get(
@@ -156,13 +140,14 @@ async def get_vibe_detail(
 @router.post(
     "/vibes/{vibe_id}/analyze",
     response_model=ResponseEnvelope[VibeUploadResponse],
+    status_code=202,
 )
 async def re_analyze_vibe(
     vibe_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Re-trigger post-vibe analysis on an existing vibe session."""
+    """Re-trigger post-vibe analysis on an existing vibe session (runs on the background worker)."""
     result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_id))
     vibe = result.scalar_one_or_none()
     if not vibe:
@@ -172,13 +157,14 @@ async def re_analyze_vibe(
         raise ValidationError("Cannot analyze — vibe session has no transcript")
 
     vibe.status = "analyzing"
-    await db.flush()
+    await db.commit()
 
+    job_id: str | None = None
     try:
-        await run_post_vibe_analysis(db, vibe.id)
+        job_id = await enqueue_analysis(vibe.id)
     except Exception:
-        logger.exception("Re-analysis failed for vibe session %s", vibe.id)
+        logger.exception("Failed to enqueue re-analysis for vibe session %s", vibe.id)
         vibe.status = "failed"
         await db.flush()
 
-    return ResponseEnvelope(data=VibeUploadResponse.model_validate(vibe))
+    return ResponseEnvelope(data=VibeUploadResponse.model_validate(vibe).model_copy(update={"job_id": job_id}))
@@ -0,0 +1,125 @@
+"""Process-wide logging setup.
+
+Every record goes onto an in-memory queue; a ``QueueListener`` thread formats it
+and writes it to stderr, so log I/O never blocks the event loop. Output is the
+classic pipe-separated text or one JSON object per line (``LOG_FORMAT=json``).
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import Settings
+from app.core.middleware import request_id_var
+
+TEXT_FORMAT = "%(asctime)s | %(levelname)-7s | %(name)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Request fields appended to the text message, in this order, when set
+HTTP_DETAIL_KEYS = ("query", "auth", "slow", "request_body", "response_body", "error")
+
+_listener: QueueListener | None = None
+
+
+class RequestIDFilter(logging.Filter):
+    """Tag records logged while handling a request with its id."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            request_id = request_id_var.get()
+            if request_id is not None:
+                record.request_id = request_id
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    """The pipe-separated text format, with a request record's ``http`` details appended."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802 (logging.Formatter API)
+        message = super().formatMessage(record)
+        http = getattr(record, "http", None)
+        if not http:
+            return message
+        details = [f"{key}={http[key]}" for key in HTTP_DETAIL_KEYS if http.get(key) is not None]
+        return " | ".join([message, *details])
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, request id and ``http`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, object] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            entry["request_id"] = request_id
+        http = getattr(record, "http", None)
+        if http:
+            entry["http"] = {key: value for key, value in http.items() if value is not None}
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records unformatted; the listener thread renders them.
+
+    ``QueueHandler.prepare`` formats on the caller's thread so records can be
+    pickled. This queue never leaves the process, so formatting (message
+    interpolation, tracebacks, JSON) is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def build_formatter(settings: Settings) -> logging.Formatter:
+    if settings.log_format.lower() == "json":
+        return JsonFormatter()
+    return TextFormatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
+
+def configure_logging(settings: Settings) -> None:
+    """Send all logging through a queue to a stderr writer thread.
+
+    Like ``logging.basicConfig``, does nothing if the root logger already has
+    handlers (a test runner, or an earlier call).
+    """
+    global _listener
+    root = logging.getLogger()
+    level = logging.getLevelName(settings.log_level.upper())
+    # Ensure our request logger is active even if root level is higher
+    logging.getLogger("incube.requests").setLevel(level)
+    if root.handlers:
+        return
+
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(build_formatter(settings))
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(log_queue)
+    # Handler filters run on the calling thread, where the request context is still set
+    handler.addFilter(RequestIDFilter())
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,131 +1,163 @@
 import logging
+import random
+import re
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("incube.requests")
 
 MAX_REQUEST_BODY_LOG_LENGTH = 1000
+MAX_RESPONSE_BODY_LOG_LENGTH = 2000
 
 # Methods that typically carry a request body
 BODY_METHODS = {"POST", "PUT", "PATCH"}
 
-# Paths to skip logging (e.g. health checks to avoid noise)
-SKIP_PATHS = {"/api/health"}
+# Paths to skip logging (e.g. health checks and metrics scrapes to avoid noise)
+SKIP_PATHS = {"/api/health", "/api/metrics"}
 
+REDACTED = "[REDACTED]"
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware that logs request/response details and timing for every HTTP call."""
+# Credential-bearing field names: password, new_password, token, refresh_token, api_key, ...
+_SENSITIVE_NAME = r"[\w-]*(?:password|passwd|secret|token|authorization|api[_-]?key|cookie)[\w-]*"
+# A JSON member with a sensitive name; the value may be cut off by truncation
+_JSON_MEMBER = re.compile(r'("' + _SENSITIVE_NAME + r'"\s*:\s*)(?:"(?:[^"\\]|\\.)*"?|[^,}\]\s]+)', re.IGNORECASE)
+# A query-string or form-encoded parameter with a sensitive name
+_FORM_PARAM = re.compile(r"(^|&)(" + _SENSITIVE_NAME + r")=[^&]*", re.IGNORECASE)
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in SKIP_PATHS:
-            return await call_next(request)
 
-        request_id = getattr(request.state, "request_id", "unknown")
-        start_time = time.monotonic()
+def redact(text: str) -> str:
+    """Mask the values of credential fields in a JSON, query-string or form-encoded body."""
+    text = _JSON_MEMBER.sub(lambda m: f'{m.group(1)}"{REDACTED}"', text)
+    return _FORM_PARAM.sub(lambda m: f"{m.group(1)}{m.group(2)}={REDACTED}", text)
 
-        # --- Log the incoming request ---
-        request_body = await self._get_request_body(request)
-        self._log_request(request, request_id, request_body)
 
-        # --- Call the next middleware / route handler ---
-        response: Response | None = None
-        error_detail: str | None = None
-        try:
-            response = await call_next(request)
-        except Exception as exc:
-            elapsed_ms = (time.monotonic() - start_time) * 1000
-            error_detail = f"{type(exc).__name__}: {exc}"
-            logger.error(
-                "[%s] UNHANDLED EXCEPTION | %s %s | %.1fms | %s",
-                request_id,
-                request.method,
-                request.url.path,
-                elapsed_ms,
-                error_detail,
-            )
-            raise
+class _BodySample:
+    """The first ``limit`` bytes of a body as it streams past, and its total size."""
 
-        elapsed_ms = (time.monotonic() - start_time) * 1000
+    __slots__ = ("limit", "chunks", "kept", "size")
 
-        # --- Read response body for error responses ---
-        response_body: str | None = None
-        if response.status_code >= 400:
-            response_body = await self._get_response_body(response)
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.chunks: list[bytes] = []
+        self.kept = 0
+        self.size = 0
 
-        self._log_response(request, response, request_id, elapsed_ms, response_body)
+    def add(self, chunk: bytes) -> None:
+        if chunk and self.kept < self.limit:
+            head = chunk[: self.limit - self.kept]
+            self.chunks.append(head)
+            self.kept += len(head)
+        self.size += len(chunk)
 
-        return response
-
-    async def _get_request_body(self, request: Request) -> str | None:
-        """Read and return the request body for methods that carry one."""
-        if request.method not in BODY_METHODS:
+    def text(self) -> str | None:
+        if not self.size:
             return None
-        try:
-            body_bytes = await request.body()
-            if not body_bytes:
-                return None
-            body_str = body_bytes.decode("utf-8", errors="replace")
-            if len(body_str) > MAX_REQUEST_BODY_LOG_LENGTH:
-                return body_str[:MAX_REQUEST_BODY_LOG_LENGTH] + f"... [truncated, total {len(body_str)} chars]"
-            return body_str
-        except Exception:
-            return "[error reading body]"
-
-    async def _get_response_body(self, response: Response) -> str | None:
-        """Read the full response body from a StreamingResponse for error logging."""
-        try:
-            body_parts: list[bytes] = []
-            async for chunk in response.body_iterator:  # type: ignore[union-attr]
-                if isinstance(chunk, str):
-                    body_parts.append(chunk.encode("utf-8"))
-                else:
-                    body_parts.append(chunk)
-
-            full_body = b"".join(body_parts)
-
-            # Rebuild the body iterator so the client still receives the response
-            async def replay_body():
-                yield full_body
-
-            response.body_iterator = replay_body()  # type: ignore[assignment]
+        body = redact(b"".join(self.chunks).decode("utf-8", errors="replace"))
+        if self.size > self.kept:
+            body += f"... [truncated, total {self.size} bytes]"
+        return body
+
+
+class LoggingMiddleware:
+    """Log one record per HTTP request, when its response has been sent.
+
+    Pure ASGI: request and response bodies stream through untouched. The first
+    ``MAX_REQUEST_BODY_LOG_LENGTH`` bytes of a request body are kept as the app
+    reads it, and the first ``MAX_RESPONSE_BODY_LOG_LENGTH`` bytes of a 4xx/5xx
+    response as it is sent. The record's ``request_id`` and ``http`` attributes
+    carry the request fields; the formatter renders them (see
+    ``app.core.logging_config``).
+
+    Errors (4xx/5xx, exceptions) and requests slower than ``slow_request_ms``
+    are always logged, with their bodies. Other requests are logged at INFO,
+    without bodies, for a random ``sample_rate`` fraction of them. Credential
+    fields in the query string and bodies are redacted.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_request_ms: float = 1000.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        request_body = _BodySample(MAX_REQUEST_BODY_LOG_LENGTH) if scope["method"] in BODY_METHODS else None
+        response_body: _BodySample | None = None
+        status = 500
+
+        async def receive_sampled() -> Message:
+            message = await receive()
+            if request_body is not None and message["type"] == "http.request":
+                request_body.add(message.get("body", b""))
+            return message
+
+        async def send_sampled(message: Message) -> None:
+            nonlocal status, response_body
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if status >= 400:
+                    response_body = _BodySample(MAX_RESPONSE_BODY_LOG_LENGTH)
+            elif message["type"] == "http.response.body" and response_body is not None:
+                response_body.add(message.get("body", b""))
+            await send(message)
 
-            return full_body.decode("utf-8", errors="replace")
-        except Exception:
-            return "[error reading response body]"
-
-    def _log_request(self, request: Request, request_id: str, body: str | None) -> None:
-        has_auth = "Authorization" in request.headers
-        query = str(request.url.query) if request.url.query else None
-
-        parts = [
-            f"[{request_id}] REQUEST  | {request.method} {request.url.path}",
-        ]
-        if query:
-            parts.append(f"  query_params={query}")
-        parts.append(f"  auth={'present' if has_auth else 'absent'}")
-        if body is not None:
-            parts.append(f"  body={body}")
-
-        logger.info("\n".join(parts))
+        try:
+            await self.app(scope, receive_sampled, send_sampled)
+        except Exception as exc:
+            self._log(scope, 500, start, request_body, None, error=f"{type(exc).__name__}: {exc}")
+            raise
+        self._log(scope, status, start, request_body, response_body)
 
-    def _log_response(
+    def _log(
         self,
-        request: Request,
-        response: Response,
-        request_id: str,
-        elapsed_ms: float,
-        response_body: str | None,
+        scope: Scope,
+        status: int,
+        start: float,
+        request_body: _BodySample | None,
+        response_body: _BodySample | None,
+        error: str | None = None,
     ) -> None:
-        status = response.status_code
-        level = logging.WARNING if 400 <= status < 500 else logging.ERROR if status >= 500 else logging.INFO
-
-        parts = [
-            f"[{request_id}] RESPONSE | {request.method} {request.url.path} | {status} | {elapsed_ms:.1f}ms",
-        ]
-        if response_body is not None:
-            parts.append(f"  response_body={response_body}")
-
-        logger.log(level, "\n".join(parts))
+        duration_ms = (time.perf_counter() - start) * 1000
+        slow = duration_ms >= self.slow_request_ms
+        if status >= 500:
+            level = logging.ERROR
+        elif status >= 400 or slow:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return
+        if not logger.isEnabledFor(level):
+            return
+
+        detailed = level > logging.INFO
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+        query = scope["query_string"].decode("latin-1")
+        has_auth = any(name == b"authorization" for name, _ in scope["headers"])
+        fields = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "duration_ms": round(duration_ms, 1),
+            "query": redact(query) if query else None,
+            "auth": "present" if has_auth else "absent",
+            "slow": True if slow else None,
+            "request_body": request_body.text() if detailed and request_body is not None else None,
+            "response_body": response_body.text() if response_body is not None else None,
+            "error": error,
+        }
+        logger.log(
+            level,
+            "[%s] %s %s | %d | %.1fms",
+            request_id,
+            scope["method"],
+            scope["path"],
+            status,
+            duration_ms,
+            extra={"request_id": request_id, "http": fields},
+        )
@@ -0,0 +1,55 @@
+"""Bounded in-process LRU used as the first tier of the Redis-backed caches."""
+
+import time
+from collections import OrderedDict
+
+
+class MemoryLRU:
+    """LRU bounded by entry count and total UTF-8 size, with per-entry expiry."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, tuple[float, int, str]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> str | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, _size, value = item
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        if key in self._data:
+            self._pop(key)
+        self._data[key] = (time.monotonic() + ttl_seconds, size, value)
+        self._bytes += size
+        while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+            self._pop(next(iter(self._data)))
+
+    def pop(self, key: str) -> None:
+        if key in self._data:
+            self._pop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        _expires_at, size, _value = self._data.pop(key)
+        self._bytes -= size
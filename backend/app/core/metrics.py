@@ -0,0 +1,194 @@
+"""Prometheus metrics for HTTP, SSE, LLM, storage and database latency, and the auth cache.
+
+Values are kept per process. Under multi-worker uvicorn, point
+``PROMETHEUS_MULTIPROC_DIR`` at an empty directory before the workers start:
+each worker then writes its values there, and ``/api/metrics`` (served by any
+worker) aggregates all of them.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "incube_http_request_duration_seconds",
+    "HTTP request latency by route template (SSE streams excluded)",
+    ["method", "route", "status"],
+)
+SSE_STREAM_SECONDS = Histogram(
+    "incube_sse_stream_duration_seconds",
+    "How long server-sent event streams stayed open",
+    ["route"],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "incube_llm_request_duration_seconds",
+    "Claude API call latency, including any wait for a concurrency slot (streamed: until the final message)",
+    ["agent", "model", "mode", "outcome"],
+    buckets=(0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "incube_llm_time_to_first_token_seconds",
+    "Streamed Claude API calls: time until the first text arrived, including any wait for a concurrency slot",
+    ["agent", "model"],
+    buckets=(0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 5, 10, 30),
+)
+LLM_TOKENS = Counter(
+    "incube_llm_tokens",
+    "Claude API tokens by kind: input, output, cache_read, cache_write",
+    ["agent", "model", "kind"],
+)
+STORAGE_SECONDS = Histogram(
+    "incube_storage_operation_duration_seconds",
+    "MinIO request latency (get: until the response headers)",
+    ["operation"],
+)
+STORAGE_BYTES = Counter("incube_storage_bytes", "Bytes written to or read from MinIO", ["operation"])
+DB_QUERY_SECONDS = Histogram(
+    "incube_db_query_duration_seconds",
+    "Database statement execution time by statement type",
+    ["statement"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+AUTH_CACHE_LOOKUPS = Counter(
+    "incube_auth_cache_lookups",
+    "Authenticated-user cache lookups by result: memory_hit, redis_hit, miss",
+    ["result"],
+)
+AUTH_CACHE_DB_LOOKUPS_SAVED = Counter(
+    "incube_auth_cache_db_lookups_saved",
+    "User queries answered by the authenticated-user cache instead of the database",
+)
+AUTH_CACHE_INVALIDATIONS = Counter("incube_auth_cache_invalidations", "Users dropped from the authenticated-user cache")
+AUTH_CACHE_ERRORS = Counter(
+    "incube_auth_cache_errors",
+    "Authenticated-user cache Redis errors; lookups fall back to memory or the database",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "incube_db_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+
+_STATEMENT_TYPES = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The exposition text and its content type: this process's metrics, or every worker's."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def record_llm_call(
+    agent: str,
+    model: str,
+    mode: str,
+    seconds: float,
+    *,
+    error: bool = False,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+    ttft: float | None = None,
+) -> None:
+    """Observe one Claude API call: its latency (and a stream's time to first token), and the tokens it used."""
+    LLM_REQUEST_SECONDS.labels(agent, model, mode, "error" if error else "ok").observe(seconds)
+    if ttft is not None:
+        LLM_TIME_TO_FIRST_TOKEN_SECONDS.labels(agent, model).observe(ttft)
+    for kind, tokens in (
+        ("input", input_tokens),
+        ("output", output_tokens),
+        ("cache_read", cache_read_tokens),
+        ("cache_write", cache_write_tokens),
+    ):
+        if tokens:
+            LLM_TOKENS.labels(agent, model, kind).inc(tokens)
+
+
+def record_storage_operation(operation: str, seconds: float, size: int = 0) -> None:
+    STORAGE_SECONDS.labels(operation).observe(seconds)
+    if size:
+        STORAGE_BYTES.labels(operation).inc(size)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "_metrics_start", None)
+    if start is None:
+        return
+    statement_type = statement.lstrip()[:6].upper()
+    if statement_type not in _STATEMENT_TYPES:
+        statement_type = "OTHER"
+    DB_QUERY_SECONDS.labels(statement_type).observe(time.perf_counter() - start)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement ``engine`` executes."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_template(scope: Scope) -> str:
+    # Set by the router once a route matches; unmatched paths share one label
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Observe each HTTP request's latency under its route template, e.g. ``/api/goals/{goal_id}``.
+
+    Server-sent event streams go to their own histogram: their duration is how
+    long the client stayed connected, not how fast the API answered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        streaming = False
+
+        async def send_observed(message: Message) -> None:
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streaming = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", ())
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_observed)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = route_template(scope)
+            if streaming:
+                SSE_STREAM_SECONDS.labels(route).observe(elapsed)
+            else:
+                HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(elapsed)
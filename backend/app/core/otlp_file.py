@@ -0,0 +1,64 @@
+"""Span exporter writing OTLP JSON lines to a local file, for offline analysis.
+
+Each export batch becomes one line holding an ``ExportTraceServiceRequest`` in
+the OTLP/JSON encoding (hex trace and span ids, integer enums), the format the
+OpenTelemetry Collector's file exporter writes and its file receiver reads.
+Requires the ``tracing`` extra.
+"""
+
+import base64
+import json
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+_ID_FIELDS = ("traceId", "spanId", "parentSpanId")
+
+
+def _hex_ids(item: dict) -> None:
+    # protobuf's JSON mapping writes bytes as base64; OTLP/JSON wants hex ids
+    for key in _ID_FIELDS:
+        if key in item:
+            item[key] = base64.b64decode(item[key]).hex()
+
+
+def to_otlp_json(spans: Sequence[ReadableSpan]) -> str:
+    request = MessageToDict(encode_spans(spans), use_integers_for_enums=True)
+    for resource_spans in request.get("resourceSpans", ()):
+        for scope_spans in resource_spans.get("scopeSpans", ()):
+            for span in scope_spans.get("spans", ()):
+                _hex_ids(span)
+                for link in span.get("links", ()):
+                    _hex_ids(link)
+    return json.dumps(request, separators=(",", ":"))
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    """Append each batch of spans to ``path`` as one OTLP JSON line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        line = to_otlp_json(spans)
+        with self._lock:
+            if self._file.closed:
+                return SpanExportResult.FAILURE
+            self._file.write(line + "\n")
+            self._file.flush()
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,23 @@
+"""Process-wide async Redis client."""
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+_client: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared Redis client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (called on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
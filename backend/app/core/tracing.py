@@ -0,0 +1,227 @@
+"""Optional OpenTelemetry tracing.
+
+Off unless ``tracing_enabled`` is set and the ``tracing`` extra is installed
+(``pip install '.[tracing]'``). When off, ``span`` returns a shared no-op, so
+instrumented code pays almost nothing. Spans carry the ``X-Request-ID`` of the
+request they belong to as ``incube.request_id``, and background jobs continue
+the trace of the request that enqueued them.
+
+Spans are exported in batches from a background thread, to a local file of
+OTLP JSON lines (one ``ExportTraceServiceRequest`` per line) or to the console.
+"""
+
+import contextlib
+import logging
+import os
+from collections.abc import AsyncGenerator, Iterator, Mapping
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.core.metrics import route_template
+from app.core.middleware import request_id_var
+
+logger = logging.getLogger(__name__)
+
+_provider: Any = None
+_tracer: Any = None
+
+
+class _NoSpan:
+    """Stands in for a span (and its context manager) while tracing is off."""
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: object) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, object]) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def configure_tracing(settings: Settings, service_name: str) -> None:
+    """Install a tracer provider for this process if tracing is enabled."""
+    global _provider, _tracer
+    if not settings.tracing_enabled or _tracer is not None:
+        return
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError:
+        logger.warning("Tracing is enabled but OpenTelemetry is not installed (the 'tracing' extra); tracing is off")
+        return
+
+    if settings.tracing_exporter.lower() == "console":
+        exporter = ConsoleSpanExporter()
+    else:
+        from app.core.otlp_file import OTLPJsonFileExporter
+
+        path = settings.tracing_file_path.format(service=service_name, pid=os.getpid())
+        exporter = OTLPJsonFileExporter(path)
+
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    _tracer = _provider.get_tracer("incube")
+    logger.info("Tracing enabled: service=%s exporter=%s", service_name, settings.tracing_exporter)
+
+
+def shutdown_tracing() -> None:
+    """Export any buffered spans (called on shutdown)."""
+    global _provider, _tracer
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = _tracer = None
+
+
+def _with_request_id(attributes: Mapping[str, Any] | None) -> dict[str, Any]:
+    attributes = dict(attributes or {})
+    request_id = request_id_var.get()
+    if request_id is not None:
+        attributes["incube.request_id"] = request_id
+    return attributes
+
+
+def span(name: str, attributes: Mapping[str, Any] | None = None) -> Any:
+    """A context manager for a child span of the current one; it yields the span.
+
+    While tracing is off this is a shared no-op whose span methods do nothing.
+    Not for spans that stay open across a ``yield``: use ``start_span`` there.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.start_as_current_span(name, attributes=_with_request_id(attributes))
+
+
+def start_span(name: str, attributes: Mapping[str, Any] | None = None) -> Any:
+    """Start a child span of the current one without making it current; call ``end()`` on it.
+
+    For async generators: a span entered with ``span`` stays attached to the context
+    across ``yield``, and a generator closed on client disconnect is finalized from
+    another context, where detaching it fails. Make the span current only for
+    stretches that don't yield, with ``use_span`` or ``iterate_in_span``.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.start_span(name, attributes=_with_request_id(attributes))
+
+
+def use_span(current: Any) -> Any:
+    """Make a span from ``start_span`` current for a block that doesn't ``yield``."""
+    if _tracer is None or current is _NO_SPAN:
+        return _NO_SPAN
+    from opentelemetry import trace
+
+    return trace.use_span(current, end_on_exit=False)
+
+
+async def iterate_in_span(current: Any, events: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+    """Re-yield ``events``, with ``current`` as the active span only while ``events`` runs."""
+    try:
+        while True:
+            with use_span(current):
+                try:
+                    event = await anext(events)
+                except StopAsyncIteration:
+                    return
+            yield event
+    finally:
+        await events.aclose()
+
+
+def inject_context() -> dict[str, str]:
+    """The current trace context as W3C ``traceparent`` headers, to hand to another process."""
+    if _tracer is None:
+        return {}
+    from opentelemetry import propagate
+
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier
+
+
+@contextlib.contextmanager
+def _attached(carrier: Mapping[str, str]) -> Iterator[None]:
+    from opentelemetry import context, propagate
+
+    token = context.attach(propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        context.detach(token)
+
+
+def continue_trace(carrier: Mapping[str, str] | None) -> Any:
+    """Make the trace context from ``inject_context`` (or request headers) current."""
+    if _tracer is None or not carrier:
+        return _NO_SPAN
+    return _attached(carrier)
+
+
+class TracingMiddleware:
+    """A server span per HTTP request, named after its route template.
+
+    Continues a ``traceparent`` sent by the client. Sits inside
+    ``RequestIDMiddleware``, so the span carries the request id.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or _tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        from opentelemetry.trace import SpanKind
+
+        status = 500
+
+        async def send_traced(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        carrier = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name in (b"traceparent", b"tracestate")
+        }
+        attributes = {"http.request.method": scope["method"], "url.path": scope["path"]}
+        request_id = request_id_var.get()
+        if request_id is not None:
+            attributes["incube.request_id"] = request_id
+
+        with continue_trace(carrier), _tracer.start_as_current_span(
+            f"{scope['method']} {scope['path']}", kind=SpanKind.SERVER, attributes=attributes,
+        ) as current:
+            try:
+                await self.app(scope, receive, send_traced)
+            finally:
+                route = route_template(scope)
+                current.update_name(f"{scope['method']} {route}")
+                current.set_attributes({"http.route": route, "http.response.status_code": status})
@@ -0,0 +1,73 @@
+"""Newest-first pagination of list queries, by page number or by keyset cursor."""
+
+import json
+import math
+from typing import Any
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.schemas.common import CountMode, PaginationMeta, decode_cursor, encode_cursor
+
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """The planner's row estimate for ``query``: no scan, only as good as the table statistics."""
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    connection = await db.connection()
+    plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    *,
+    page: int = 1,
+    per_page: int = 20,
+    cursor: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[list[Any], PaginationMeta]:
+    """One page of the entities selected by ``query``, ordered by ``sort_column``, ``id_column`` descending.
+
+    With ``cursor`` (a ``next_cursor`` from an earlier page) the page is a keyset
+    seek past that row, so deep pages cost the same as the first; otherwise
+    ``page`` is applied as an OFFSET. ``count`` defaults to "exact" for numbered
+    pages, as they always were, and to "none" for cursor pages.
+    """
+    if count is None:
+        count = "none" if cursor is not None else "exact"
+
+    total = None
+    if count == "exact":
+        total = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+    elif count == "estimated":
+        total = await estimate_count(db, query)
+
+    query = query.order_by(sort_column.desc(), id_column.desc())
+    if cursor is not None:
+        query = query.where(tuple_(sort_column, id_column) < tuple_(*decode_cursor(cursor)))
+    else:
+        query = query.offset((page - 1) * per_page)
+    # One extra row tells whether there is a next page
+    items = list((await db.execute(query.limit(per_page + 1))).scalars().all())
+
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return items, PaginationMeta(
+        page=None if cursor is not None else page,
+        per_page=per_page,
+        total=total,
+        total_pages=math.ceil(total / per_page) if total is not None else None,
+        total_estimated=count == "estimated",
+        next_cursor=next_cursor,
+    )
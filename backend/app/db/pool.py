@@ -0,0 +1,92 @@
+"""Connection pool configuration and per-process pool statistics.
+
+Every process (each uvicorn worker, the job worker) has its own engine and pool,
+so the numbers here describe one process; ``pid`` tells them apart.
+"""
+
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings
+from app.core.metrics import DB_POOL_WAIT_SECONDS
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    # Checkouts that had to open a connection beyond pool_size
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        overflow = self.overflow()
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            pool_stats.wait_seconds_total += waited
+            pool_stats.wait_seconds_max = max(pool_stats.wait_seconds_max, waited)
+            DB_POOL_WAIT_SECONDS.observe(waited)
+        pool_stats.checkouts += 1
+        if self.overflow() > max(overflow, 0):
+            pool_stats.overflow_checkouts += 1
+        return connection
+
+
+def _prepared_statement_name() -> str:
+    # Unique across PgBouncer's shared server connections
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` from the ``db_*`` settings."""
+    if settings.db_pgbouncer:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _prepared_statement_name,
+        }
+    else:
+        connect_args = {"prepared_statement_cache_size": settings.db_statement_cache_size}
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+
+def pool_snapshot(engine: AsyncEngine) -> dict[str, Any]:
+    """Current occupancy of ``engine``'s pool plus the counters since this process started."""
+    pool = engine.sync_engine.pool
+    return {
+        "pid": os.getpid(),
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **asdict(pool_stats),
+    }
@@ -0,0 +1,21 @@
+"""Recompute the materialized dashboard totals from the source tables.
+
+Run with: python -m app.db.rebuild_stats [organization_id]
+"""
+
+import asyncio
+import sys
+import uuid
+
+from app.db.session import unit_of_work
+from app.services.dashboard_stats import rebuild_stats
+
+
+async def rebuild(org_id: uuid.UUID | None = None) -> None:
+    async with unit_of_work() as session:
+        await rebuild_stats(session, org_id)
+    print(f"Rebuilt dashboard stats for {org_id or 'all organizations'}.")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild(uuid.UUID(sys.argv[1]) if len(sys.argv) > 1 else None))
@@ -1,14 +1,52 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.db.pool import engine_options
 
-engine = create_async_engine(settings.database_url, pool_size=10, pool_pre_ping=True)
+engine = create_async_engine(settings.database_url, **engine_options(settings))
+instrument_engine(engine)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped session: one per request, committed on success, rolled back on error.
+
+    The session only holds a pooled connection while a transaction is open; routes
+    that go on to wait on an LLM or an SSE stream call ``release_connection`` first.
+    """
+    async with async_session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """Commit the work so far and hand the session's pooled connection back.
+
+    Call before a long await that doesn't need the database, such as an LLM call or
+    an SSE stream. The session checks a connection out again on its next statement
+    and that later work is committed as usual. Objects already loaded stay usable
+    (``expire_on_commit`` is off), but an error after this point no longer rolls
+    back what was committed here.
+    """
+    if session.in_transaction():
+        await session.commit()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncSession]:
+    """Short-lived session for background work: commits on success, rolls back on error.
+
+    Use one per independent step so a pooled connection is only checked out while the
+    step is actually talking to the database.
+    """
     async with async_session_factory() as session:
         try:
             yield session
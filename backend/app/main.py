@@ -1,4 +1,3 @@
-import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -22,18 +21,18 @@ from app.api.routes.vdbas import router as vdbas_router
 from app.api.routes.vibes import router as vibes_router
 from app.core.config import settings
 from app.core.errors import AppError
+from app.core.logging_config import configure_logging
 from app.core.logging_middleware import LoggingMiddleware
+from app.core.metrics import MetricsMiddleware
 from app.core.middleware import RequestIDMiddleware
+from app.core.redis import close_redis
+from app.core.tracing import TracingMiddleware, configure_tracing, shutdown_tracing
 from app.db.session import engine
+from app.services.agents.client import close_anthropic_client
+from app.services.minio import close_minio_client
 
-# Configure request logging
-logging.basicConfig(
-    level=logging.getLevelName(settings.log_level.upper()),
-    format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-# Ensure our request logger is active even if root level is higher
-logging.getLogger("incube.requests").setLevel(logging.getLevelName(settings.log_level.upper()))
+configure_logging(settings)
+configure_tracing(settings, "incube-api")
 
 
 @asynccontextmanager
@@ -43,15 +42,29 @@ async def lifespan(app: FastAPI):
         await conn.execute(__import__("sqlalchemy").text("SELECT 1"))
     yield
     # Shutdown
+    await close_anthropic_client()
+    await close_redis()
+    await close_minio_client()
     await engine.dispose()
+    shutdown_tracing()
 
 
 app = FastAPI(title="InCube API", version="1.0.0", lifespan=lifespan)
 
 # Middleware — order matters: last added wraps outermost.
-# RequestIDMiddleware runs first (outermost), then LoggingMiddleware reads the ID.
+# RequestIDMiddleware wraps LoggingMiddleware, so the ID is set before it is logged.
+# MetricsMiddleware is innermost, so its timings leave out logging; TracingMiddleware is
+# also inside RequestIDMiddleware, so request spans carry the request id.
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+app.add_middleware(
+    LoggingMiddleware,
+    sample_rate=settings.log_request_sample_rate,
+    slow_request_ms=settings.log_slow_request_ms,
+)
 app.add_middleware(RequestIDMiddleware)
-app.add_middleware(LoggingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[origin.strip() for origin in settings.cors_origins.split(",")],
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy import CheckConstraint, DateTime, Float, ForeignKey, Index, Integer, Numeric, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,10 +21,20 @@ class AgentSession(Base):
     system_prompt_version: Mapped[str] = mapped_column(String(20), default="v1", server_default="v1")
     input_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     output_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    cache_read_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    cache_write_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     cost_cents: Mapped[float] = mapped_column(Numeric(10, 4), default=0, server_default="0")
     request_payload: Mapped[dict] = mapped_column(JSONB, default=dict, server_default="{}")
     response_payload: Mapped[dict] = mapped_column(JSONB, default=dict, server_default="{}")
     duration_ms: Mapped[int | None] = mapped_column(Integer)
+    # Streamed chat only: time to first token, gaps between streamed text deltas, output throughput
+    ttft_ms: Mapped[int | None] = mapped_column(Integer)
+    inter_token_p50_ms: Mapped[float | None] = mapped_column(Float)
+    inter_token_p95_ms: Mapped[float | None] = mapped_column(Float)
+    inter_token_p99_ms: Mapped[float | None] = mapped_column(Float)
+    output_tokens_per_second: Mapped[float | None] = mapped_column(Float)
+    # Partition key, so part of the primary key (see app.services.partitions)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     # agent_sessions only has created_at in DDL, but Base adds updated_at too — acceptable
 
@@ -34,7 +45,10 @@ class AgentSession(Base):
         ),
         CheckConstraint("input_tokens >= 0", name="input_tokens_nonneg"),
         CheckConstraint("output_tokens >= 0", name="output_tokens_nonneg"),
-        Index("idx_agent_sessions_perspective", "perspective_id"),
+        # Latest session per agent (agent_sessions.latest_per_agent_query); also serves perspective_id lookups
+        Index("idx_agent_sessions_perspective_agent", "perspective_id", "agent_name", text("created_at DESC")),
+        Index("idx_agent_sessions_perspective_created", "perspective_id", text("created_at DESC"), text("id DESC")),
         Index("idx_agent_sessions_agent", "agent_name", "created_at"),
         Index("idx_agent_sessions_cost", "created_at", "cost_cents"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
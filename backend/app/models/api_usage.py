@@ -1,7 +1,8 @@
 import uuid
+from datetime import datetime
 
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Numeric, String, func
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -28,10 +29,18 @@ class ApiUsage(Base):
     model_name: Mapped[str | None] = mapped_column(String(50))
     tokens_in: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     tokens_out: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    cache_read_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    cache_write_tokens: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     cost_cents: Mapped[float] = mapped_column(Numeric(10, 4), default=0, server_default="0")
     endpoint: Mapped[str | None] = mapped_column(String(200))
+    cached: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
+    # Partition key, so part of the primary key (see app.services.partitions)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     __table_args__ = (
         Index("idx_api_usage_org_date", "organization_id", "created_at"),
         Index("idx_api_usage_service", "service", "created_at"),
+        # Append-only time series: a tiny BRIN index serves the rollup's date-range scans
+        Index("idx_api_usage_created_brin", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
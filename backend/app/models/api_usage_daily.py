@@ -0,0 +1,42 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import ApiService
+
+
+class ApiUsageDaily(Base):
+    """Per-day usage totals, compacted from ``api_usage`` by the usage rollup job."""
+
+    __tablename__ = "api_usage_daily"
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    service: Mapped[str] = mapped_column(
+        SAEnum(
+            ApiService, values_callable=lambda x: [e.value for e in x],
+            name="api_service", create_constraint=False, native_enum=True, create_type=False,
+        ),
+        nullable=False,
+    )
+    # '' stands in for NULL so the columns can be part of the unique key
+    model_name: Mapped[str] = mapped_column(String(50), nullable=False, server_default="")
+    endpoint: Mapped[str] = mapped_column(String(200), nullable=False, server_default="")
+    calls: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    tokens_in: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    tokens_out: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    cache_read_tokens: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    cache_write_tokens: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    cost_cents: Mapped[float] = mapped_column(Numeric(14, 4), default=0, server_default="0")
+
+    __table_args__ = (
+        UniqueConstraint("organization_id", "day", "service", "model_name", "endpoint"),
+        Index("idx_api_usage_daily_day", "day"),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -33,12 +33,12 @@ class AxiomChallenge(Base):
         ),
     )
     resolution_text: Mapped[str | None] = mapped_column(Text)
-    agent_session_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("agent_sessions.id")
-    )
+    # No foreign key: agent_sessions is partitioned (its key includes created_at) and
+    # old partitions are archived, so this is a soft reference
+    agent_session_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     __table_args__ = (
-        Index("idx_axiom_challenges_perspective", "perspective_id"),
+        Index("idx_axiom_challenges_perspective_created", "perspective_id", text("created_at DESC"), text("id DESC")),
         Index("idx_axiom_challenges_unresolved", "perspective_id", postgresql_where="resolution IS NULL"),
     )
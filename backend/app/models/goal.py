@@ -1,7 +1,7 @@
 import uuid
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,5 +30,5 @@ class Goal(Base):
     )
 
     __table_args__ = (
-        Index("idx_goals_organization", "organization_id"),
+        Index("idx_goals_organization_created", "organization_id", text("created_at DESC"), text("id DESC")),
     )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, Numeric, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -28,11 +28,15 @@ class Journey(Base):
         server_default="active",
     )
     perspectives_completed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
-    total_cost_cents: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Exact, so agent-session costs can be added as they are recorded
+    total_cost_cents: Mapped[float] = mapped_column(Numeric(14, 4), default=0, server_default="0")
+    # Totals of agent sessions whose partitions were archived (see app.services.partitions)
+    archived_cost_cents: Mapped[float] = mapped_column(Numeric(14, 4), default=0, server_default="0")
+    archived_sessions: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     __table_args__ = (
         CheckConstraint("perspectives_completed BETWEEN 0 AND 12", name="perspectives_completed_range"),
-        Index("idx_journeys_organization", "organization_id"),
+        Index("idx_journeys_organization_created", "organization_id", text("created_at DESC"), text("id DESC")),
         Index("idx_journeys_status", "organization_id", "status"),
     )
@@ -0,0 +1,24 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class OrganizationStats(Base):
+    """Running dashboard totals for an organization, updated as the underlying rows are written."""
+
+    __tablename__ = "organization_stats"
+
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    total_journeys: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    active_journeys: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    completed_journeys: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_vdbas: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_vibes: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_emails: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_cost_cents: Mapped[float] = mapped_column(Numeric(14, 4), default=0, server_default="0")
@@ -0,0 +1,13 @@
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class Prompt(Base):
+    """A prompt recorded once and referenced from agent-session payloads by its SHA-256."""
+
+    __tablename__ = "prompts"
+
+    hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -29,6 +29,6 @@ class Vdba(Base):
 
     __table_args__ = (
         CheckConstraint("export_format IN ('pdf', 'docx', 'json')", name="export_format_check"),
-        Index("idx_vdbas_organization", "organization_id"),
+        Index("idx_vdbas_organization_published", "organization_id", text("published_at DESC"), text("id DESC")),
         Index("idx_vdbas_journey", "journey_id"),
     )
@@ -16,9 +16,9 @@ class VibeAnalysis(Base):
     agent_name: Mapped[str] = mapped_column(String(50), nullable=False)
     analysis_type: Mapped[str] = mapped_column(String(50), default="post_vibe", server_default="post_vibe")
     content: Mapped[dict] = mapped_column(JSONB, default=dict, server_default="{}")
-    agent_session_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("agent_sessions.id")
-    )
+    # No foreign key: agent_sessions is partitioned (its key includes created_at) and
+    # old partitions are archived, so this is a soft reference
+    agent_session_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
 
     # vibe_analyses only has created_at in DDL, but Base adds updated_at — acceptable
 
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric, String, Text
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -31,5 +31,6 @@ class VibeSession(Base):
             "status IN ('transcribing', 'analyzing', 'complete', 'failed')",
             name="vibe_status_check",
         ),
-        Index("idx_vibe_sessions_perspective", "perspective_id"),
+        # Newest-first keyset pages (vibe.list_vibe_sessions)
+        Index("idx_vibe_sessions_perspective_created", "perspective_id", text("created_at DESC"), text("id DESC")),
     )
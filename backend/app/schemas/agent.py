@@ -31,6 +31,18 @@ class BoomerangRequest(BaseModel):
     prompt: str = Field("", max_length=50000)
 
 
+class BoomerangRunResponse(BaseModel):
+    id: uuid.UUID
+    perspective_id: uuid.UUID
+    status: str
+    error: str | None = None
+    specialists_completed: list[str] = []
+    challenges_total: int | None = None
+    verdicts_completed: int = 0
+    created_at: datetime
+    completed_at: datetime | None = None
+
+
 class AxiomChallengeResponse(BaseModel):
     id: uuid.UUID
     challenge_text: str
@@ -50,8 +62,22 @@ class AgentSessionResponse(BaseModel):
     model_used: str
     input_tokens: int
     output_tokens: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     cost_cents: float
     duration_ms: int | None = None
+    ttft_ms: int | None = None
+    inter_token_p50_ms: float | None = None
+    inter_token_p95_ms: float | None = None
+    inter_token_p99_ms: float | None = None
+    output_tokens_per_second: float | None = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class AgentSessionDetailResponse(AgentSessionResponse):
+    """An agent session with its payloads; stored prompts are expanded back into ``request_payload``."""
+
+    request_payload: dict
+    response_payload: dict
@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 
 from pydantic import BaseModel
 
@@ -23,3 +24,31 @@ class DashboardStats(BaseModel):
     total_vibes: int
     total_emails: int
     recent_vdbas: list[VdbaListItem]
+
+
+class LatencyPercentiles(BaseModel):
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+
+
+class LatencyGroup(BaseModel):
+    """Latency of the agent sessions for one agent, model and intersection."""
+
+    agent_name: str
+    model: str
+    dimension: str
+    phase: str
+    sessions: int
+    streamed_sessions: int
+    duration_ms: LatencyPercentiles
+    ttft_ms: LatencyPercentiles
+    # Across sessions: p50 of their median gaps, p95 of their p95 gaps, p99 of their p99 gaps
+    inter_token_ms: LatencyPercentiles
+    output_tokens_per_second: LatencyPercentiles
+
+
+class LatencyReport(BaseModel):
+    start: datetime
+    end: datetime
+    groups: list[LatencyGroup]
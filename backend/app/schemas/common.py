@@ -1,14 +1,48 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
+from app.core.errors import ValidationError
+
+# How a paginated list reports its total: an exact COUNT(*), the planner's row
+# estimate (no scan), or not at all
+CountMode = Literal["exact", "estimated", "none"]
+
 
 class PaginationMeta(BaseModel):
-    page: int
+    """Pagination details of a list response.
+
+    ``page`` is set for page-numbered requests and None when the page was
+    requested by ``cursor``. ``total``/``total_pages`` are None when no count was
+    asked for, and approximate when ``total_estimated`` is set. ``next_cursor``
+    fetches the page after this one; it is None on the last page.
+    """
+
+    page: int | None = None
     per_page: int
-    total: int
-    total_pages: int
+    total: int | None = None
+    total_pages: int | None = None
+    total_estimated: bool = False
+    next_cursor: str | None = None
 
 
 class ResponseEnvelope[T](BaseModel):
     status: str = "success"
     data: T
     meta: dict = {}
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Opaque cursor for the row at ``(sort_value, row_id)`` in a newest-first list."""
+    return base64.urlsafe_b64encode(f"{sort_value.isoformat()}|{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(sort_value), uuid.UUID(row_id)
+    except ValueError as exc:
+        raise ValidationError("Invalid cursor") from exc
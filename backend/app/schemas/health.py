@@ -11,3 +11,18 @@ class HealthResponse(BaseModel):
     checks: dict[str, ServiceCheck]
     version: str
     uptime_seconds: float
+
+
+class PoolStatsResponse(BaseModel):
+    """Database pool of the process that served the request."""
+
+    pid: int
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.schemas.common import PaginationMeta
 from app.schemas.perspective import PerspectiveResponse
@@ -23,6 +23,12 @@ class JourneyResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @field_validator("total_cost_cents", mode="before")
+    @classmethod
+    def round_cost(cls, v: object) -> int:
+        # Stored to a fraction of a cent; reported in whole cents
+        return round(v)  # type: ignore[call-overload]
+
 
 class JourneyDetailResponse(JourneyResponse):
     perspectives: list[PerspectiveResponse] = []
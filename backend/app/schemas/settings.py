@@ -11,6 +11,7 @@ ALLOWED_SETTINGS = {
     "export_format": str,
     "monthly_budget_cents": int,
     "budget_alert_thresholds": list,
+    "llm_response_cache": bool,
 }
 
 VALID_MODELS = ["claude-haiku-4-5-20251001", "claude-sonnet-4-5-20250929"]
@@ -21,7 +22,7 @@ VALID_VOICE_PROVIDERS = ["whisper", "deepgram", "assemblyai"]
 
 class SettingUpdate(BaseModel):
     key: str = Field(min_length=1, max_length=100)
-    value: str | int | list = Field()
+    value: str | bool | int | list = Field()
 
 
 class SettingsResponse(BaseModel):
@@ -33,6 +34,7 @@ class SettingsResponse(BaseModel):
     export_format: str = "pdf"
     monthly_budget_cents: int = 0
     budget_alert_thresholds: list[int] = [50, 80, 100]
+    llm_response_cache: bool = True
 
 
 class DailyUsage(BaseModel):
@@ -47,6 +49,9 @@ class UsageSummaryResponse(BaseModel):
     total_tokens_in: int
     total_tokens_out: int
     total_calls: int
+    total_cache_read_tokens: int = 0
+    total_cache_write_tokens: int = 0
+    cache_savings_cents: float = 0.0
     by_date: list[DailyUsage]
 
 
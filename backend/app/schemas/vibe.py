@@ -13,6 +13,7 @@ class VibeUploadResponse(BaseModel):
     duration_seconds: int
     status: str
     created_at: datetime
+    job_id: str | None = None
 
     model_config = {"from_attributes": True}
 
@@ -44,3 +45,4 @@ class VibeDetailResponse(BaseModel):
 
 class VibeListResponse(BaseModel):
     vibe_sessions: list[VibeSessionResponse]
+    next_cursor: str | None = None
@@ -0,0 +1,50 @@
+"""Queries over recorded agent sessions."""
+
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent_session import AgentSession
+
+
+def latest_per_agent_query(
+    perspective_id: uuid.UUID,
+    *columns,
+    agent_names: Iterable[str] | None = None,
+) -> Select:
+    """Select ``columns`` (default: whole rows) of each agent's most recent session on a perspective.
+
+    One ``DISTINCT ON (agent_name)`` query, read in order from the
+    (perspective_id, agent_name, created_at DESC) index.
+    """
+    query = (
+        select(*(columns or (AgentSession,)))
+        .where(AgentSession.perspective_id == perspective_id)
+        .distinct(AgentSession.agent_name)
+        .order_by(AgentSession.agent_name, AgentSession.created_at.desc())
+    )
+    if agent_names is not None:
+        query = query.where(AgentSession.agent_name.in_(list(agent_names)))
+    return query
+
+
+async def latest_agent_outputs(
+    db: AsyncSession,
+    perspective_id: uuid.UUID,
+    agent_names: Iterable[str] | None = None,
+) -> dict[str, str]:
+    """Map agent name -> response content of its latest session, for agents whose latest output is non-empty.
+
+    Only the ``content`` key is read from ``response_payload``, not the whole row.
+    """
+    result = await db.execute(
+        latest_per_agent_query(
+            perspective_id,
+            AgentSession.agent_name,
+            AgentSession.response_payload["content"].astext,
+            agent_names=agent_names,
+        )
+    )
+    return {name: content for name, content in result.all() if content}
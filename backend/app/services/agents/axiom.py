@@ -2,26 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.sse import sse_event
+from app.core.tracing import span
 from app.models.agent_session import AgentSession
 from app.models.axiom_challenge import AxiomChallenge
 from app.services.agents.base import (
-    COST_PER_INPUT_TOKEN,
-    COST_PER_OUTPUT_TOKEN,
+    AGENT_REGISTRY,
     AgentContext,
     BaseAgent,
     FatalAgentError,
-    record_api_usage,
+    persist_rows,
+    record_chat_usage,
 )
+from app.services.agents.checkpoint import BoomerangCheckpoint
+from app.services.agents.prompt_store import stored_prompt
 from app.services.agents.prompts import (
     build_axiom_challenge_prompt,
     build_axiom_verdict_prompt,
@@ -30,6 +36,8 @@ from app.services.agents.prompts import (
 
 logger = logging.getLogger(__name__)
 
+_DEBATE_DONE = object()
+
 
 @dataclass
 class Challenge:
@@ -49,7 +57,7 @@ class AxiomChallenger:
     """Manages the Axiom bounded debate flow: challenge -> response -> verdict."""
 
     def __init__(self):
-        self._axiom = BaseAgent("axiom")
+        self._axiom = AGENT_REGISTRY["axiom"]
 
     async def challenge(
         self,
@@ -61,59 +69,58 @@ class AxiomChallenger:
 
         Returns (challenges, raw_response) tuple.
         """
-        prompt = build_axiom_challenge_prompt(specialist_outputs)
-        system = build_system_prompt("axiom", context.dimension, context.phase)
-
-        start = time.monotonic()
-        # Axiom reviews all 8 specialist outputs — needs more tokens than default
-        content, input_tokens, output_tokens = await self._axiom.raw_chat(
-            prompt, system, max_tokens=8192,
-        )
-        duration_ms = int((time.monotonic() - start) * 1000)
-
-        cost_cents = (
-            input_tokens * COST_PER_INPUT_TOKEN + output_tokens * COST_PER_OUTPUT_TOKEN
-        ) * 100
-
-        # Save Axiom session
-        session = AgentSession(
-            perspective_id=context.perspective_id,
-            agent_name="axiom",
-            model_used=settings.default_agent_model,
-            system_prompt_version="v1",
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_cents=round(cost_cents, 4),
-            request_payload={"type": "challenge", "prompt": prompt},
-            response_payload={"content": content},
-            duration_ms=duration_ms,
-        )
-        db.add(session)
-        await db.flush()
-
-        # Record API usage
-        await record_api_usage(
-            db, context, "axiom", settings.default_agent_model,
-            input_tokens, output_tokens, endpoint="boomerang/axiom/challenge",
-        )
-
-        # Parse challenges from JSON response
-        challenges = _parse_challenges(content)
+        with span("axiom.challenge", {"incube.specialists": len(specialist_outputs)}) as current:
+            prompt = build_axiom_challenge_prompt(specialist_outputs)
+            system = build_system_prompt("axiom", context.dimension, context.phase)
+
+            start = time.monotonic()
+            # Axiom reviews all 8 specialist outputs — needs more tokens than default
+            result = await self._axiom.raw_chat(
+                prompt, system, max_tokens=8192,
+                organization_id=context.organization_id, use_cache=context.response_cache,
+            )
+            content = result.content
+            duration_ms = int((time.monotonic() - start) * 1000)
 
-        # Persist challenges in DB
-        for ch in challenges:
-            record = AxiomChallenge(
+            # Save Axiom session
+            stored = stored_prompt(prompt)
+            session = AgentSession(
                 perspective_id=context.perspective_id,
-                challenge_text=ch.challenge_text,
-                severity=ch.severity,
-                targeted_agents=ch.targeted_agents,
-                evidence_needed=ch.evidence_needed,
-                agent_session_id=session.id,
+                agent_name="axiom",
+                model_used=settings.default_agent_model,
+                system_prompt_version="v1",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                cache_read_tokens=result.cache_read_tokens,
+                cache_write_tokens=result.cache_write_tokens,
+                cost_cents=round(result.cost_cents, 4),
+                request_payload={"type": "challenge", "prompt_ref": stored.hash},
+                response_payload={"content": content},
+                duration_ms=duration_ms,
             )
-            db.add(record)
-        await db.flush()
+            await persist_rows(db, context, stored, session)
+
+            # Record API usage
+            await record_chat_usage(db, context, "axiom", result, endpoint="boomerang/axiom/challenge")
+
+            # Parse challenges from JSON response
+            challenges = _parse_challenges(content)
+            current.set_attribute("incube.challenges", len(challenges))
+
+            # Persist challenges in DB
+            await persist_rows(db, context, *(
+                AxiomChallenge(
+                    perspective_id=context.perspective_id,
+                    challenge_text=ch.challenge_text,
+                    severity=ch.severity,
+                    targeted_agents=ch.targeted_agents,
+                    evidence_needed=ch.evidence_needed,
+                    agent_session_id=session.id,
+                )
+                for ch in challenges
+            ))
 
-        return challenges, content
+            return challenges, content
 
     async def get_agent_response(
         self,
@@ -121,6 +128,8 @@ class AxiomChallenger:
         challenge_text: str,
         context: AgentContext,
         db: AsyncSession,
+        *,
+        db_lock: asyncio.Lock | None = None,
     ) -> tuple[str, uuid.UUID]:
         """Have a specialist agent respond to a challenge. Returns (response_text, session_id)."""
         system = build_system_prompt(agent.name, context.dimension, context.phase)
@@ -131,33 +140,33 @@ class AxiomChallenger:
         )
 
         start = time.monotonic()
-        content, input_tokens, output_tokens = await agent.raw_chat(prompt, system)
+        result = await agent.raw_chat(
+            prompt, system, organization_id=context.organization_id, use_cache=context.response_cache,
+        )
+        content = result.content
         duration_ms = int((time.monotonic() - start) * 1000)
 
-        cost_cents = (
-            input_tokens * COST_PER_INPUT_TOKEN + output_tokens * COST_PER_OUTPUT_TOKEN
-        ) * 100
-
-        session = AgentSession(
-            perspective_id=context.perspective_id,
-            agent_name=agent.name,
-            model_used=settings.default_agent_model,
-            system_prompt_version="v1",
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_cents=round(cost_cents, 4),
-            request_payload={"type": "challenge_response", "challenge": challenge_text},
-            response_payload={"content": content},
-            duration_ms=duration_ms,
-        )
-        db.add(session)
-        await db.flush()
+        async with db_lock or contextlib.nullcontext():
+            session = AgentSession(
+                perspective_id=context.perspective_id,
+                agent_name=agent.name,
+                model_used=settings.default_agent_model,
+                system_prompt_version="v1",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                cache_read_tokens=result.cache_read_tokens,
+                cache_write_tokens=result.cache_write_tokens,
+                cost_cents=round(result.cost_cents, 4),
+                request_payload={"type": "challenge_response", "challenge": challenge_text},
+                response_payload={"content": content},
+                duration_ms=duration_ms,
+            )
+            await persist_rows(db, context, session)
 
-        # Record API usage
-        await record_api_usage(
-            db, context, agent.name, settings.default_agent_model,
-            input_tokens, output_tokens, endpoint=f"boomerang/challenge_response/{agent.name}",
-        )
+            # Record API usage
+            await record_chat_usage(
+                db, context, agent.name, result, endpoint=f"boomerang/challenge_response/{agent.name}",
+            )
 
         return content, session.id
 
@@ -167,39 +176,39 @@ class AxiomChallenger:
         responses: dict[str, str],
         context: AgentContext,
         db: AsyncSession,
+        *,
+        db_lock: asyncio.Lock | None = None,
     ) -> Verdict:
         """Axiom evaluates agent responses to a challenge and returns a verdict."""
         prompt = build_axiom_verdict_prompt(challenge.challenge_text, responses)
         system = build_system_prompt("axiom", context.dimension, context.phase)
 
         start = time.monotonic()
-        content, input_tokens, output_tokens = await self._axiom.raw_chat(prompt, system)
+        result = await self._axiom.raw_chat(
+            prompt, system, organization_id=context.organization_id, use_cache=context.response_cache,
+        )
+        content = result.content
         duration_ms = int((time.monotonic() - start) * 1000)
 
-        cost_cents = (
-            input_tokens * COST_PER_INPUT_TOKEN + output_tokens * COST_PER_OUTPUT_TOKEN
-        ) * 100
-
-        session = AgentSession(
-            perspective_id=context.perspective_id,
-            agent_name="axiom",
-            model_used=settings.default_agent_model,
-            system_prompt_version="v1",
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_cents=round(cost_cents, 4),
-            request_payload={"type": "verdict", "challenge": challenge.challenge_text},
-            response_payload={"content": content},
-            duration_ms=duration_ms,
-        )
-        db.add(session)
-        await db.flush()
+        async with db_lock or contextlib.nullcontext():
+            session = AgentSession(
+                perspective_id=context.perspective_id,
+                agent_name="axiom",
+                model_used=settings.default_agent_model,
+                system_prompt_version="v1",
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                cache_read_tokens=result.cache_read_tokens,
+                cache_write_tokens=result.cache_write_tokens,
+                cost_cents=round(result.cost_cents, 4),
+                request_payload={"type": "verdict", "challenge": challenge.challenge_text},
+                response_payload={"content": content},
+                duration_ms=duration_ms,
+            )
+            await persist_rows(db, context, session)
 
-        # Record API usage
-        await record_api_usage(
-            db, context, "axiom", settings.default_agent_model,
-            input_tokens, output_tokens, endpoint="boomerang/axiom/verdict",
-        )
+            # Record API usage
+            await record_chat_usage(db, context, "axiom", result, endpoint="boomerang/axiom/verdict")
 
         return _parse_verdict(content)
 
@@ -208,11 +217,21 @@ class AxiomChallenger:
         specialist_outputs: dict[str, str],
         context: AgentContext,
         db: AsyncSession,
+        checkpoint: BoomerangCheckpoint | None = None,
     ):
         """Stream the full Axiom challenge flow as SSE events.
 
-        Yields SSE events for challenge, responses, and verdicts.
+        Yields SSE events for challenge, responses, and verdicts. Challenges are debated
+        concurrently (bounded by ``axiom_challenge_concurrency``) and each response or
+        verdict is streamed as soon as it is ready. Steps already in ``checkpoint`` are
+        reused without calling the LLM or re-emitting their events.
         """
+        if checkpoint is not None and checkpoint.challenges is not None:
+            challenges = [Challenge(**ch) for ch in checkpoint.challenges]
+            async for event in self._stream_debates(challenges, context, db, checkpoint):
+                yield event
+            return
+
         # Step 1: Axiom produces challenges
         try:
             challenges, _raw = await self.challenge(specialist_outputs, context, db)
@@ -237,80 +256,160 @@ class AxiomChallenger:
             })
             return
 
-        for ch in challenges:
+        if context.telemetry is not None:
+            await context.telemetry.checkpoint()
+        if checkpoint is not None:
+            await checkpoint.record_challenges([asdict(ch) for ch in challenges])
+
+        for index, ch in enumerate(challenges):
             yield sse_event("axiom_challenge", {
+                "challenge_index": index,
                 "challenge_text": ch.challenge_text,
                 "severity": ch.severity,
                 "targeted_agents": ch.targeted_agents,
                 "evidence_needed": ch.evidence_needed,
             })
 
-            # Step 2: Targeted agents respond (max 3 LLM calls total per challenge)
-            responses: dict[str, str] = {}
-            from app.services.agents.base import AGENT_REGISTRY
-
-            for agent_name in ch.targeted_agents:
-                if agent_name in AGENT_REGISTRY and agent_name != "axiom":
-                    agent = AGENT_REGISTRY[agent_name]
-                    try:
-                        response_text, _session_id = await self.get_agent_response(
-                            agent, ch.challenge_text, context, db,
-                        )
-                    except FatalAgentError as exc:
-                        logger.error("Agent %s hit fatal error during challenge response: %s", agent_name, exc)
-                        yield sse_event("agent_error", {
-                            "agent": agent_name,
-                            "error": str(exc),
-                            "error_type": exc.error_type,
-                        })
-                        yield sse_event("boomerang_error", {
-                            "error": str(exc),
-                            "error_type": exc.error_type,
-                        })
-                        return
-                    except Exception as exc:
-                        logger.exception("Agent %s failed to respond to challenge", agent_name)
-                        yield sse_event("agent_error", {
-                            "agent": agent_name,
-                            "error": f"Failed to respond to challenge: {exc}",
-                            "error_type": "unknown",
-                        })
-                        continue
-                    responses[agent_name] = response_text
-                    yield sse_event("challenge_response", {
-                        "agent": agent_name,
-                        "challenge_text": ch.challenge_text,
-                        "response": response_text,
+        async for event in self._stream_debates(challenges, context, db, checkpoint):
+            yield event
+
+    async def _stream_debates(
+        self,
+        challenges: list[Challenge],
+        context: AgentContext,
+        db: AsyncSession,
+        checkpoint: BoomerangCheckpoint | None,
+    ):
+        """Run the debates for ``challenges`` concurrently, yielding events as they finish."""
+        # Steps 2-3 run as concurrent debates. Events are funnelled through a queue so they
+        # stream in completion order; writes to the shared session are serialized by db_lock.
+        events: asyncio.Queue = asyncio.Queue()
+        db_lock = asyncio.Lock()
+        limit = asyncio.Semaphore(max(1, settings.axiom_challenge_concurrency))
+
+        async def run_debate(index: int, ch: Challenge) -> None:
+            try:
+                async with limit:
+                    await self._debate(index, ch, context, db, db_lock, events.put_nowait, checkpoint)
+            except FatalAgentError as exc:
+                events.put_nowait(exc)
+            except Exception:
+                logger.exception("Debate for challenge %d failed", index)
+            finally:
+                events.put_nowait(_DEBATE_DONE)
+
+        tasks = [
+            asyncio.create_task(run_debate(i, ch))
+            for i, ch in enumerate(challenges)
+            if checkpoint is None or i not in checkpoint.verdicts
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await events.get()
+                if item is _DEBATE_DONE:
+                    remaining -= 1
+                elif isinstance(item, FatalAgentError):
+                    yield sse_event("boomerang_error", {
+                        "error": str(item),
+                        "error_type": item.error_type,
                     })
+                    return
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _debate(
+        self,
+        index: int,
+        ch: Challenge,
+        context: AgentContext,
+        db: AsyncSession,
+        db_lock: asyncio.Lock,
+        emit: Callable[[str], None],
+        checkpoint: BoomerangCheckpoint | None = None,
+    ) -> None:
+        """Run one challenge: targeted agents respond concurrently, then Axiom rules.
+
+        A FatalAgentError is re-raised after its agent_error event is emitted so the
+        caller can abort the whole debate. So is a CheckpointError from saving a
+        response or verdict, which has no agent_error event of its own.
+        """
+        targets = [name for name in ch.targeted_agents if name in AGENT_REGISTRY and name != "axiom"]
+        with span("axiom.debate", {"incube.challenge_index": index, "incube.targets": len(targets)}):
+            responses: dict[str, str] = dict(checkpoint.responses.get(index, {})) if checkpoint else {}
+
+            async def respond(agent_name: str) -> None:
+                try:
+                    response_text, _session_id = await self.get_agent_response(
+                        AGENT_REGISTRY[agent_name], ch.challenge_text, context, db, db_lock=db_lock,
+                    )
+                except FatalAgentError as exc:
+                    logger.error("Agent %s hit fatal error during challenge response: %s", agent_name, exc)
+                    emit(sse_event("agent_error", {
+                        "agent": agent_name,
+                        "error": str(exc),
+                        "error_type": exc.error_type,
+                    }))
+                    raise
+                except Exception as exc:
+                    logger.exception("Agent %s failed to respond to challenge", agent_name)
+                    emit(sse_event("agent_error", {
+                        "agent": agent_name,
+                        "error": f"Failed to respond to challenge: {exc}",
+                        "error_type": "unknown",
+                    }))
+                    return
+                responses[agent_name] = response_text
+                if checkpoint is not None:
+                    await checkpoint.record_response(index, agent_name, response_text)
+                emit(sse_event("challenge_response", {
+                    "challenge_index": index,
+                    "agent": agent_name,
+                    "challenge_text": ch.challenge_text,
+                    "response": response_text,
+                }))
 
-            # Step 3: Axiom evaluates
+            # Step 2: Targeted agents respond (max 3 LLM calls total per challenge)
             try:
-                verdict = await self.evaluate(ch, responses, context, db)
+                async with asyncio.TaskGroup() as tg:
+                    for agent_name in targets:
+                        if agent_name not in responses:
+                            tg.create_task(respond(agent_name))
+            except* FatalAgentError as group:
+                raise group.exceptions[0] from None
+
+            # Step 3: Axiom evaluates, seeing responses in the order the agents were targeted
+            ordered = {name: responses[name] for name in targets if name in responses}
+            try:
+                verdict = await self.evaluate(ch, ordered, context, db, db_lock=db_lock)
             except FatalAgentError as exc:
                 logger.error("Axiom verdict hit fatal error: %s", exc)
-                yield sse_event("agent_error", {
+                emit(sse_event("agent_error", {
                     "agent": "axiom",
                     "error": str(exc),
                     "error_type": exc.error_type,
-                })
-                yield sse_event("boomerang_error", {
-                    "error": str(exc),
-                    "error_type": exc.error_type,
-                })
-                return
+                }))
+                raise
             except Exception as exc:
                 logger.exception("Axiom verdict evaluation failed")
-                yield sse_event("agent_error", {
+                emit(sse_event("agent_error", {
                     "agent": "axiom",
                     "error": f"Failed to evaluate challenge responses: {exc}",
                     "error_type": "unknown",
-                })
-                continue
-            yield sse_event("axiom_verdict", {
+                }))
+                return
+            if checkpoint is not None:
+                await checkpoint.record_verdict(index, asdict(verdict))
+            emit(sse_event("axiom_verdict", {
+                "challenge_index": index,
                 "challenge_text": ch.challenge_text,
                 "resolution": verdict.resolution,
                 "resolution_text": verdict.resolution_text,
-            })
+            }))
 
 
 def _parse_challenges(content: str) -> list[Challenge]:
@@ -6,16 +6,29 @@ import logging
 import time
 import uuid
 from collections.abc import AsyncGenerator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import anthropic
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import record_llm_call
 from app.core.sse import sse_event
+from app.core.tracing import span, start_span, use_span
 from app.models.agent_session import AgentSession
 from app.models.api_usage import ApiUsage
+from app.models.prompt import Prompt
+from app.services.agents.cache import response_cache, response_cache_key
+from app.services.agents.client import get_anthropic_client, llm_slot
+from app.services.agents.latency import StreamTiming
+from app.services.agents.prompt_store import store_prompts, stored_prompt
 from app.services.agents.prompts import AGENT_DEFINITIONS, build_system_prompt
+from app.services.dashboard_stats import record_agent_costs
+
+if TYPE_CHECKING:
+    from app.db.base import Base
+    from app.services.agents.telemetry import TelemetryBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +79,43 @@ class FatalAgentError(Exception):
 # Haiku pricing: input $0.25/MTok, output $1.25/MTok (in dollars)
 COST_PER_INPUT_TOKEN = 0.25 / 1_000_000   # dollars per token
 COST_PER_OUTPUT_TOKEN = 1.25 / 1_000_000   # dollars per token
+# Prompt caching: cache reads bill at 10% of the input rate, cache writes at 125%
+COST_PER_CACHE_READ_TOKEN = COST_PER_INPUT_TOKEN * 0.1
+COST_PER_CACHE_WRITE_TOKEN = COST_PER_INPUT_TOKEN * 1.25
+
+
+def token_cost_cents(
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
+    """Cost of one call in cents. ``input_tokens`` excludes cached tokens, as the API reports it."""
+    return (
+        input_tokens * COST_PER_INPUT_TOKEN
+        + output_tokens * COST_PER_OUTPUT_TOKEN
+        + cache_read_tokens * COST_PER_CACHE_READ_TOKEN
+        + cache_write_tokens * COST_PER_CACHE_WRITE_TOKEN
+    ) * 100
+
+
+def cache_savings_cents(cache_read_tokens: int, cache_write_tokens: int) -> float:
+    """Net saving from prompt caching versus sending the same tokens uncached, in cents."""
+    return (
+        cache_read_tokens * (COST_PER_INPUT_TOKEN - COST_PER_CACHE_READ_TOKEN)
+        - cache_write_tokens * (COST_PER_CACHE_WRITE_TOKEN - COST_PER_INPUT_TOKEN)
+    ) * 100
+
+
+def cacheable_system(system_prompt: str) -> str | list[dict]:
+    """Mark a system prompt as a provider-side prompt-cache prefix (when enabled).
+
+    System prompts are static per agent and intersection, so repeated calls read
+    them from the cache instead of paying for them as fresh input.
+    """
+    if not settings.llm_prompt_caching:
+        return system_prompt
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
 
 
 @dataclass
@@ -78,6 +128,41 @@ class AgentContext:
     goal_statement: str | None = None
     organization_id: uuid.UUID | None = None
     user_id: uuid.UUID | None = None
+    response_cache: bool = True
+    telemetry: TelemetryBuffer | None = field(default=None, repr=False)
+
+
+@dataclass
+class ChatResult:
+    """Result of a non-streaming agent call. Response-cache hits report zero tokens."""
+
+    content: str
+    input_tokens: int
+    output_tokens: int
+    cached: bool = False
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def cost_cents(self) -> float:
+        return token_cost_cents(
+            self.input_tokens, self.output_tokens, self.cache_read_tokens, self.cache_write_tokens,
+        )
+
+
+async def persist_rows(db: AsyncSession, context: AgentContext, *rows: Base) -> None:
+    """Save telemetry rows through the context's write-behind buffer, or directly if it has none.
+
+    Buffered rows get their id on the spot, so callers can reference them immediately.
+    """
+    if context.telemetry is not None:
+        context.telemetry.add(*rows)
+        return
+    with span("db.flush", {"incube.rows": len(rows)}):
+        await store_prompts(db, [row for row in rows if isinstance(row, Prompt)])
+        db.add_all([row for row in rows if not isinstance(row, Prompt)])
+        await db.flush()
+        await record_agent_costs(db, [(r.perspective_id, r.cost_cents) for r in rows if isinstance(r, AgentSession)])
 
 
 async def record_api_usage(
@@ -88,13 +173,19 @@ async def record_api_usage(
     tokens_in: int,
     tokens_out: int,
     endpoint: str,
+    *,
+    cached: bool = False,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> None:
-    """Insert an ApiUsage record for billing/usage tracking."""
+    """Insert an ApiUsage record for billing/usage tracking.
+
+    Responses served from the response cache are recorded with ``cached=True`` at zero cost.
+    Prompt-cache reads and writes are billed at their own rates.
+    """
     if not context.organization_id or not context.user_id:
         return
-    cost_cents = (
-        tokens_in * COST_PER_INPUT_TOKEN + tokens_out * COST_PER_OUTPUT_TOKEN
-    ) * 100
+    cost_cents = 0.0 if cached else token_cost_cents(tokens_in, tokens_out, cache_read_tokens, cache_write_tokens)
     usage = ApiUsage(
         organization_id=context.organization_id,
         user_id=context.user_id,
@@ -104,9 +195,43 @@ async def record_api_usage(
         tokens_out=tokens_out,
         cost_cents=round(cost_cents, 4),
         endpoint=endpoint,
+        cached=cached,
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
     )
-    db.add(usage)
-    await db.flush()
+    await persist_rows(db, context, usage)
+
+
+async def record_chat_usage(
+    db: AsyncSession,
+    context: AgentContext,
+    agent_name: str,
+    result: ChatResult,
+    endpoint: str,
+) -> None:
+    """Record API usage for a ``raw_chat`` result, including its cache flags and prompt-cache tokens."""
+    await record_api_usage(
+        db, context, agent_name, settings.default_agent_model,
+        result.input_tokens, result.output_tokens, endpoint=endpoint, cached=result.cached,
+        cache_read_tokens=result.cache_read_tokens, cache_write_tokens=result.cache_write_tokens,
+    )
+
+
+def _usage_attributes(
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int,
+    cache_write_tokens: int,
+    stop_reason: str | None,
+) -> dict:
+    """Span attributes for an agent call's token usage (OpenTelemetry GenAI conventions where they exist)."""
+    return {
+        "gen_ai.usage.input_tokens": input_tokens,
+        "gen_ai.usage.output_tokens": output_tokens,
+        "incube.cache_read_tokens": cache_read_tokens,
+        "incube.cache_write_tokens": cache_write_tokens,
+        "gen_ai.response.finish_reasons": [stop_reason or "unknown"],
+    }
 
 
 class BaseAgent:
@@ -119,7 +244,10 @@ class BaseAgent:
         self.name = name
         self.role = role
         self.color = color
-        self._client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+
+    @property
+    def _client(self) -> anthropic.AsyncAnthropic:
+        return get_anthropic_client()
 
     async def chat(
         self,
@@ -130,108 +258,189 @@ class BaseAgent:
         """Stream a response from the Claude API, yielding SSE-formatted events."""
         system_prompt = build_system_prompt(self.name, context.dimension, context.phase)
         model = settings.default_agent_model
+        # Started rather than entered: it stays open across the yields below
+        current = start_span("llm.chat", {
+            "incube.agent": self.name,
+            "gen_ai.system": "anthropic",
+            "gen_ai.request.model": model,
+        })
+        try:
+            timing = StreamTiming()
+            full_response = ""
+            input_tokens = 0
+            output_tokens = 0
+            cache_read_tokens = 0
+            cache_write_tokens = 0
+
+            try:
+                async with llm_slot(context.organization_id), self._client.messages.stream(
+                    model=model,
+                    max_tokens=4096,
+                    system=cacheable_system(system_prompt),
+                    messages=[{"role": "user", "content": message}],
+                ) as stream:
+                    async for text in stream.text_stream:
+                        timing.token()
+                        full_response += text
+                        yield sse_event("token", {"agent": self.name, "content": text})
+
+                    response = await stream.get_final_message()
+                    input_tokens = response.usage.input_tokens
+                    output_tokens = response.usage.output_tokens
+                    cache_read_tokens = response.usage.cache_read_input_tokens or 0
+                    cache_write_tokens = response.usage.cache_creation_input_tokens or 0
+
+            except anthropic.APIError as exc:
+                record_llm_call(self.name, model, "stream", time.monotonic() - timing.start, error=True)
+                error_type = classify_api_error(exc)
+                logger.error("Anthropic API error for agent %s (%s): %s", self.name, error_type, exc)
+                yield sse_event("agent_error", {
+                    "agent": self.name,
+                    "error": str(exc),
+                    "error_type": error_type,
+                })
+                return
+
+            elapsed = time.monotonic() - timing.start
+            latency = timing.session_fields(output_tokens)
+            record_llm_call(
+                self.name, model, "stream", elapsed,
+                input_tokens=input_tokens, output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens, cache_write_tokens=cache_write_tokens,
+                ttft=timing.ttft,
+            )
+            current.set_attributes(_usage_attributes(
+                input_tokens, output_tokens, cache_read_tokens, cache_write_tokens, response.stop_reason,
+            ))
+            if latency["ttft_ms"] is not None:
+                current.set_attribute("incube.ttft_ms", latency["ttft_ms"])
+            duration_ms = int(elapsed * 1000)
+            cost_cents = token_cost_cents(input_tokens, output_tokens, cache_read_tokens, cache_write_tokens)
+
+            system = stored_prompt(system_prompt)
+            session = AgentSession(
+                perspective_id=context.perspective_id,
+                agent_name=self.name,
+                model_used=model,
+                system_prompt_version="v1",
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
+                cost_cents=round(cost_cents, 4),
+                request_payload={"message": message, "system_ref": system.hash},
+                response_payload={"content": full_response},
+                duration_ms=duration_ms,
+                **latency,
+            )
+            with use_span(current):
+                await persist_rows(db, context, system, session)
 
-        start = time.monotonic()
-        full_response = ""
-        input_tokens = 0
-        output_tokens = 0
+                # Record API usage for billing tracking
+                await record_api_usage(
+                    db, context, self.name, model, input_tokens, output_tokens,
+                    endpoint=f"chat/{self.name}",
+                    cache_read_tokens=cache_read_tokens, cache_write_tokens=cache_write_tokens,
+                )
 
-        try:
-            async with self._client.messages.stream(
-                model=model,
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{"role": "user", "content": message}],
-            ) as stream:
-                async for text in stream.text_stream:
-                    full_response += text
-                    yield sse_event("token", {"agent": self.name, "content": text})
-
-                response = await stream.get_final_message()
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-
-        except anthropic.APIError as exc:
-            error_type = classify_api_error(exc)
-            logger.error("Anthropic API error for agent %s (%s): %s", self.name, error_type, exc)
-            yield sse_event("agent_error", {
+            yield sse_event("done", {
                 "agent": self.name,
-                "error": str(exc),
-                "error_type": error_type,
+                "session_id": str(session.id),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_tokens": cache_read_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "cost_cents": round(cost_cents, 4),
+                "duration_ms": duration_ms,
+                "ttft_ms": latency["ttft_ms"],
+                "output_tokens_per_second": latency["output_tokens_per_second"],
             })
-            return
-
-        duration_ms = int((time.monotonic() - start) * 1000)
-        cost_cents = (
-            input_tokens * COST_PER_INPUT_TOKEN + output_tokens * COST_PER_OUTPUT_TOKEN
-        ) * 100  # convert dollars to cents
-
-        session = AgentSession(
-            perspective_id=context.perspective_id,
-            agent_name=self.name,
-            model_used=model,
-            system_prompt_version="v1",
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_cents=round(cost_cents, 4),
-            request_payload={"message": message, "system": system_prompt},
-            response_payload={"content": full_response},
-            duration_ms=duration_ms,
-        )
-        db.add(session)
-        await db.flush()
-
-        # Record API usage for billing tracking
-        await record_api_usage(
-            db, context, self.name, model, input_tokens, output_tokens,
-            endpoint=f"chat/{self.name}",
-        )
-
-        yield sse_event("done", {
-            "agent": self.name,
-            "session_id": str(session.id),
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "cost_cents": round(cost_cents, 4),
-            "duration_ms": duration_ms,
-        })
+        finally:
+            current.end()
 
     async def raw_chat(
-        self, message: str, system_prompt: str, *, max_tokens: int = 4096,
-    ) -> tuple[str, int, int]:
-        """Non-streaming chat that returns (content, input_tokens, output_tokens).
+        self,
+        message: str,
+        system_prompt: str,
+        *,
+        max_tokens: int = 4096,
+        organization_id: uuid.UUID | None = None,
+        use_cache: bool = True,
+    ) -> ChatResult:
+        """Non-streaming chat returning the response content and token usage.
 
         Used internally by the orchestrator and Axiom for structured responses.
+        ``organization_id`` selects the per-org concurrency slot. When the response
+        cache is enabled and ``use_cache`` is set, identical calls are served from cache.
         """
         model = settings.default_agent_model
-        logger.info("raw_chat [%s] calling model=%s prompt_len=%d max_tokens=%d",
-                     self.name, model, len(message), max_tokens)
-
-        try:
-            response = await self._client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[{"role": "user", "content": message}],
+        with span("llm.raw_chat", {
+            "incube.agent": self.name,
+            "gen_ai.system": "anthropic",
+            "gen_ai.request.model": model,
+            "gen_ai.request.max_tokens": max_tokens,
+        }) as current:
+            cache_key: str | None = None
+            if use_cache and response_cache.enabled:
+                cache_key = response_cache_key(model, system_prompt, message, max_tokens)
+                cached_content = await response_cache.get(cache_key)
+                if cached_content is not None:
+                    logger.info("raw_chat [%s] cache hit key=%s", self.name, cache_key[:12])
+                    current.set_attribute("incube.cached", True)
+                    return ChatResult(content=cached_content, input_tokens=0, output_tokens=0, cached=True)
+
+            logger.info("raw_chat [%s] calling model=%s prompt_len=%d max_tokens=%d",
+                         self.name, model, len(message), max_tokens)
+
+            start = time.monotonic()
+            try:
+                async with llm_slot(organization_id):
+                    response = await self._client.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        system=cacheable_system(system_prompt),
+                        messages=[{"role": "user", "content": message}],
+                    )
+            except anthropic.APIError as exc:
+                record_llm_call(self.name, model, "raw", time.monotonic() - start, error=True)
+                error_type = classify_api_error(exc)
+                logger.error("raw_chat [%s] Anthropic API error (%s): %s %s",
+                             self.name, error_type, type(exc).__name__, exc)
+                if is_fatal_api_error(exc):
+                    raise FatalAgentError(str(exc), error_type=error_type, original=exc) from exc
+                raise
+            except Exception as exc:
+                record_llm_call(self.name, model, "raw", time.monotonic() - start, error=True)
+                logger.error("raw_chat [%s] unexpected error: %s %s", self.name, type(exc).__name__, exc)
+                raise
+
+            content = response.content[0].text if response.content else ""
+            usage = response.usage
+            cache_read_tokens = usage.cache_read_input_tokens or 0
+            cache_write_tokens = usage.cache_creation_input_tokens or 0
+            record_llm_call(
+                self.name, model, "raw", time.monotonic() - start,
+                input_tokens=usage.input_tokens, output_tokens=usage.output_tokens,
+                cache_read_tokens=cache_read_tokens, cache_write_tokens=cache_write_tokens,
+            )
+            current.set_attributes(_usage_attributes(
+                usage.input_tokens, usage.output_tokens, cache_read_tokens, cache_write_tokens, response.stop_reason,
+            ))
+            logger.info(
+                "raw_chat [%s] success: in=%d out=%d cache_read=%d cache_write=%d content_len=%d stop=%s",
+                self.name, usage.input_tokens, usage.output_tokens, cache_read_tokens, cache_write_tokens,
+                len(content), response.stop_reason,
+            )
+            # Truncated responses are not cached so a retry with more tokens isn't short-circuited
+            if cache_key and content and response.stop_reason != "max_tokens":
+                await response_cache.set(cache_key, content)
+            return ChatResult(
+                content=content,
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
             )
-        except anthropic.APIError as exc:
-            error_type = classify_api_error(exc)
-            logger.error("raw_chat [%s] Anthropic API error (%s): %s %s",
-                         self.name, error_type, type(exc).__name__, exc)
-            if is_fatal_api_error(exc):
-                raise FatalAgentError(str(exc), error_type=error_type, original=exc) from exc
-            raise
-        except Exception as exc:
-            logger.error("raw_chat [%s] unexpected error: %s %s", self.name, type(exc).__name__, exc)
-            raise
-
-        content = response.content[0].text if response.content else ""
-        logger.info(
-            "raw_chat [%s] success: in=%d out=%d content_len=%d stop=%s",
-            self.name, response.usage.input_tokens, response.usage.output_tokens,
-            len(content), response.stop_reason,
-        )
-        return content, response.usage.input_tokens, response.usage.output_tokens
 
 
 # Registry of all 9 agents
@@ -0,0 +1,111 @@
+"""Content-addressed cache for deterministic raw_chat responses.
+
+Entries are keyed by a hash of (model, system prompt, message, max_tokens). Lookups
+go to a bounded in-process LRU first, then Redis. Both tiers expire entries after
+``llm_cache_ttl_seconds``. The cache is off unless ``llm_cache_enabled`` is set, and
+organizations can opt out with the ``llm_response_cache`` setting.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.lru import MemoryLRU
+from app.core.redis import get_redis
+from app.services import settings as settings_service
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "incube:llm_cache:"
+ORG_SETTING_KEY = "llm_response_cache"
+
+
+def response_cache_key(model: str, system_prompt: str, message: str, max_tokens: int) -> str:
+    """Hash the inputs that fully determine a raw_chat response."""
+    raw = json.dumps([model, system_prompt, message, max_tokens], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.redis_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Two-tier (memory + Redis) response cache. Redis errors degrade to a miss."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._memory = MemoryLRU(max_entries, max_bytes)
+
+    @property
+    def enabled(self) -> bool:
+        return settings.llm_cache_enabled
+
+    async def get(self, key: str) -> str | None:
+        value = self._memory.get(key)
+        if value is not None:
+            self.stats.memory_hits += 1
+            return value
+
+        try:
+            value = await get_redis().get(REDIS_KEY_PREFIX + key)
+        except Exception as exc:
+            self.stats.errors += 1
+            logger.warning("LLM cache Redis lookup failed: %s", exc)
+            value = None
+
+        if value is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.redis_hits += 1
+        self._memory.set(key, value, self.ttl_seconds)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._memory.set(key, value, self.ttl_seconds)
+        self.stats.stores += 1
+        try:
+            await get_redis().set(REDIS_KEY_PREFIX + key, value, ex=self.ttl_seconds)
+        except Exception as exc:
+            self.stats.errors += 1
+            logger.warning("LLM cache Redis store failed: %s", exc)
+
+
+response_cache = ResponseCache(
+    max_entries=settings.llm_cache_memory_max_entries,
+    max_bytes=settings.llm_cache_memory_max_bytes,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+)
+
+
+async def org_cache_enabled(db: AsyncSession, org_id: uuid.UUID | None) -> bool:
+    """Whether raw_chat responses may be served from cache for this organization."""
+    if not settings.llm_cache_enabled:
+        return False
+    if org_id is None:
+        return True
+    value = await settings_service.get_setting_value(db, org_id, ORG_SETTING_KEY, default=True)
+    return bool(value)
@@ -0,0 +1,90 @@
+"""Resumable progress for a boomerang run.
+
+The orchestrator and Axiom record each finished step here: a specialist's output,
+the generated challenges, each challenge response and each verdict. When a run is
+restarted with a loaded checkpoint, those steps are reused instead of calling the
+LLM again. Every change is passed to ``on_save`` as a JSON-safe snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from app.services.agents.base import FatalAgentError
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointError(FatalAgentError):
+    """Raised when a checkpoint snapshot could not be saved.
+
+    Fatal to the run: its steps could no longer be resumed, so agents already
+    handling ``FatalAgentError`` abort the run with a ``boomerang_error`` event.
+    """
+
+    def __init__(self, original: Exception):
+        super().__init__(f"Could not save the run's progress: {original}", "checkpoint", original)
+
+
+@dataclass
+class BoomerangCheckpoint:
+    specialists: dict[str, str] = field(default_factory=dict)
+    challenges: list[dict] | None = None
+    responses: dict[int, dict[str, str]] = field(default_factory=dict)
+    verdicts: dict[int, dict] = field(default_factory=dict)
+    on_save: Callable[[dict], Awaitable[None]] | None = field(default=None, repr=False, compare=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict | None,
+        on_save: Callable[[dict], Awaitable[None]] | None = None,
+    ) -> BoomerangCheckpoint:
+        data = data or {}
+        return cls(
+            specialists=dict(data.get("specialists", {})),
+            challenges=data.get("challenges"),
+            responses={int(k): dict(v) for k, v in data.get("responses", {}).items()},
+            verdicts={int(k): dict(v) for k, v in data.get("verdicts", {}).items()},
+            on_save=on_save,
+        )
+
+    def to_dict(self) -> dict:
+        # JSON object keys must be strings
+        return {
+            "specialists": dict(self.specialists),
+            "challenges": self.challenges,
+            "responses": {str(k): dict(v) for k, v in self.responses.items()},
+            "verdicts": {str(k): dict(v) for k, v in self.verdicts.items()},
+        }
+
+    async def record_specialist(self, agent_name: str, content: str) -> None:
+        self.specialists[agent_name] = content
+        await self._save()
+
+    async def record_challenges(self, challenges: list[dict]) -> None:
+        self.challenges = challenges
+        await self._save()
+
+    async def record_response(self, index: int, agent_name: str, content: str) -> None:
+        self.responses.setdefault(index, {})[agent_name] = content
+        await self._save()
+
+    async def record_verdict(self, index: int, verdict: dict) -> None:
+        self.verdicts[index] = verdict
+        await self._save()
+
+    async def _save(self) -> None:
+        if self.on_save is None:
+            return
+        # Snapshot under the lock so concurrent debates never overwrite a newer state
+        async with self._lock:
+            try:
+                await self.on_save(self.to_dict())
+            except Exception as exc:
+                logger.exception("Saving the boomerang checkpoint failed")
+                raise CheckpointError(exc) from exc
@@ -0,0 +1,108 @@
+"""Process-wide Anthropic client and LLM concurrency governor.
+
+All agent calls share one ``AsyncAnthropic`` instance backed by a tuned, keep-alive
+HTTP connection pool. ``llm_slot`` caps in-flight LLM requests per worker process
+and per organization, so a burst of boomerang runs queues up instead of firing
+every call at once and tripping rate limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anthropic
+import httpx
+
+from app.core.config import settings
+
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    """Return the shared Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.anthropic_max_connections,
+                max_keepalive_connections=settings.anthropic_max_keepalive_connections,
+                keepalive_expiry=settings.anthropic_keepalive_expiry_seconds,
+            ),
+            timeout=httpx.Timeout(settings.anthropic_timeout_seconds, connect=10.0),
+        )
+        _client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key, http_client=http_client)
+    return _client
+
+
+async def close_anthropic_client() -> None:
+    """Close the shared client's connection pool (called on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+class ConcurrencyGovernor:
+    """Caps concurrent in-flight LLM calls globally and per organization.
+
+    The per-org slot is taken first so an org that is queued behind its own cap
+    does not hold a global slot other orgs could use.
+    """
+
+    def __init__(self, max_concurrency: int, max_per_org: int):
+        self.max_concurrency = max_concurrency
+        self.max_per_org = max_per_org
+        self._global = asyncio.Semaphore(max_concurrency)
+        # Only orgs with calls in flight or queued: each semaphore with the number
+        # of callers holding or waiting on it, dropped when that falls to zero
+        self._per_org: dict[uuid.UUID, tuple[asyncio.Semaphore, int]] = {}
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _checkout_org(self, organization_id: uuid.UUID) -> asyncio.Semaphore:
+        sem, users = self._per_org.get(organization_id) or (asyncio.Semaphore(self.max_per_org), 0)
+        self._per_org[organization_id] = (sem, users + 1)
+        return sem
+
+    def _checkin_org(self, organization_id: uuid.UUID) -> None:
+        sem, users = self._per_org[organization_id]
+        if users == 1:
+            del self._per_org[organization_id]
+        else:
+            self._per_org[organization_id] = (sem, users - 1)
+
+    @asynccontextmanager
+    async def _global_slot(self) -> AsyncIterator[None]:
+        async with self._global:
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self, organization_id: uuid.UUID | None = None) -> AsyncIterator[None]:
+        if organization_id is None:
+            async with self._global_slot():
+                yield
+            return
+        org_sem = self._checkout_org(organization_id)
+        try:
+            async with org_sem, self._global_slot():
+                yield
+        finally:
+            self._checkin_org(organization_id)
+
+
+governor = ConcurrencyGovernor(settings.llm_max_concurrency, settings.llm_max_concurrency_per_org)
+
+
+def llm_slot(organization_id: uuid.UUID | None = None):
+    """Async context manager that holds an LLM concurrency slot for the duration of a call."""
+    return governor.slot(organization_id)
@@ -0,0 +1,67 @@
+"""Latency of streamed agent responses: time to first token, inter-token gaps, throughput.
+
+The Anthropic stream yields text deltas, usually a few tokens each, so the
+"inter-token" gaps are the gaps between deltas as the client sees them.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+
+def percentile(values: Sequence[float], fraction: float) -> float | None:
+    """The ``fraction`` percentile of ``values``, interpolated like Postgres' ``percentile_cont``."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _ms(value: float | None) -> float | None:
+    return None if value is None else round(value * 1000, 1)
+
+
+@dataclass
+class StreamTiming:
+    """Clock for one streamed response: call ``token()`` as each text delta arrives."""
+
+    start: float = field(default_factory=time.monotonic)
+    first_token: float | None = None
+    last_token: float | None = None
+    gaps: list[float] = field(default_factory=list)
+
+    def token(self) -> None:
+        now = time.monotonic()
+        if self.first_token is None:
+            self.first_token = now
+        else:
+            self.gaps.append(now - self.last_token)
+        self.last_token = now
+
+    @property
+    def ttft(self) -> float | None:
+        """Seconds from the request to the first text delta."""
+        return None if self.first_token is None else self.first_token - self.start
+
+    def tokens_per_second(self, output_tokens: int) -> float | None:
+        """Output throughput while generating, from the first delta to the last."""
+        if self.first_token is None or self.last_token is None or self.last_token <= self.first_token:
+            return None
+        return round(output_tokens / (self.last_token - self.first_token), 2)
+
+    def session_fields(self, output_tokens: int) -> dict:
+        """The latency columns of the ``AgentSession`` for this response."""
+        ttft = self.ttft
+        return {
+            "ttft_ms": None if ttft is None else round(ttft * 1000),
+            "inter_token_p50_ms": _ms(percentile(self.gaps, 0.5)),
+            "inter_token_p95_ms": _ms(percentile(self.gaps, 0.95)),
+            "inter_token_p99_ms": _ms(percentile(self.gaps, 0.99)),
+            "output_tokens_per_second": self.tokens_per_second(output_tokens),
+        }
@@ -8,18 +8,18 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings as app_settings
 from app.core.sse import sse_event
+from app.core.tracing import iterate_in_span, start_span, use_span
 from app.services.agents.axiom import AxiomChallenger
 from app.services.agents.base import (
     AGENT_REGISTRY,
-    COST_PER_INPUT_TOKEN,
-    COST_PER_OUTPUT_TOKEN,
     AgentContext,
     BaseAgent,
+    ChatResult,
     FatalAgentError,
-    record_api_usage,
+    record_chat_usage,
 )
+from app.services.agents.checkpoint import BoomerangCheckpoint, CheckpointError
 from app.services.agents.prompts import VALID_AGENT_NAMES, build_system_prompt
 
 logger = logging.getLogger(__name__)
@@ -38,93 +38,115 @@ class BoomerangOrchestrator:
         context: AgentContext,
         prompt: str,
         db: AsyncSession,
+        checkpoint: BoomerangCheckpoint | None = None,
     ) -> AsyncGenerator[str, None]:
-        """Run all 9 agents through the boomerang flow, yielding SSE events."""
+        """Run all 9 agents through the boomerang flow, yielding SSE events.
+
+        With a ``checkpoint``, each finished step is recorded as it completes, and
+        steps it already holds (from an earlier attempt) are skipped.
+        """
         yield sse_event("boomerang_start", {"perspective_id": str(context.perspective_id)})
 
         # Phase 1: Run 8 specialist agents in parallel, stream results as they arrive
         yield sse_event("phase", {"phase": "specialists", "message": "Running specialist agents..."})
-        specialist_outputs: dict[str, str] = {}
+        specialist_outputs: dict[str, str] = dict(checkpoint.specialists) if checkpoint else {}
+        pending = [name for name in SPECIALIST_AGENTS if name not in specialist_outputs]
 
-        async def run_specialist(agent: BaseAgent) -> tuple[str, str, int, int]:
+        async def run_specialist(agent: BaseAgent) -> tuple[str, ChatResult]:
             system = build_system_prompt(agent.name, context.dimension, context.phase)
-            content, in_tok, out_tok = await agent.raw_chat(prompt, system)
-            return agent.name, content, in_tok, out_tok
-
-        # Notify start of each agent
-        for name in SPECIALIST_AGENTS:
-            yield sse_event("agent_start", {"agent": name})
-
-        # Use as_completed so we yield agent_complete events as each finishes
-        # instead of waiting for all 8 to complete before sending any events
-        tasks = {
-            asyncio.ensure_future(run_specialist(AGENT_REGISTRY[name])): name
-            for name in SPECIALIST_AGENTS
-        }
-
-        fatal_error: FatalAgentError | None = None
-
-        for coro in asyncio.as_completed(list(tasks.keys())):
-            try:
-                name, content, in_tok, out_tok = await coro
-            except FatalAgentError as exc:
-                # Fatal error — cancel all pending tasks and abort immediately
-                failed_name = "unknown"
-                for task, task_name in tasks.items():
-                    if task.done():
-                        try:
-                            task.exception()
-                        except BaseException:
-                            if task_name != "unknown":
-                                failed_name = task_name
-                                break
-                logger.error("Fatal API error from %s: %s", failed_name, exc)
-                yield sse_event("agent_error", {
-                    "agent": failed_name,
-                    "error": str(exc),
-                    "error_type": exc.error_type,
-                })
-                fatal_error = exc
-                # Cancel all still-pending tasks
-                for task in tasks:
-                    if not task.done():
-                        task.cancel()
-                break
-            except Exception as exc:
-                # Find which agent failed
-                failed_name = "unknown"
-                for task, task_name in tasks.items():
-                    if task.done() and task.exception() is exc:
-                        failed_name = task_name
-                        break
-                logger.error("Specialist agent %s failed: %s", failed_name, exc)
-                yield sse_event("agent_error", {
-                    "agent": failed_name,
-                    "error": str(exc),
-                    "error_type": "unknown",
-                })
-                continue
-
-            specialist_outputs[name] = content
-
-            # Record API usage for this specialist call
-            await record_api_usage(
-                db, context, name, app_settings.default_agent_model,
-                in_tok, out_tok, endpoint=f"boomerang/specialist/{name}",
+            result = await agent.raw_chat(
+                prompt, system, organization_id=context.organization_id, use_cache=context.response_cache,
             )
+            return agent.name, result
 
-            cost_usd = in_tok * COST_PER_INPUT_TOKEN + out_tok * COST_PER_OUTPUT_TOKEN
-            yield sse_event("agent_complete", {
-                "agent": name,
-                "content": content,
-                "input_tokens": in_tok,
-                "output_tokens": out_tok,
-                "cost_usd": round(cost_usd, 6),
-            })
-            yield sse_event("phase", {
-                "phase": "specialists",
-                "message": f"{len(specialist_outputs)}/{len(SPECIALIST_AGENTS)} specialists complete...",
-            })
+        # Phase spans are started rather than entered: they stay open across yields
+        specialists_span = start_span("boomerang.specialists", {"incube.agents": len(pending)})
+        try:
+            # Notify start of each agent
+            for name in pending:
+                yield sse_event("agent_start", {"agent": name})
+
+            # Use as_completed so we yield agent_complete events as each finishes
+            # instead of waiting for all 8 to complete before sending any events
+            with use_span(specialists_span):
+                tasks = {
+                    asyncio.ensure_future(run_specialist(AGENT_REGISTRY[name])): name
+                    for name in pending
+                }
+
+            fatal_error: FatalAgentError | None = None
+
+            for coro in asyncio.as_completed(list(tasks.keys())):
+                try:
+                    name, result = await coro
+                except FatalAgentError as exc:
+                    # Fatal error — cancel all pending tasks and abort immediately
+                    failed_name = "unknown"
+                    for task, task_name in tasks.items():
+                        if task.done():
+                            try:
+                                task.exception()
+                            except BaseException:
+                                if task_name != "unknown":
+                                    failed_name = task_name
+                                    break
+                    logger.error("Fatal API error from %s: %s", failed_name, exc)
+                    yield sse_event("agent_error", {
+                        "agent": failed_name,
+                        "error": str(exc),
+                        "error_type": exc.error_type,
+                    })
+                    fatal_error = exc
+                    # Cancel all still-pending tasks
+                    for task in tasks:
+                        if not task.done():
+                            task.cancel()
+                    break
+                except Exception as exc:
+                    # Find which agent failed
+                    failed_name = "unknown"
+                    for task, task_name in tasks.items():
+                        if task.done() and task.exception() is exc:
+                            failed_name = task_name
+                            break
+                    logger.error("Specialist agent %s failed: %s", failed_name, exc)
+                    yield sse_event("agent_error", {
+                        "agent": failed_name,
+                        "error": str(exc),
+                        "error_type": "unknown",
+                    })
+                    continue
+
+                # Record API usage for this specialist call, before the checkpoint marks it done
+                await record_chat_usage(db, context, name, result, endpoint=f"boomerang/specialist/{name}")
+
+                specialist_outputs[name] = result.content
+                if checkpoint is not None:
+                    try:
+                        await checkpoint.record_specialist(name, result.content)
+                    except CheckpointError as exc:
+                        fatal_error = exc
+                        for task in tasks:
+                            if not task.done():
+                                task.cancel()
+                        break
+
+                yield sse_event("agent_complete", {
+                    "agent": name,
+                    "content": result.content,
+                    "input_tokens": result.input_tokens,
+                    "output_tokens": result.output_tokens,
+                    "cache_read_tokens": result.cache_read_tokens,
+                    "cache_write_tokens": result.cache_write_tokens,
+                    "cost_usd": round(result.cost_cents / 100, 6),
+                    "cached": result.cached,
+                })
+                yield sse_event("phase", {
+                    "phase": "specialists",
+                    "message": f"{len(specialist_outputs)}/{len(SPECIALIST_AGENTS)} specialists complete...",
+                })
+        finally:
+            specialists_span.end()
 
         # If a fatal error occurred, abort the entire flow
         if fatal_error is not None:
@@ -148,14 +170,21 @@ class BoomerangOrchestrator:
             yield sse_event("error", {"error": "All specialist agents failed"})
             return
 
+        # Phase boundary: write the specialists' usage rows before the Axiom phase starts
+        if context.telemetry is not None:
+            await context.telemetry.checkpoint()
+
         # Phase 2: Axiom challenge flow
         logger.info("Specialists complete (%d/%d). Starting Axiom challenge phase.",
                      len(specialist_outputs), len(SPECIALIST_AGENTS))
         yield sse_event("phase", {"phase": "axiom", "message": "Axiom is reviewing specialist outputs..."})
         yield sse_event("axiom_start", {"agent": "axiom"})
 
+        axiom_span = start_span("boomerang.axiom", {"incube.specialists": len(specialist_outputs)})
         try:
-            async for event in self._challenger.stream_challenge(specialist_outputs, context, db):
+            async for event in iterate_in_span(axiom_span, self._challenger.stream_challenge(
+                specialist_outputs, context, db, checkpoint=checkpoint,
+            )):
                 yield event
         except FatalAgentError as exc:
             logger.error("Axiom phase hit fatal error: %s", exc)
@@ -175,6 +204,8 @@ class BoomerangOrchestrator:
                 "error": f"Axiom challenge phase failed: {exc}",
                 "error_type": "unknown",
             })
+        finally:
+            axiom_span.end()
 
         logger.info("Axiom phase complete. Emitting boomerang_complete.")
         yield sse_event("boomerang_complete", {
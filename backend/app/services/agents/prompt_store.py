@@ -0,0 +1,71 @@
+"""Content-addressed store for the prompts recorded with agent sessions.
+
+System prompts repeat across thousands of ``AgentSession`` rows, so instead of
+embedding them in ``request_payload`` a session stores ``<key>_ref`` (the
+prompt's SHA-256) and the text lives once in ``prompts``. ``Prompt`` rows travel
+through ``persist_rows`` with the sessions that reference them and are inserted
+idempotently, so a reference is only ever committed together with its prompt.
+"""
+
+import hashlib
+import uuid
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent_session import AgentSession
+from app.models.prompt import Prompt
+
+REF_SUFFIX = "_ref"
+
+
+def prompt_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def stored_prompt(text: str) -> Prompt:
+    """A ``Prompt`` row for ``text``; put ``.hash`` in the payload and persist the row alongside the session."""
+    return Prompt(hash=prompt_hash(text), content=text)
+
+
+async def store_prompts(db: AsyncSession, prompts: Iterable[Prompt]) -> None:
+    """Insert prompts that are not stored yet. Existing ones (same hash) are left alone."""
+    by_hash = {prompt.hash: prompt for prompt in prompts}
+    if not by_hash:
+        return
+    # Sorted so concurrent writers take the unique-index locks in the same order
+    values = [
+        {"id": by_hash[key].id or uuid.uuid4(), "hash": key, "content": by_hash[key].content}
+        for key in sorted(by_hash)
+    ]
+    await db.execute(pg_insert(Prompt).values(values).on_conflict_do_nothing(index_elements=["hash"]))
+
+
+def _refs(payload: dict) -> dict[str, str]:
+    return {
+        key.removesuffix(REF_SUFFIX): value
+        for key, value in (payload or {}).items()
+        if key.endswith(REF_SUFFIX) and isinstance(value, str)
+    }
+
+
+def expand_payload(payload: dict, texts: dict[str, str]) -> dict:
+    """``payload`` with each ``<key>_ref`` replaced by ``<key>`` and the stored text (when known)."""
+    expanded = dict(payload or {})
+    for key, ref in _refs(payload).items():
+        if ref in texts:
+            del expanded[key + REF_SUFFIX]
+            expanded[key] = texts[ref]
+    return expanded
+
+
+async def expand_request_payloads(db: AsyncSession, sessions: Sequence[AgentSession]) -> list[dict]:
+    """The sessions' request payloads with their prompts filled back in, using one lookup."""
+    refs = {ref for session in sessions for ref in _refs(session.request_payload).values()}
+    texts: dict[str, str] = {}
+    if refs:
+        result = await db.execute(select(Prompt.hash, Prompt.content).where(Prompt.hash.in_(refs)))
+        texts = dict(result.all())
+    return [expand_payload(session.request_payload, texts) for session in sessions]
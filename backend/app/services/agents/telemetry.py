@@ -0,0 +1,230 @@
+"""Write-behind buffer for per-call agent telemetry.
+
+A boomerang run produces dozens of ``AgentSession``/``ApiUsage`` rows (plus the
+``AxiomChallenge`` rows that reference them). Instead of a flush per LLM call,
+rows are collected in a ``TelemetryBuffer`` and written in batches, one
+multi-row INSERT per table, on a timer, at phase boundaries and when the
+buffer is closed. Each batch is committed in its own short unit of work.
+
+Billing rows are never dropped: a batch that cannot be written is kept for the
+next attempt, and if the final flush still fails it is handed to the job queue
+(``telemetry.replay``), which re-inserts it idempotently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import DateTime, inspect
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.core.tracing import span
+from app.db.base import Base
+from app.db.session import unit_of_work
+from app.models.agent_session import AgentSession
+from app.models.api_usage import ApiUsage
+from app.models.axiom_challenge import AxiomChallenge
+from app.models.prompt import Prompt
+from app.services.agents.prompt_store import store_prompts
+from app.services.dashboard_stats import record_agent_costs
+from app.services.jobs import enqueue, register_job
+
+logger = logging.getLogger(__name__)
+
+REPLAY_JOB = "telemetry.replay"
+FINAL_FLUSH_ATTEMPTS = 3
+
+# Insert order respects foreign keys: challenges and usage rows may reference sessions
+_FLUSH_ORDER: tuple[type[Base], ...] = (AgentSession, ApiUsage, AxiomChallenge)
+
+
+class TelemetryBuffer:
+    """Collects telemetry rows and writes them in batches.
+
+    Use as an async context manager around a stream; leaving the block (normally,
+    on error or on cancellation) performs the final flush.
+    """
+
+    def __init__(self, flush_interval: float | None = None, max_rows: int | None = None):
+        self.flush_interval = flush_interval or settings.telemetry_flush_interval_seconds
+        self.max_rows = max_rows or settings.telemetry_flush_max_rows
+        self._pending: list[Base] = []
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._timer: asyncio.Task | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def __aenter__(self) -> TelemetryBuffer:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Shield so a cancelled stream still gets its rows written
+        await asyncio.shield(self.aclose())
+
+    def add(self, *rows: Base) -> None:
+        """Queue rows for writing. Ids and timestamps are assigned now, not at flush time."""
+        if self._closed:
+            raise RuntimeError("TelemetryBuffer is closed")
+        now = datetime.now(UTC)
+        for row in rows:
+            if row.id is None:
+                row.id = uuid.uuid4()
+            if row.created_at is None:
+                row.created_at = now
+            self._pending.append(row)
+        self._ensure_timer()
+        if len(self._pending) >= self.max_rows:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Write all pending rows. Returns the number written; on failure the rows stay queued."""
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                with span("telemetry.flush", {"incube.rows": len(batch)}):
+                    async with unit_of_work() as db:
+                        # Prompts are shared between sessions and may already be stored
+                        await store_prompts(db, [row for row in batch if type(row) is Prompt])
+                        for model in _FLUSH_ORDER:
+                            rows = [row for row in batch if type(row) is model]
+                            if rows:
+                                db.add_all(rows)
+                                await db.flush()
+                        await record_agent_costs(
+                            db, [(row.perspective_id, row.cost_cents) for row in batch if type(row) is AgentSession],
+                        )
+            except Exception:
+                self._pending = batch + self._pending
+                raise
+            return len(batch)
+
+    async def checkpoint(self) -> None:
+        """Flush at a phase boundary. Failures are logged and the rows retried later."""
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning("Telemetry checkpoint flush failed; rows kept for retry", exc_info=True)
+
+    async def aclose(self) -> None:
+        """Stop the timer and write everything that is left."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+
+        for attempt in range(1, FINAL_FLUSH_ATTEMPTS + 1):
+            try:
+                await self.flush()
+                return
+            except Exception:
+                logger.warning("Telemetry flush attempt %d/%d failed", attempt, FINAL_FLUSH_ATTEMPTS, exc_info=True)
+                await asyncio.sleep(0.5 * attempt)
+
+        await _dead_letter(self._pending)
+        self._pending = []
+
+    def _ensure_timer(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def _run_timer(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            await self.checkpoint()
+
+
+def serialize_rows(rows: list[Base]) -> list[dict]:
+    """Convert ORM rows into JSON-safe ``{"table", "values"}`` records."""
+    records = []
+    for row in rows:
+        values = {}
+        for attr in inspect(type(row)).column_attrs:
+            value = getattr(row, attr.key)
+            if value is None:
+                continue
+            if isinstance(value, uuid.UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, Decimal):
+                value = float(value)
+            values[attr.key] = value
+        records.append({"table": type(row).__tablename__, "values": values})
+    return records
+
+
+def _deserialize_values(model: type[Base], values: dict) -> dict:
+    columns = model.__table__.c
+    restored = {}
+    for key, value in values.items():
+        column_type = columns[key].type
+        if isinstance(column_type, UUID):
+            value = uuid.UUID(value)
+        elif isinstance(column_type, DateTime):
+            value = datetime.fromisoformat(value)
+        restored[key] = value
+    return restored
+
+
+async def _dead_letter(rows: list[Base]) -> None:
+    if not rows:
+        return
+    records = serialize_rows(rows)
+    try:
+        job_id = await enqueue(REPLAY_JOB, {"rows": records})
+        logger.error("Telemetry flush failed; %d rows handed to replay job %s", len(records), job_id)
+    except Exception:
+        # Last resort: the rows are in the log and can be replayed by hand
+        logger.critical("Telemetry rows could not be written or queued: %s", records)
+
+
+@register_job(REPLAY_JOB)
+async def replay_rows(payload: dict) -> None:
+    """Insert dead-lettered telemetry rows, skipping any that already made it in."""
+    by_table: dict[str, list[dict]] = {}
+    for record in payload["rows"]:
+        by_table.setdefault(record["table"], []).append(record["values"])
+
+    async with unit_of_work() as db:
+        await store_prompts(db, [
+            Prompt(**_deserialize_values(Prompt, values)) for values in by_table.get(Prompt.__tablename__, [])
+        ])
+        inserted_costs = []
+        for model in _FLUSH_ORDER:
+            # A multi-row VALUES clause needs the same columns in every row
+            by_columns: dict[frozenset[str], list[dict]] = {}
+            for row in by_table.get(model.__tablename__, []):
+                by_columns.setdefault(frozenset(row), []).append(_deserialize_values(model, row))
+            for values in by_columns.values():
+                # Rows always carry created_at (TelemetryBuffer.add), the partition key that
+                # is part of the partitioned tables' primary keys
+                conflict_key = [column.name for column in model.__table__.primary_key]
+                stmt = pg_insert(model).values(values).on_conflict_do_nothing(index_elements=conflict_key)
+                if model is AgentSession:
+                    # Only rows actually inserted here count towards the cost totals
+                    result = await db.execute(stmt.returning(AgentSession.perspective_id, AgentSession.cost_cents))
+                    inserted_costs.extend(result.all())
+                else:
+                    await db.execute(stmt)
+        await record_agent_costs(db, inserted_costs)
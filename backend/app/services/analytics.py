@@ -1,18 +1,18 @@
 import uuid
+from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError
 from app.models.agent_session import AgentSession
-from app.models.email_log import EmailLog
-from app.models.enums import JourneyStatus, PerspectiveStatus
+from app.models.enums import PerspectiveStatus
 from app.models.journey import Journey
 from app.models.perspective import Perspective
 from app.models.vdba import Vdba
-from app.models.vibe_session import VibeSession
-from app.schemas.analytics import DashboardStats, JourneyAnalytics
+from app.schemas.analytics import DashboardStats, JourneyAnalytics, LatencyGroup, LatencyPercentiles, LatencyReport
 from app.schemas.vdba import VdbaListItem
+from app.services import dashboard_stats
 
 
 async def get_journey_analytics(
@@ -40,7 +40,8 @@ async def get_journey_analytics(
     )
     perspectives_completed = completed_result.scalar_one()
 
-    # Sum costs from agent sessions via perspectives
+    # Sum costs from agent sessions via perspectives, plus those already archived.
+    # Sessions are never older than their journey, so earlier partitions are pruned.
     cost_result = await db.execute(
         select(
             func.coalesce(func.sum(AgentSession.cost_cents), 0),
@@ -48,11 +49,11 @@ async def get_journey_analytics(
         )
         .select_from(AgentSession)
         .join(Perspective, AgentSession.perspective_id == Perspective.id)
-        .where(Perspective.journey_id == journey_id)
+        .where(Perspective.journey_id == journey_id, AgentSession.created_at >= journey.created_at)
     )
     row = cost_result.one()
-    total_cost_cents = int(row[0])
-    agent_sessions_count = row[1]
+    total_cost_cents = int(row[0] + journey.archived_cost_cents)
+    agent_sessions_count = row[1] + journey.archived_sessions
 
     progress_pct = round((perspectives_completed / 12) * 100, 1)
 
@@ -69,59 +70,12 @@ async def get_dashboard_stats(
     db: AsyncSession,
     org_id: uuid.UUID,
 ) -> DashboardStats:
-    """Get aggregated dashboard statistics for an organization."""
-    # Count journeys by status
-    total_result = await db.execute(
-        select(func.count()).select_from(Journey).where(Journey.organization_id == org_id)
-    )
-    total_journeys = total_result.scalar_one()
-
-    active_result = await db.execute(
-        select(func.count())
-        .select_from(Journey)
-        .where(Journey.organization_id == org_id, Journey.status == JourneyStatus.ACTIVE.value)
-    )
-    active_journeys = active_result.scalar_one()
-
-    completed_result = await db.execute(
-        select(func.count())
-        .select_from(Journey)
-        .where(Journey.organization_id == org_id, Journey.status == JourneyStatus.COMPLETED.value)
-    )
-    completed_journeys = completed_result.scalar_one()
-
-    # Count VDBAs
-    vdba_result = await db.execute(
-        select(func.count()).select_from(Vdba).where(Vdba.organization_id == org_id)
-    )
-    total_vdbas = vdba_result.scalar_one()
-
-    # Sum costs across all journeys
-    cost_result = await db.execute(
-        select(func.coalesce(func.sum(Journey.total_cost_cents), 0))
-        .where(Journey.organization_id == org_id)
-    )
-    total_cost_cents = int(cost_result.scalar_one())
+    """Get aggregated dashboard statistics for an organization.
 
-    # Count vibe sessions across org journeys
-    vibe_result = await db.execute(
-        select(func.count())
-        .select_from(VibeSession)
-        .join(Perspective, VibeSession.perspective_id == Perspective.id)
-        .join(Journey, Perspective.journey_id == Journey.id)
-        .where(Journey.organization_id == org_id)
-    )
-    total_vibes = vibe_result.scalar_one()
-
-    # Count email logs across org journeys
-    email_result = await db.execute(
-        select(func.count())
-        .select_from(EmailLog)
-        .join(Perspective, EmailLog.perspective_id == Perspective.id)
-        .join(Journey, Perspective.journey_id == Journey.id)
-        .where(Journey.organization_id == org_id)
-    )
-    total_emails = email_result.scalar_one()
+    Totals come from the single ``organization_stats`` row, kept current by
+    ``dashboard_stats`` as the underlying rows are written.
+    """
+    stats = await dashboard_stats.get_stats(db, org_id)
 
     # Get last 5 VDBAs
     recent_result = await db.execute(
@@ -133,13 +87,116 @@ async def get_dashboard_stats(
     recent_vdbas_raw = list(recent_result.scalars().all())
     recent_vdbas = [VdbaListItem.model_validate(v) for v in recent_vdbas_raw]
 
+    if stats is None:
+        # Nothing has been written for this org yet
+        return DashboardStats(
+            total_journeys=0,
+            active_journeys=0,
+            completed_journeys=0,
+            total_vdbas=0,
+            total_cost_cents=0,
+            total_vibes=0,
+            total_emails=0,
+            recent_vdbas=recent_vdbas,
+        )
+
     return DashboardStats(
-        total_journeys=total_journeys,
-        active_journeys=active_journeys,
-        completed_journeys=completed_journeys,
-        total_vdbas=total_vdbas,
-        total_cost_cents=total_cost_cents,
-        total_vibes=total_vibes,
-        total_emails=total_emails,
+        total_journeys=stats.total_journeys,
+        active_journeys=stats.active_journeys,
+        completed_journeys=stats.completed_journeys,
+        total_vdbas=stats.total_vdbas,
+        total_cost_cents=int(stats.total_cost_cents),
+        total_vibes=stats.total_vibes,
+        total_emails=stats.total_emails,
         recent_vdbas=recent_vdbas,
     )
+
+
+_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def _percentiles(*columns) -> list:
+    """``percentile_cont`` at p50/p95/p99, of one column or of one column per percentile."""
+    if len(columns) == 1:
+        columns = columns * len(_PERCENTILES)
+    return [
+        func.percentile_cont(fraction).within_group(column)
+        for fraction, column in zip(_PERCENTILES, columns, strict=True)
+    ]
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _latency_percentiles(values) -> LatencyPercentiles:
+    p50, p95, p99 = (None if v is None else round(float(v), 2) for v in values)
+    return LatencyPercentiles(p50=p50, p95=p95, p99=p99)
+
+
+async def get_latency_report(
+    db: AsyncSession,
+    org_id: uuid.UUID,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    agent_name: str | None = None,
+    model: str | None = None,
+) -> LatencyReport:
+    """Agent session latency percentiles by agent, model and intersection (default: the last 7 days).
+
+    Time to first token, inter-token gaps and throughput are only recorded for
+    streamed chat, so they may be null where ``duration_ms`` is not.
+    """
+    # Times without an offset are taken as UTC
+    end = _utc(end) if end else datetime.now(UTC)
+    start = _utc(start) if start else end - timedelta(days=7)
+
+    query = (
+        select(
+            AgentSession.agent_name,
+            AgentSession.model_used,
+            Perspective.dimension,
+            Perspective.phase,
+            func.count(),
+            func.count(AgentSession.ttft_ms),
+            *_percentiles(AgentSession.duration_ms),
+            *_percentiles(AgentSession.ttft_ms),
+            *_percentiles(
+                AgentSession.inter_token_p50_ms, AgentSession.inter_token_p95_ms, AgentSession.inter_token_p99_ms,
+            ),
+            *_percentiles(AgentSession.output_tokens_per_second),
+        )
+        .select_from(AgentSession)
+        .join(Perspective, AgentSession.perspective_id == Perspective.id)
+        .join(Journey, Perspective.journey_id == Journey.id)
+        # A range on created_at, so only the partitions covering the window are scanned
+        .where(
+            Journey.organization_id == org_id,
+            AgentSession.created_at >= start,
+            AgentSession.created_at < end,
+        )
+        .group_by(AgentSession.agent_name, AgentSession.model_used, Perspective.dimension, Perspective.phase)
+        .order_by(AgentSession.agent_name, AgentSession.model_used, Perspective.dimension, Perspective.phase)
+    )
+    if agent_name:
+        query = query.where(AgentSession.agent_name == agent_name)
+    if model:
+        query = query.where(AgentSession.model_used == model)
+
+    result = await db.execute(query)
+    groups = [
+        LatencyGroup(
+            agent_name=row[0],
+            model=row[1],
+            dimension=row[2],
+            phase=row[3],
+            sessions=row[4],
+            streamed_sessions=row[5],
+            duration_ms=_latency_percentiles(row[6:9]),
+            ttft_ms=_latency_percentiles(row[9:12]),
+            inter_token_ms=_latency_percentiles(row[12:15]),
+            output_tokens_per_second=_latency_percentiles(row[15:18]),
+        )
+        for row in result.all()
+    ]
+    return LatencyReport(start=start, end=end, groups=groups)
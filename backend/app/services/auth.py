@@ -1,5 +1,6 @@
 import re
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select
@@ -19,6 +20,22 @@ from app.models.auth_token import AuthToken
 from app.models.organization import Organization
 from app.models.user import User
 from app.schemas.auth import RegisterRequest
+from app.services.user_cache import invalidate_user, load_user
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Who a request acts for, taken from its access token.
+
+    The claims are fixed when the token is issued, so a role or organization change
+    only shows up once the token is refreshed (at most ``jwt_access_minutes``).
+    Good enough for read-only routes scoped to the caller's organization; anything
+    that writes or checks a role uses the current user instead.
+    """
+
+    id: uuid.UUID
+    organization_id: uuid.UUID
+    role: str
 
 
 def _slugify(name: str) -> str:
@@ -76,13 +93,21 @@ async def get_current_user(db: AsyncSession, token: str) -> User:
     if not user_id:
         raise UnauthorizedError("Invalid token")
 
-    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
-    user = result.scalar_one_or_none()
+    user = await load_user(db, uuid.UUID(user_id))
     if not user:
         raise UnauthorizedError("User not found")
     return user
 
 
+def get_token_principal(token: str) -> Principal:
+    """The caller as described by the access token's claims, without looking the user up."""
+    payload = decode_token(token)
+    try:
+        return Principal(id=uuid.UUID(payload["sub"]), organization_id=uuid.UUID(payload["org"]), role=payload["role"])
+    except (KeyError, ValueError) as e:
+        raise UnauthorizedError("Invalid token") from e
+
+
 async def refresh_token(token: str) -> str:
     payload = decode_token(token)
     refresh_exp = payload.get("refresh_exp")
@@ -119,6 +144,7 @@ async def verify_email(db: AsyncSession, token_str: str) -> User:
 
     user.email_verified_at = datetime.now(UTC)
     await db.flush()
+    await invalidate_user(user.id)
     return user
 
 
@@ -165,4 +191,5 @@ async def reset_password(db: AsyncSession, token_str: str, new_password: str) ->
 
     user.password_hash = hash_password(new_password)
     await db.flush()
+    await invalidate_user(user.id)
     return user
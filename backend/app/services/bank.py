@@ -6,12 +6,15 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError, ValidationError
-from app.models.agent_session import AgentSession
+from app.db.session import release_connection
 from app.models.axiom_challenge import AxiomChallenge
 from app.models.bank_instance import BankInstance
 from app.models.enums import BankType, DimensionType, PerspectiveStatus, PhaseType
+from app.models.journey import Journey
 from app.models.perspective import Perspective
-from app.services.agents.base import BaseAgent
+from app.services.agent_sessions import latest_agent_outputs
+from app.services.agents.base import AGENT_REGISTRY
+from app.services.agents.cache import org_cache_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -151,37 +154,17 @@ async def generate_synopsis(
 
     Returns (synopsis_text, input_tokens, output_tokens).
     """
-    # Fetch latest agent session per agent
-    subq = (
-        select(
-            AgentSession.agent_name,
-            func.max(AgentSession.created_at).label("latest"),
-        )
-        .where(AgentSession.perspective_id == perspective_id)
-        .group_by(AgentSession.agent_name)
-        .subquery()
-    )
-    result = await db.execute(
-        select(AgentSession)
-        .join(
-            subq,
-            (AgentSession.agent_name == subq.c.agent_name)
-            & (AgentSession.created_at == subq.c.latest),
-        )
-        .where(AgentSession.perspective_id == perspective_id)
-    )
-    sessions = list(result.scalars().all())
+    # Fetch latest output per agent
+    outputs = await latest_agent_outputs(db, perspective_id)
 
-    if not sessions:
+    if not outputs:
         raise ValidationError("No agent sessions found for this perspective")
 
     # Build specialist outputs section
     parts: list[str] = []
-    for session in sessions:
-        content = (session.response_payload or {}).get("content", "")
-        if content:
-            truncated = content[:1500]
-            parts.append(f"### {session.agent_name.capitalize()}\n{truncated}")
+    for agent_name, content in outputs.items():
+        truncated = content[:1500]
+        parts.append(f"### {agent_name.capitalize()}\n{truncated}")
 
     # Fetch axiom challenges
     challenge_result = await db.execute(
@@ -207,12 +190,21 @@ async def generate_synopsis(
 
     prompt = "\n\n".join(prompt_sections)
 
-    agent = BaseAgent("axiom")
-    synopsis, input_tokens, output_tokens = await agent.raw_chat(
-        prompt, _SYNOPSIS_SYSTEM, max_tokens=1024,
+    org_result = await db.execute(
+        select(Journey.organization_id)
+        .join(Perspective, Perspective.journey_id == Journey.id)
+        .where(Perspective.id == perspective_id)
+    )
+    organization_id = org_result.scalar_one_or_none()
+    use_cache = await org_cache_enabled(db, organization_id)
+    await release_connection(db)
+
+    agent = AGENT_REGISTRY["axiom"]
+    result = await agent.raw_chat(
+        prompt, _SYNOPSIS_SYSTEM, max_tokens=1024, organization_id=organization_id, use_cache=use_cache,
     )
     logger.info(
-        "generate_synopsis perspective=%s tokens_in=%d tokens_out=%d",
-        perspective_id, input_tokens, output_tokens,
+        "generate_synopsis perspective=%s tokens_in=%d tokens_out=%d cached=%s",
+        perspective_id, result.input_tokens, result.output_tokens, result.cached,
     )
-    return synopsis, input_tokens, output_tokens
+    return result.content, result.input_tokens, result.output_tokens
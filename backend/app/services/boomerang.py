@@ -9,8 +9,8 @@ from dataclasses import dataclass, field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.agent_session import AgentSession
 from app.models.axiom_challenge import AxiomChallenge
+from app.services.agent_sessions import latest_agent_outputs
 from app.services.agents.prompts import VALID_AGENT_NAMES
 
 logger = logging.getLogger(__name__)
@@ -60,24 +60,17 @@ async def run_boomerang_with_audit(
     agents_completed: list[str] = []
 
     # Collect latest specialist outputs from agent_sessions
+    outputs = await latest_agent_outputs(db, perspective_id, SPECIALIST_NAMES)
     for name in SPECIALIST_NAMES:
-        result = await db.execute(
-            select(AgentSession)
-            .where(AgentSession.perspective_id == perspective_id, AgentSession.agent_name == name)
-            .order_by(AgentSession.created_at.desc())
-            .limit(1)
-        )
-        session = result.scalar_one_or_none()
-        if session and session.response_payload:
-            content = session.response_payload.get("content", "")
-            if content:
-                agents_completed.append(name)
-                assessment = _build_assessment(name, content)
-                agent_assessments[name] = {
-                    "summary": assessment.summary,
-                    "confidence": assessment.confidence,
-                    "key_findings": assessment.key_findings,
-                }
+        content = outputs.get(name)
+        if content:
+            agents_completed.append(name)
+            assessment = _build_assessment(name, content)
+            agent_assessments[name] = {
+                "summary": assessment.summary,
+                "confidence": assessment.confidence,
+                "key_findings": assessment.key_findings,
+            }
 
     # Build decision audit from Axiom challenges
     decision_audit = await _build_decision_audit(db, perspective_id)
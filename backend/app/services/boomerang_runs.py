@@ -0,0 +1,215 @@
+"""Persisted, resumable boomerang runs.
+
+A run is executed by the job worker rather than the request that started it, so it
+keeps going if the client disconnects. Every SSE event the orchestrator yields is
+appended to a Redis stream; clients read that stream and, after reconnecting,
+resume from their ``Last-Event-ID``. Progress is checkpointed on the run record so
+a retried job skips the LLM calls it already made.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import uuid
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+from app.core.sse import sse_event
+from app.core.tracing import span
+from app.db.session import async_session_factory, unit_of_work
+from app.models.boomerang_run import BoomerangRun
+from app.services.agents.base import AgentContext
+from app.services.agents.checkpoint import BoomerangCheckpoint
+from app.services.agents.orchestrator import BoomerangOrchestrator
+from app.services.agents.telemetry import TelemetryBuffer
+from app.services.jobs import NonRetryableJobError, enqueue, register_job
+
+logger = logging.getLogger(__name__)
+
+RUN_JOB = "boomerang.run"
+STREAM_KEY_PREFIX = "incube:boomerang:events:"
+STREAM_MAXLEN = 5000
+STREAM_TTL_SECONDS = 24 * 3600
+READ_BLOCK_MS = 15_000
+END_FIELD = "end"
+TERMINAL_STATUSES = {"complete", "failed"}
+_FAILURE_EVENTS = {"boomerang_error", "error"}
+_STREAM_ID_RE = re.compile(r"^\d+-\d+$")
+
+
+def stream_key(run_id: uuid.UUID) -> str:
+    return f"{STREAM_KEY_PREFIX}{run_id}"
+
+
+def is_stream_id(value: str) -> bool:
+    """Whether ``value`` is a Redis stream entry id (as sent back in Last-Event-ID)."""
+    return bool(_STREAM_ID_RE.match(value))
+
+
+def _event_name(event: str) -> str:
+    return event.split("\n", 1)[0].removeprefix("event: ")
+
+
+def _event_data(event: str) -> dict:
+    for line in event.split("\n"):
+        if line.startswith("data: "):
+            return json.loads(line.removeprefix("data: "))
+    return {}
+
+
+async def create_run(db: AsyncSession, context: AgentContext, prompt: str) -> BoomerangRun:
+    """Persist a queued run holding everything the worker needs to execute it."""
+    run = BoomerangRun(
+        perspective_id=context.perspective_id,
+        organization_id=context.organization_id,
+        user_id=context.user_id,
+        status="queued",
+        request={
+            "prompt": prompt,
+            "dimension": context.dimension,
+            "phase": context.phase,
+            "goal_statement": context.goal_statement,
+            "response_cache": context.response_cache,
+        },
+        checkpoint={},
+    )
+    db.add(run)
+    await db.flush()
+    return run
+
+
+async def start_run(run_id: uuid.UUID) -> str:
+    """Open the run's event stream and queue it for the worker. Returns the job id."""
+    await publish_event(run_id, sse_event("boomerang_run", {"run_id": str(run_id), "status": "queued"}))
+    return await enqueue(RUN_JOB, {"run_id": str(run_id)})
+
+
+async def get_run(db: AsyncSession, run_id: uuid.UUID) -> BoomerangRun | None:
+    result = await db.execute(select(BoomerangRun).where(BoomerangRun.id == run_id))
+    return result.scalar_one_or_none()
+
+
+async def publish_event(run_id: uuid.UUID, event: str) -> str:
+    """Append an SSE event to the run's stream and return its stream entry id."""
+    key = stream_key(run_id)
+    with span("sse.publish", {"incube.run_id": str(run_id)}) as current:
+        if current.is_recording():
+            current.set_attribute("incube.sse.event", _event_name(event))
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"sse": event}, maxlen=STREAM_MAXLEN, approximate=True)
+            pipe.expire(key, STREAM_TTL_SECONDS)
+            entry_id, _ = await pipe.execute()
+    return entry_id
+
+
+async def _end_stream(run_id: uuid.UUID) -> None:
+    key = stream_key(run_id)
+    async with get_redis().pipeline(transaction=False) as pipe:
+        pipe.xadd(key, {END_FIELD: "1"}, maxlen=STREAM_MAXLEN, approximate=True)
+        pipe.expire(key, STREAM_TTL_SECONDS)
+        await pipe.execute()
+
+
+async def stream_run_events(run_id: uuid.UUID, last_event_id: str | None = None) -> AsyncGenerator[str, None]:
+    """Yield the run's SSE events after ``last_event_id``, following the stream until the run ends."""
+    redis = get_redis()
+    key = stream_key(run_id)
+    cursor = last_event_id or "0-0"
+    while True:
+        entries = await redis.xread({key: cursor}, count=100, block=READ_BLOCK_MS)
+        if not entries:
+            if not await redis.exists(key):
+                # Stream expired (or never existed): nothing more will arrive
+                return
+            yield ": keepalive\n\n"
+            continue
+        for _key, items in entries:
+            for entry_id, fields in items:
+                cursor = entry_id
+                if END_FIELD in fields:
+                    return
+                yield f"id: {entry_id}\n{fields['sse']}"
+
+
+async def _save_checkpoint(run_id: uuid.UUID, data: dict) -> None:
+    with span("boomerang.checkpoint", {"incube.run_id": str(run_id)}):
+        async with unit_of_work() as db:
+            await db.execute(update(BoomerangRun).where(BoomerangRun.id == run_id).values(checkpoint=data))
+
+
+async def _finish_run(run_id: uuid.UUID, status: str, error: str | None = None) -> None:
+    async with unit_of_work() as db:
+        await db.execute(
+            update(BoomerangRun)
+            .where(BoomerangRun.id == run_id)
+            .values(status=status, error=error, completed_at=datetime.now(UTC))
+        )
+
+
+async def _mark_failed(payload: dict) -> None:
+    run_id = uuid.UUID(payload["run_id"])
+    await _finish_run(run_id, "failed", "Run failed after all retry attempts")
+    await publish_event(run_id, sse_event("boomerang_error", {
+        "error": "Boomerang run failed. Partial results are kept; start a new run to retry.",
+        "error_type": "unknown",
+    }))
+    await _end_stream(run_id)
+
+
+@register_job(RUN_JOB, on_failure=_mark_failed)
+async def execute_run(payload: dict) -> None:
+    """Run (or resume) a boomerang, publishing its events and checkpointing each step."""
+    run_id = uuid.UUID(payload["run_id"])
+    async with unit_of_work() as db:
+        run = await get_run(db, run_id)
+        if run is None:
+            raise NonRetryableJobError(f"Boomerang run {run_id} not found")
+        if run.status in TERMINAL_STATUSES:
+            return
+        run.status = "running"
+        request = dict(run.request)
+        checkpoint_data = dict(run.checkpoint or {})
+        context = AgentContext(
+            perspective_id=run.perspective_id,
+            dimension=request.get("dimension"),
+            phase=request.get("phase"),
+            goal_statement=request.get("goal_statement"),
+            organization_id=run.organization_id,
+            user_id=run.user_id,
+            response_cache=request.get("response_cache", True),
+        )
+
+    if checkpoint_data:
+        logger.info("Resuming boomerang run %s from checkpoint", run_id)
+
+    async def save(data: dict) -> None:
+        # Usage rows for a finished step are written before the step is marked done
+        await context.telemetry.checkpoint()
+        await _save_checkpoint(run_id, data)
+
+    checkpoint = BoomerangCheckpoint.from_dict(checkpoint_data, on_save=save)
+    status, error = "complete", None
+
+    run_attributes = {
+        "incube.run_id": str(run_id),
+        "incube.perspective_id": str(context.perspective_id),
+        "incube.resumed": bool(checkpoint_data),
+    }
+    with span("boomerang.run", run_attributes):
+        # The orchestrator's session is only a fallback; with a telemetry buffer attached
+        # it is never used, so no connection is held while the agents run
+        async with TelemetryBuffer() as telemetry, async_session_factory() as db:
+            context.telemetry = telemetry
+            async for event in BoomerangOrchestrator().run(context, request["prompt"], db, checkpoint=checkpoint):
+                await publish_event(run_id, event)
+                if _event_name(event) in _FAILURE_EVENTS:
+                    status, error = "failed", _event_data(event).get("error")
+
+    await _finish_run(run_id, status, error)
+    await _end_stream(run_id)
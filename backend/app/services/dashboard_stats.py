@@ -0,0 +1,213 @@
+"""Incrementally maintained per-organization dashboard totals.
+
+Writers call ``bump``/``bump_for_perspective`` (or ``record_agent_costs``) in the
+same transaction as the rows they add, so ``organization_stats`` and journey costs
+stay in step with the source tables and the dashboard reads a single row. Every
+write applies a delta; only ``rebuild_stats`` recomputes from scratch, for deletes
+that cascade and for repairs.
+"""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import Numeric, column, func, literal, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent_session import AgentSession
+from app.models.email_log import EmailLog
+from app.models.enums import JourneyStatus
+from app.models.journey import Journey
+from app.models.organization import Organization
+from app.models.organization_stats import OrganizationStats
+from app.models.perspective import Perspective
+from app.models.vdba import Vdba
+from app.models.vibe_session import VibeSession
+
+COUNTERS = (
+    "total_journeys",
+    "active_journeys",
+    "completed_journeys",
+    "total_vdbas",
+    "total_vibes",
+    "total_emails",
+    "total_cost_cents",
+)
+
+_STATUS_COUNTERS = {
+    JourneyStatus.ACTIVE.value: "active_journeys",
+    JourneyStatus.COMPLETED.value: "completed_journeys",
+}
+
+
+def journey_status_deltas(old_status: str | None, new_status: str | None) -> dict[str, int]:
+    """Counter changes for a journey moving from ``old_status`` to ``new_status`` (None = not present)."""
+    deltas: dict[str, int] = defaultdict(int)
+    # Loaded journeys hold JourneyStatus members; compare by value
+    old_status = str(old_status) if old_status is not None else None
+    new_status = str(new_status) if new_status is not None else None
+    if old_status in _STATUS_COUNTERS:
+        deltas[_STATUS_COUNTERS[old_status]] -= 1
+    if new_status in _STATUS_COUNTERS:
+        deltas[_STATUS_COUNTERS[new_status]] += 1
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+def _upsert(stmt, counters: Iterable[str]):
+    # A missing row is created with the deltas as its starting values
+    table = OrganizationStats.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.organization_id],
+        set_={name: table.c[name] + stmt.excluded[name] for name in counters} | {"updated_at": func.now()},
+    )
+
+
+async def bump(db: AsyncSession, org_id: uuid.UUID, **deltas: float) -> None:
+    """Atomically add ``deltas`` (counter name -> change) to an organization's totals."""
+    if not deltas:
+        return
+    stmt = pg_insert(OrganizationStats).values(organization_id=org_id, **deltas)
+    await db.execute(_upsert(stmt, deltas))
+
+
+async def bump_for_perspective(db: AsyncSession, perspective_id: uuid.UUID, **deltas: float) -> None:
+    """Like ``bump``, for the organization owning ``perspective_id`` (resolved in the same statement)."""
+    if not deltas:
+        return
+    table = OrganizationStats.__table__
+    source = (
+        select(
+            func.gen_random_uuid(),
+            Journey.organization_id,
+            *(literal(value, table.c[name].type) for name, value in deltas.items()),
+        )
+        .join(Perspective, Perspective.journey_id == Journey.id)
+        .where(Perspective.id == perspective_id)
+    )
+    stmt = pg_insert(OrganizationStats).from_select(["id", "organization_id", *deltas], source)
+    await db.execute(_upsert(stmt, deltas))
+
+
+async def record_agent_costs(db: AsyncSession, costs: Iterable[tuple[uuid.UUID, float]]) -> None:
+    """Add new agent-session costs, given as ``(perspective_id, cost_cents)``, to journey and org totals.
+
+    Two statements per call whatever the number of sessions: the summed cost of
+    each affected journey is added to it, then to its organization's row.
+    """
+    by_perspective: dict[uuid.UUID, float] = defaultdict(float)
+    for perspective_id, cost_cents in costs:
+        by_perspective[perspective_id] += float(cost_cents or 0)
+    by_perspective = {perspective_id: cost for perspective_id, cost in by_perspective.items() if cost}
+    if not by_perspective:
+        return
+
+    session_costs = values(
+        column("perspective_id", UUID(as_uuid=True)),
+        column("cost_cents", Numeric(14, 4)),
+        name="session_costs",
+    ).data(list(by_perspective.items()))
+    journey_costs = (
+        select(Perspective.journey_id, func.sum(session_costs.c.cost_cents).label("cost_cents"))
+        .join(session_costs, session_costs.c.perspective_id == Perspective.id)
+        .group_by(Perspective.journey_id)
+        .subquery()
+    )
+    result = await db.execute(
+        update(Journey)
+        .where(Journey.id == journey_costs.c.journey_id)
+        .values(total_cost_cents=Journey.total_cost_cents + journey_costs.c.cost_cents)
+        .returning(Journey.organization_id, journey_costs.c.cost_cents),
+        execution_options={"synchronize_session": False},
+    )
+
+    by_org: dict[uuid.UUID, float] = defaultdict(float)
+    for org_id, cost_cents in result.all():
+        by_org[org_id] += float(cost_cents)
+    if by_org:
+        stmt = pg_insert(OrganizationStats).values(
+            [{"organization_id": org_id, "total_cost_cents": cost} for org_id, cost in by_org.items()]
+        )
+        await db.execute(_upsert(stmt, ["total_cost_cents"]))
+
+
+async def _refresh_journey_costs(db: AsyncSession, *where) -> None:
+    # Repair path only: re-sums every session of the selected journeys
+    session_costs = (
+        select(Journey.archived_cost_cents + func.coalesce(func.sum(AgentSession.cost_cents), 0))
+        .join(Perspective, AgentSession.perspective_id == Perspective.id)
+        # A journey's sessions are never older than the journey: skips earlier partitions
+        .where(Perspective.journey_id == Journey.id, AgentSession.created_at >= Journey.created_at)
+        .scalar_subquery()
+    )
+    await db.execute(
+        update(Journey).where(*where).values(total_cost_cents=session_costs),
+        execution_options={"synchronize_session": False},
+    )
+
+
+async def get_stats(db: AsyncSession, org_id: uuid.UUID) -> OrganizationStats | None:
+    result = await db.execute(select(OrganizationStats).where(OrganizationStats.organization_id == org_id))
+    return result.scalar_one_or_none()
+
+
+def _org_count(model, *where):
+    return select(func.count()).select_from(model).where(*where).correlate(Organization).scalar_subquery()
+
+
+def _org_perspective_count(model):
+    return (
+        select(func.count())
+        .select_from(model)
+        .join(Perspective, model.perspective_id == Perspective.id)
+        .join(Journey, Perspective.journey_id == Journey.id)
+        .where(Journey.organization_id == Organization.id)
+        .correlate(Organization)
+        .scalar_subquery()
+    )
+
+
+async def rebuild_stats(db: AsyncSession, org_id: uuid.UUID | None = None) -> None:
+    """Recompute totals (and journey costs) from the source tables, for one organization or all of them."""
+    await _refresh_journey_costs(db, *([Journey.organization_id == org_id] if org_id is not None else []))
+
+    org_cost = (
+        select(func.coalesce(func.sum(AgentSession.cost_cents), 0))
+        .join(Perspective, AgentSession.perspective_id == Perspective.id)
+        .join(Journey, Perspective.journey_id == Journey.id)
+        .where(Journey.organization_id == Organization.id)
+        .correlate(Organization)
+        .scalar_subquery()
+    )
+    archived_cost = (
+        select(func.coalesce(func.sum(Journey.archived_cost_cents), 0))
+        .where(Journey.organization_id == Organization.id)
+        .correlate(Organization)
+        .scalar_subquery()
+    )
+    source = select(
+        func.gen_random_uuid(),
+        Organization.id,
+        _org_count(Journey, Journey.organization_id == Organization.id),
+        _org_count(
+            Journey, Journey.organization_id == Organization.id, Journey.status == JourneyStatus.ACTIVE.value
+        ),
+        _org_count(
+            Journey, Journey.organization_id == Organization.id, Journey.status == JourneyStatus.COMPLETED.value
+        ),
+        _org_count(Vdba, Vdba.organization_id == Organization.id),
+        _org_perspective_count(VibeSession),
+        _org_perspective_count(EmailLog),
+        org_cost + archived_cost,
+    )
+    if org_id is not None:
+        source = source.where(Organization.id == org_id)
+
+    stmt = pg_insert(OrganizationStats).from_select(["id", "organization_id", *COUNTERS], source)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[OrganizationStats.__table__.c.organization_id],
+            set_={name: stmt.excluded[name] for name in COUNTERS} | {"updated_at": func.now()},
+        )
+    )
@@ -1,12 +1,31 @@
+import os
 import uuid
+from collections.abc import AsyncIterator
 
 from fastapi import UploadFile
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.errors import NotFoundError
 from app.models.document import Document
-from app.services.minio import delete_file, download_file, get_minio_client, upload_file
+from app.services.minio import (
+    delete_file,
+    get_minio_client,
+    open_file_stream,
+    presigned_download_url,
+    upload_file,
+)
+
+
+def _upload_size(file: UploadFile) -> int:
+    if file.size is not None:
+        return file.size
+    # Older clients/servers may not report a size; measure the spooled file instead
+    position = file.file.tell()
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(position)
+    return size
 
 
 async def create_document(
@@ -15,11 +34,15 @@ async def create_document(
     user_id: uuid.UUID,
     file: UploadFile,
 ) -> Document:
-    file_data = await file.read()
+    file_size = _upload_size(file)
     content_type = file.content_type or "application/octet-stream"
 
+    # Stream from the upload's spooled temp file rather than reading it into memory
+    await file.seek(0)
     client = get_minio_client()
-    minio_key = await upload_file(client, file_data, file.filename or "upload", content_type, str(perspective_id))
+    minio_key = await upload_file(
+        client, file.file, file.filename or "upload", content_type, str(perspective_id), length=file_size,
+    )
 
     doc = Document(
         perspective_id=perspective_id,
@@ -27,7 +50,7 @@ async def create_document(
         filename=file.filename or "upload",
         file_type=content_type,
         minio_key=minio_key,
-        file_size=len(file_data),
+        file_size=file_size,
     )
     db.add(doc)
     await db.flush()
@@ -49,11 +72,16 @@ async def get_document(db: AsyncSession, document_id: uuid.UUID) -> Document:
     return doc
 
 
-async def get_document_content(db: AsyncSession, document_id: uuid.UUID) -> tuple[Document, bytes]:
-    doc = await get_document(db, document_id)
-    client = get_minio_client()
-    data = await download_file(client, doc.minio_key)
-    return doc, data
+async def open_document_stream(doc: Document, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+    """Open the document's bytes ``start``..``end`` (inclusive) for streaming."""
+    length = 0 if end is None else end - start + 1
+    return await open_file_stream(get_minio_client(), doc.minio_key, offset=start, length=length)
+
+
+async def get_download_url(doc: Document) -> str:
+    return await presigned_download_url(
+        get_minio_client(), doc.minio_key, doc.filename, settings.document_presigned_url_expiry_seconds,
+    )
 
 
 async def delete_document(db: AsyncSession, document_id: uuid.UUID) -> None:
@@ -9,7 +9,7 @@ from app.core.errors import NotFoundError
 from app.models.bank_instance import BankInstance
 from app.models.perspective import Perspective
 from app.models.vdba import Vdba
-from app.services.minio import ensure_bucket, get_minio_client
+from app.services.minio import get_minio_client, put_object
 
 
 async def generate_export(db: AsyncSession, vdba_id: uuid.UUID) -> str:
@@ -56,20 +56,8 @@ async def generate_export(db: AsyncSession, vdba_id: uuid.UUID) -> str:
         file_bytes, content_type, extension = _generate_json(export_data)
 
     # Upload to MinIO
-    client = get_minio_client()
-    await ensure_bucket(client)
-
     minio_key = f"exports/vdba/{vdba.id}.{extension}"
-    data_stream = io.BytesIO(file_bytes)
-    from app.core.config import settings
-
-    await client.put_object(
-        settings.minio_bucket,
-        minio_key,
-        data_stream,
-        length=len(file_bytes),
-        content_type=content_type,
-    )
+    await put_object(get_minio_client(), minio_key, file_bytes, content_type)
 
     # Update VDBA export_url
     vdba.export_url = minio_key
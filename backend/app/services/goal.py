@@ -1,10 +1,12 @@
 import uuid
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError
+from app.db.pagination import paginate
 from app.models.goal import Goal
+from app.schemas.common import CountMode, PaginationMeta
 from app.schemas.goal import GoalCreate
 
 
@@ -22,19 +24,19 @@ async def create_goal(db: AsyncSession, org_id: uuid.UUID, user_id: uuid.UUID, d
 
 
 async def list_goals(
-    db: AsyncSession, org_id: uuid.UUID, page: int = 1, per_page: int = 20, type_filter: str | None = None
-) -> tuple[list[Goal], int]:
+    db: AsyncSession,
+    org_id: uuid.UUID,
+    page: int = 1,
+    per_page: int = 20,
+    type_filter: str | None = None,
+    cursor: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[list[Goal], PaginationMeta]:
     base = select(Goal).where(Goal.organization_id == org_id)
     if type_filter:
         base = base.where(Goal.type == type_filter)
 
-    total_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = total_result.scalar_one()
-
-    offset = (page - 1) * per_page
-    result = await db.execute(base.order_by(Goal.created_at.desc()).offset(offset).limit(per_page))
-    goals = list(result.scalars().all())
-    return goals, total
+    return await paginate(db, base, Goal.created_at, Goal.id, page=page, per_page=per_page, cursor=cursor, count=count)
 
 
 async def get_goal(db: AsyncSession, org_id: uuid.UUID, goal_id: uuid.UUID) -> Goal:
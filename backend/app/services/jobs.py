@@ -0,0 +1,270 @@
+"""Redis-backed durable job queue with retryable stages.
+
+Job records are stored as JSON under ``incube:jobs:{id}``. Ready job ids sit in a
+list; a worker claims one by atomically moving it onto the processing list and
+recording a visibility deadline, which it keeps pushing forward while the handler
+runs. If the worker dies mid-job, the id is re-queued once the deadline passes.
+Failed jobs are retried with exponential backoff via a delayed sorted set until
+``max_attempts`` is reached. Periodic jobs (see ``register_periodic``) are
+enqueued by whichever worker first claims each interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.middleware import request_id_var
+from app.core.redis import get_redis
+from app.core.tracing import continue_trace, inject_context, span
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "incube:jobs:queue"
+PROCESSING_KEY = "incube:jobs:processing"
+INFLIGHT_KEY = "incube:jobs:inflight"
+DELAYED_KEY = "incube:jobs:delayed"
+JOB_KEY_PREFIX = "incube:jobs:record:"
+PERIODIC_KEY_PREFIX = "incube:jobs:periodic:"
+JOB_TTL_SECONDS = 7 * 24 * 3600
+MAX_RETRY_DELAY_SECONDS = 300.0
+
+JobHandler = Callable[[dict], Awaitable[None]]
+
+
+class NonRetryableJobError(Exception):
+    """Raised by a handler to fail a job immediately without further retries."""
+
+
+@dataclass
+class Job:
+    """A queued unit of background work."""
+
+    id: str
+    kind: str
+    payload: dict
+    status: str = "queued"  # queued | running | retrying | succeeded | failed
+    attempts: int = 0
+    max_attempts: int = 3
+    last_error: str | None = None
+    enqueued_at: float = field(default_factory=time.time)
+    # The enqueuing request's id and trace context, restored while the job runs
+    request_id: str | None = None
+    trace_context: dict = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> Job:
+        return cls(**json.loads(raw))
+
+
+@dataclass
+class _Registration:
+    handler: JobHandler
+    on_failure: JobHandler | None = None
+
+
+_REGISTRY: dict[str, _Registration] = {}
+_PERIODIC: dict[str, int] = {}
+
+
+def register_job(kind: str, *, on_failure: JobHandler | None = None) -> Callable[[JobHandler], JobHandler]:
+    """Register a handler for a job kind.
+
+    ``on_failure`` is called with the job payload once all attempts are exhausted.
+    """
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        _REGISTRY[kind] = _Registration(handler=handler, on_failure=on_failure)
+        return handler
+
+    return decorator
+
+
+def register_periodic(kind: str, interval_seconds: int) -> None:
+    """Enqueue a ``kind`` job (with an empty payload) every ``interval_seconds``, once across all workers."""
+    _PERIODIC[kind] = max(int(interval_seconds), 1)
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Exponential backoff delay before the next attempt, capped at 5 minutes."""
+    delay = settings.job_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return min(delay, MAX_RETRY_DELAY_SECONDS)
+
+
+def _job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}"
+
+
+async def enqueue(kind: str, payload: dict, *, max_attempts: int | None = None) -> str:
+    """Enqueue a job and return its id."""
+    job = Job(
+        id=str(uuid.uuid4()),
+        kind=kind,
+        payload=payload,
+        max_attempts=max_attempts or settings.job_max_attempts,
+        request_id=request_id_var.get(),
+        trace_context=inject_context(),
+    )
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.set(_job_key(job.id), job.to_json(), ex=JOB_TTL_SECONDS)
+        pipe.lpush(QUEUE_KEY, job.id)
+        await pipe.execute()
+    logger.info("Enqueued job %s kind=%s", job.id, kind)
+    return job.id
+
+
+async def get_job(job_id: str, redis: aioredis.Redis | None = None) -> Job | None:
+    """Load a job record, or None if it does not exist (or has expired)."""
+    redis = redis or get_redis()
+    raw = await redis.get(_job_key(job_id))
+    return Job.from_json(raw) if raw else None
+
+
+async def _save_job(redis: aioredis.Redis, job: Job) -> None:
+    await redis.set(_job_key(job.id), job.to_json(), ex=JOB_TTL_SECONDS)
+
+
+async def _promote_due_jobs(redis: aioredis.Redis) -> None:
+    """Move due retries and timed-out in-flight jobs back onto the ready queue."""
+    now = time.time()
+    for job_id in await redis.zrangebyscore(DELAYED_KEY, 0, now):
+        # ZREM doubles as a lock: only the worker that removes the id re-queues it
+        if await redis.zrem(DELAYED_KEY, job_id):
+            await redis.lpush(QUEUE_KEY, job_id)
+
+    for job_id in await redis.zrangebyscore(INFLIGHT_KEY, 0, now):
+        if await redis.zrem(INFLIGHT_KEY, job_id):
+            logger.warning("Job %s exceeded its visibility timeout, re-queueing", job_id)
+            await redis.lrem(PROCESSING_KEY, 1, job_id)
+            await redis.lpush(QUEUE_KEY, job_id)
+
+
+async def _enqueue_periodic_jobs(redis: aioredis.Redis) -> None:
+    for kind, interval in _PERIODIC.items():
+        # SET NX with the interval as its TTL: only the worker that claims the slot enqueues
+        if await redis.set(f"{PERIODIC_KEY_PREFIX}{kind}", str(time.time()), nx=True, ex=interval):
+            await enqueue(kind, {})
+
+
+async def _fail_job(redis: aioredis.Redis, job: Job, registration: _Registration | None) -> None:
+    job.status = "failed"
+    await _save_job(redis, job)
+    logger.error("Job %s kind=%s failed after %d attempt(s): %s", job.id, job.kind, job.attempts, job.last_error)
+    if registration and registration.on_failure:
+        try:
+            await registration.on_failure(job.payload)
+        except Exception:
+            logger.exception("Failure hook for job %s raised", job.id)
+
+
+async def _heartbeat(redis: aioredis.Redis, job_id: str) -> None:
+    """Extend ``job_id``'s visibility deadline until cancelled, so long handlers aren't re-delivered."""
+    timeout = settings.job_visibility_timeout_seconds
+    while True:
+        await asyncio.sleep(timeout / 3)
+        try:
+            # XX: if the job was already re-queued (this worker stalled past its deadline), leave it be
+            await redis.zadd(INFLIGHT_KEY, {job_id: time.time() + timeout}, xx=True)
+        except Exception:
+            logger.warning("Could not extend the visibility deadline of job %s", job_id, exc_info=True)
+
+
+async def run_next_job(redis: aioredis.Redis | None = None) -> bool:
+    """Claim and run a single job. Returns False if the queue was empty."""
+    redis = redis or get_redis()
+    job_id = await redis.blmove(QUEUE_KEY, PROCESSING_KEY, settings.job_poll_seconds, src="RIGHT", dest="LEFT")
+    if job_id is None:
+        return False
+
+    await redis.zadd(INFLIGHT_KEY, {job_id: time.time() + settings.job_visibility_timeout_seconds})
+    try:
+        job = await get_job(job_id, redis)
+        if job is None:
+            logger.warning("Job %s has no record, dropping", job_id)
+            return True
+
+        registration = _REGISTRY.get(job.kind)
+        job.attempts += 1
+        if registration is None:
+            job.last_error = f"No handler registered for job kind '{job.kind}'"
+            await _fail_job(redis, job, None)
+            return True
+        if job.attempts > job.max_attempts:
+            # Re-delivered after a worker crash on its last attempt
+            job.last_error = job.last_error or "Exceeded max attempts"
+            await _fail_job(redis, job, registration)
+            return True
+
+        job.status = "running"
+        await _save_job(redis, job)
+
+        start = time.monotonic()
+        request_token = request_id_var.set(job.request_id)
+        heartbeat = asyncio.create_task(_heartbeat(redis, job.id))
+        try:
+            with continue_trace(job.trace_context), span(
+                f"job {job.kind}", {"incube.job.id": job.id, "incube.job.attempt": job.attempts},
+            ):
+                await registration.handler(job.payload)
+        except NonRetryableJobError as exc:
+            job.last_error = f"{type(exc).__name__}: {exc}"
+            await _fail_job(redis, job, registration)
+        except Exception as exc:
+            job.last_error = f"{type(exc).__name__}: {exc}"
+            if job.attempts >= job.max_attempts:
+                await _fail_job(redis, job, registration)
+            else:
+                delay = retry_delay_seconds(job.attempts)
+                logger.warning(
+                    "Job %s kind=%s attempt %d/%d failed (%s), retrying in %.0fs",
+                    job.id, job.kind, job.attempts, job.max_attempts, job.last_error, delay,
+                )
+                job.status = "retrying"
+                await _save_job(redis, job)
+                await redis.zadd(DELAYED_KEY, {job.id: time.time() + delay})
+        else:
+            job.status = "succeeded"
+            job.last_error = None
+            await _save_job(redis, job)
+            logger.info(
+                "Job %s kind=%s succeeded in %.1fs", job.id, job.kind, time.monotonic() - start,
+            )
+        finally:
+            heartbeat.cancel()
+            request_id_var.reset(request_token)
+        return True
+    finally:
+        await redis.zrem(INFLIGHT_KEY, job_id)
+        await redis.lrem(PROCESSING_KEY, 1, job_id)
+
+
+async def run_worker(stop: asyncio.Event, concurrency: int | None = None) -> None:
+    """Run job consumers until ``stop`` is set. In-flight jobs finish before returning."""
+    redis = get_redis()
+    concurrency = concurrency or settings.worker_concurrency
+
+    async def consume(n: int) -> None:
+        logger.info("Job consumer %d started", n)
+        while not stop.is_set():
+            try:
+                await _promote_due_jobs(redis)
+                await _enqueue_periodic_jobs(redis)
+                await run_next_job(redis)
+            except Exception:
+                logger.exception("Job consumer %d loop error", n)
+                await asyncio.sleep(1)
+        logger.info("Job consumer %d stopped", n)
+
+    await asyncio.gather(*(consume(n) for n in range(concurrency)))
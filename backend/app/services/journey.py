@@ -5,10 +5,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError, ValidationError
+from app.db.pagination import paginate
 from app.models.bank_instance import BankInstance
 from app.models.enums import DimensionType, PerspectiveStatus, PhaseType
 from app.models.journey import Journey
 from app.models.perspective import Perspective
+from app.schemas.common import CountMode, PaginationMeta
+from app.services import dashboard_stats
 
 
 async def create_journey(db: AsyncSession, org_id: uuid.UUID, goal_id: uuid.UUID) -> Journey:
@@ -29,6 +32,7 @@ async def create_journey(db: AsyncSession, org_id: uuid.UUID, goal_id: uuid.UUID
             db.add(perspective)
 
     await db.flush()
+    await dashboard_stats.bump(db, org_id, total_journeys=1, active_journeys=1)
     return journey
 
 
@@ -38,18 +42,16 @@ async def list_journeys(
     status_filter: str | None = None,
     page: int = 1,
     per_page: int = 20,
-) -> tuple[list[Journey], int]:
+    cursor: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[list[Journey], PaginationMeta]:
     base = select(Journey).where(Journey.organization_id == org_id)
     if status_filter:
         base = base.where(Journey.status == status_filter)
 
-    total_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = total_result.scalar_one()
-
-    offset = (page - 1) * per_page
-    result = await db.execute(base.order_by(Journey.created_at.desc()).offset(offset).limit(per_page))
-    journeys = list(result.scalars().all())
-    return journeys, total
+    return await paginate(
+        db, base, Journey.created_at, Journey.id, page=page, per_page=per_page, cursor=cursor, count=count
+    )
 
 
 async def get_journey(db: AsyncSession, org_id: uuid.UUID, journey_id: uuid.UUID) -> dict:
@@ -83,6 +85,8 @@ async def delete_journey(db: AsyncSession, org_id: uuid.UUID, journey_id: uuid.U
         raise NotFoundError("Journey not found")
     await db.delete(journey)
     await db.flush()
+    # The delete cascades to vibes, emails and agent sessions, so recount rather than decrement
+    await dashboard_stats.rebuild_stats(db, org_id)
 
 
 async def update_journey_status(
@@ -93,6 +97,7 @@ async def update_journey_status(
     if not journey:
         raise NotFoundError("Journey not found")
 
+    old_status = journey.status
     if new_status == "completed":
         # Check all 12 perspectives are completed
         count_result = await db.execute(
@@ -112,4 +117,5 @@ async def update_journey_status(
         raise ValidationError(f"Invalid status transition: {new_status}")
 
     await db.flush()
+    await dashboard_stats.bump(db, org_id, **dashboard_stats.journey_status_deltas(old_status, journey.status))
     return journey
@@ -1,11 +1,24 @@
+"""Object storage: the shared MinIO client and upload/download helpers.
+
+One ``Minio`` client is kept per process so its HTTP connection pool is reused
+across requests. The bucket is checked once per client and only re-checked after
+an upload fails.
+"""
+
 import io
+import time
 import uuid
+import weakref
+from collections.abc import AsyncIterator
+from datetime import timedelta
 from pathlib import PurePosixPath
+from typing import BinaryIO
 
 from miniopy_async import Minio
 
 from app.core.config import settings
 from app.core.errors import ValidationError
+from app.core.metrics import STORAGE_BYTES, record_storage_operation
 
 ALLOWED_TYPES = {
     "application/pdf",
@@ -20,21 +33,78 @@ ALLOWED_TYPES = {
 }
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+_client: Minio | None = None
+# Clients that have confirmed the bucket exists
+_bucket_ready: weakref.WeakSet = weakref.WeakSet()
 
 
 def get_minio_client() -> Minio:
-    return Minio(
-        settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=False,
-    )
+    """Return the shared MinIO client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Minio(
+            settings.minio_endpoint,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            secure=False,
+        )
+    return _client
+
+
+async def close_minio_client() -> None:
+    """Close the shared client's HTTP session (called on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close_session()
+        _client = None
 
 
 async def ensure_bucket(client: Minio) -> None:
-    exists = await client.bucket_exists(settings.minio_bucket)
-    if not exists:
+    """Create the bucket if missing. Memoized per client once it is known to exist."""
+    if client in _bucket_ready:
+        return
+    if not await client.bucket_exists(settings.minio_bucket):
         await client.make_bucket(settings.minio_bucket)
+    _bucket_ready.add(client)
+
+
+async def put_object(
+    client: Minio,
+    minio_key: str,
+    data: bytes | BinaryIO,
+    content_type: str,
+    length: int | None = None,
+) -> None:
+    """Upload ``data`` (bytes, or a binary stream of ``length`` bytes) to ``minio_key``.
+
+    Objects larger than ``minio_part_size`` go up as a multipart upload with
+    ``minio_parallel_uploads`` parts in flight.
+    """
+    if isinstance(data, bytes):
+        length = len(data)
+        data = io.BytesIO(data)
+    elif length is None:
+        raise ValueError("length is required when uploading a stream")
+
+    await ensure_bucket(client)
+    start = time.perf_counter()
+    try:
+        await client.put_object(
+            settings.minio_bucket,
+            minio_key,
+            data,
+            length=length,
+            content_type=content_type,
+            part_size=settings.minio_part_size,
+            num_parallel_uploads=settings.minio_parallel_uploads,
+        )
+    except Exception:
+        # The bucket may have been removed; check it again on the next upload
+        _bucket_ready.discard(client)
+        raise
+    record_storage_operation("put", time.perf_counter() - start, length)
 
 
 def _sanitize_filename(filename: str) -> str:
@@ -46,42 +116,96 @@ def _sanitize_filename(filename: str) -> str:
 
 async def upload_file(
     client: Minio,
-    file_data: bytes,
+    file_data: bytes | BinaryIO,
     filename: str,
     content_type: str,
     perspective_id: str,
+    length: int | None = None,
 ) -> str:
-    if len(file_data) > MAX_FILE_SIZE:
+    """Upload ``file_data`` (bytes or a readable binary stream of ``length`` bytes).
+
+    Streams are sent as a multipart upload, reading part by part, so large files
+    are never held in memory whole.
+    """
+    length = len(file_data) if isinstance(file_data, bytes) else length
+    if length is None:
+        raise ValueError("length is required when uploading a stream")
+
+    if length > MAX_FILE_SIZE:
         raise ValidationError(f"File exceeds maximum size of {MAX_FILE_SIZE // (1024 * 1024)}MB")
-    if len(file_data) == 0:
+    if length == 0:
         raise ValidationError("File is empty")
     if content_type not in ALLOWED_TYPES:
         raise ValidationError(f"File type '{content_type}' is not allowed")
 
-    await ensure_bucket(client)
-
     safe_name = _sanitize_filename(filename)
     minio_key = f"perspectives/{perspective_id}/{uuid.uuid4()}_{safe_name}"
 
-    data_stream = io.BytesIO(file_data)
-    await client.put_object(
+    await put_object(client, minio_key, file_data, content_type, length=length)
+    return minio_key
+
+
+async def open_file_stream(
+    client: Minio,
+    minio_key: str,
+    offset: int = 0,
+    length: int = 0,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Open an object (or the byte range ``offset``..``offset + length``) for streaming.
+
+    The request to MinIO is made before returning, so a missing object fails here
+    rather than midway through a response. Iterating the result yields chunks and
+    releases the connection when done or abandoned.
+    """
+    start = time.perf_counter()
+    response = await client.get_object(settings.minio_bucket, minio_key, offset=offset, length=length)
+    record_storage_operation("get", time.perf_counter() - start)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        sent = 0
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                sent += len(chunk)
+                yield chunk
+        finally:
+            STORAGE_BYTES.labels("get").inc(sent)
+            response.close()
+            await response.release()
+
+    return chunks()
+
+
+async def presigned_download_url(client: Minio, minio_key: str, filename: str, expires_seconds: int) -> str:
+    """A time-limited URL the client can fetch the object from directly."""
+    return await client.presigned_get_object(
         settings.minio_bucket,
         minio_key,
-        data_stream,
-        length=len(file_data),
-        content_type=content_type,
+        expires=timedelta(seconds=expires_seconds),
+        response_headers={"response-content-disposition": f'attachment; filename="{filename}"'},
     )
-    return minio_key
 
 
-async def download_file(client: Minio, minio_key: str) -> bytes:
+async def delete_file(client: Minio, minio_key: str) -> None:
+    await client.remove_object(settings.minio_bucket, minio_key)
+
+
+async def upload_audio(client: Minio, audio_data: bytes, perspective_id: str) -> str:
+    """Upload vibe audio. Returns the minio object key."""
+    key = f"vibes/{perspective_id}/{uuid.uuid4()}.webm"
+    await put_object(client, key, audio_data, "audio/webm")
+    return key
+
+
+async def download_audio(client: Minio, minio_key: str) -> bytes:
+    """Download vibe audio (Whisper needs the whole file)."""
+    start = time.perf_counter()
     response = await client.get_object(settings.minio_bucket, minio_key)
+    record_storage_operation("get", time.perf_counter() - start)
     try:
-        return await response.read()
+        data = await response.read()
+        STORAGE_BYTES.labels("get").inc(len(data))
+        return data
     finally:
         response.close()
         await response.release()
-
-
-async def delete_file(client: Minio, minio_key: str) -> None:
-    await client.remove_object(settings.minio_bucket, minio_key)
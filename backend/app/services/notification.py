@@ -5,7 +5,9 @@ from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError
+from app.db.pagination import paginate
 from app.models.notification import Notification
+from app.schemas.common import CountMode, PaginationMeta
 
 
 async def create_notification(
@@ -33,16 +35,13 @@ async def list_notifications(
     user_id: uuid.UUID,
     page: int = 1,
     per_page: int = 20,
-) -> tuple[list[Notification], int]:
+    cursor: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[list[Notification], PaginationMeta]:
     base = select(Notification).where(Notification.user_id == user_id)
-
-    total_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = total_result.scalar_one()
-
-    offset = (page - 1) * per_page
-    result = await db.execute(base.order_by(Notification.created_at.desc()).offset(offset).limit(per_page))
-    notifications = list(result.scalars().all())
-    return notifications, total
+    return await paginate(
+        db, base, Notification.created_at, Notification.id, page=page, per_page=per_page, cursor=cursor, count=count
+    )
 
 
 async def get_unread_count(db: AsyncSession, user_id: uuid.UUID) -> int:
@@ -0,0 +1,172 @@
+"""Monthly partitions of the append-only ``agent_sessions`` and ``api_usage`` tables.
+
+Both tables are range-partitioned by ``created_at`` into one partition per UTC
+month, named ``<table>_pYYYY_MM``. The ``partitions.maintain`` job runs daily in
+the worker: it creates partitions ``partition_premake_months`` ahead (there is no
+default partition, so rows for a missing month are rejected), and retires
+partitions older than the table's retention by writing them to MinIO as gzipped
+JSON lines and then detaching and dropping them.
+
+Retiring keeps the derived totals intact: agent-session costs and counts are
+folded into ``journeys.archived_*`` in the same transaction as the drop, and
+``api_usage`` months are only dropped once ``api_usage_daily`` covers them.
+"""
+
+import gzip
+import logging
+import re
+import tempfile
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import unit_of_work
+from app.services.jobs import register_job, register_periodic
+from app.services.minio import get_minio_client, put_object
+from app.services.usage_rollup import rolled_through
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_JOB = "partitions.maintain"
+PARTITIONED_TABLES = ("agent_sessions", "api_usage")
+ARCHIVE_PREFIX = "archive"
+ARCHIVE_SPOOL_BYTES = 64 * 1024 * 1024
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    """The month a partition holds, or None if ``name`` is not one of ``table``'s monthly partitions."""
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})_(\d{{2}})", name)
+    if not match:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def retention_months(table: str) -> int:
+    return {
+        "agent_sessions": settings.agent_sessions_retention_months,
+        "api_usage": settings.api_usage_retention_months,
+    }[table]
+
+
+def _bound(month: date) -> str:
+    return datetime.combine(month, time.min, tzinfo=UTC).isoformat()
+
+
+async def list_partitions(db: AsyncSession, table: str) -> list[str]:
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table ORDER BY c.relname"
+        ),
+        {"table": table},
+    )
+    return list(result.scalars().all())
+
+
+async def ensure_partitions(db: AsyncSession, table: str, first: date, last: date) -> None:
+    """Create any missing monthly partitions of ``table`` for ``first``..``last``."""
+    month = month_start(first)
+    while month <= last:
+        # Names and bounds are generated here, never taken from input
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+            )
+        )
+        month = add_months(month, 1)
+
+
+async def archive_partition(table: str, name: str) -> str:
+    """Write every row of partition ``name`` to MinIO as gzipped JSON lines; returns the object key."""
+    key = f"{ARCHIVE_PREFIX}/{table}/{name}.jsonl.gz"
+    with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_BYTES) as spool:
+        rows = 0
+        with gzip.GzipFile(fileobj=spool, mode="wb") as archive:
+            async with unit_of_work() as db:
+                result = await db.stream(text(f"SELECT row_to_json(t)::text FROM {name} t"))
+                async for (line,) in result:
+                    archive.write(line.encode() + b"\n")
+                    rows += 1
+        length = spool.tell()
+        spool.seek(0)
+        await put_object(get_minio_client(), key, spool, "application/gzip", length=length)
+    logger.info("Archived %d rows of %s to %s (%d bytes)", rows, name, key, length)
+    return key
+
+
+async def _fold_session_totals(db: AsyncSession, name: str) -> None:
+    # Keep journey totals recomputable after the sessions themselves are gone
+    await db.execute(
+        text(
+            "UPDATE journeys j SET "
+            "archived_cost_cents = j.archived_cost_cents + s.cost_cents, "
+            "archived_sessions = j.archived_sessions + s.sessions "
+            "FROM ("
+            f"  SELECT p.journey_id, SUM(a.cost_cents) AS cost_cents, COUNT(*) AS sessions FROM {name} a "
+            "  JOIN perspectives p ON a.perspective_id = p.id GROUP BY p.journey_id"
+            ") s WHERE j.id = s.journey_id"
+        )
+    )
+
+
+async def drop_partition(db: AsyncSession, table: str, name: str) -> None:
+    if table == "agent_sessions":
+        await _fold_session_totals(db, name)
+    await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    await db.execute(text(f"DROP TABLE {name}"))
+
+
+async def retire_partition(table: str, name: str, month: date) -> bool:
+    """Archive and drop one expired partition. Returns False if it must be kept for now."""
+    if table == "api_usage":
+        async with unit_of_work() as db:
+            through = await rolled_through(db)
+        if through is None or through < add_months(month, 1) - timedelta(days=1):
+            logger.warning("Keeping %s: not yet covered by the daily usage rollup", name)
+            return False
+
+    await archive_partition(table, name)
+    async with unit_of_work() as db:
+        await drop_partition(db, table, name)
+    logger.info("Dropped partition %s", name)
+    return True
+
+
+@register_job(MAINTENANCE_JOB)
+async def maintain_partitions(payload: dict) -> None:
+    """Create upcoming monthly partitions and retire the ones past their retention."""
+    this_month = month_start(datetime.now(UTC).date())
+    for table in PARTITIONED_TABLES:
+        async with unit_of_work() as db:
+            await ensure_partitions(db, table, this_month, add_months(this_month, settings.partition_premake_months))
+            names = await list_partitions(db, table)
+
+        months = retention_months(table)
+        if months <= 0:
+            continue
+        cutoff = add_months(this_month, -months)
+        for name in names:
+            month = partition_month(table, name)
+            if month is not None and month < cutoff:
+                await retire_partition(table, name, month)
+
+
+register_periodic(MAINTENANCE_JOB, settings.partition_maintenance_interval_seconds)
@@ -21,6 +21,8 @@ def _validate_setting_value(key: str, value: Any) -> None:
         raise ValidationError(f"Unknown setting key: {key}")
 
     expected_type = ALLOWED_SETTINGS[key]
+    if expected_type is bool and not isinstance(value, bool):
+        raise ValidationError(f"Setting '{key}' must be a boolean")
     if expected_type is int and not isinstance(value, int):
         raise ValidationError(f"Setting '{key}' must be an integer")
     if expected_type is str and not isinstance(value, str):
@@ -68,6 +70,17 @@ async def get_settings(db: AsyncSession, org_id: uuid.UUID) -> SettingsResponse:
     return SettingsResponse(**settings_dict)
 
 
+async def get_setting_value(db: AsyncSession, org_id: uuid.UUID, key: str, default: Any = None) -> Any:
+    """Get a single organization setting value, or ``default`` if it has not been set."""
+    result = await db.execute(
+        select(Setting).where(Setting.organization_id == org_id, Setting.key == key)
+    )
+    setting = result.scalar_one_or_none()
+    if setting and "value" in setting.value:
+        return setting.value["value"]
+    return default
+
+
 async def get_raw_api_key(db: AsyncSession, org_id: uuid.UUID) -> str | None:
     """Get the unmasked Anthropic API key for an organization (for agent use)."""
     result = await db.execute(
@@ -1,12 +1,69 @@
 import uuid
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import cast, func, select
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.types import Date
 
 from app.models.api_usage import ApiUsage
+from app.models.api_usage_daily import ApiUsageDaily
 from app.schemas.settings import DailyUsage, UsageBreakdownResponse, UsageEntry, UsageSummaryResponse
+from app.services.agents.base import cache_savings_cents
+from app.services.usage_rollup import day_start, rolled_through, utc_day
+
+
+def _default_range(start_date: date | None, end_date: date | None) -> tuple[date, date]:
+    if not end_date:
+        end_date = datetime.now(UTC).date()
+    if not start_date:
+        start_date = end_date - timedelta(days=30)
+    return start_date, end_date
+
+
+def _usage_rows(org_id: uuid.UUID, start_date: date, end_date: date, through: date | None):
+    """Usage for ``start_date``..``end_date``: rollup rows up to ``through``, raw rows after it."""
+    parts = []
+    if through is not None and start_date <= through:
+        parts.append(
+            select(
+                ApiUsageDaily.day.label("day"),
+                ApiUsageDaily.service.label("service"),
+                ApiUsageDaily.model_name.label("model_name"),
+                ApiUsageDaily.endpoint.label("endpoint"),
+                ApiUsageDaily.calls.label("calls"),
+                ApiUsageDaily.tokens_in.label("tokens_in"),
+                ApiUsageDaily.tokens_out.label("tokens_out"),
+                ApiUsageDaily.cache_read_tokens.label("cache_read_tokens"),
+                ApiUsageDaily.cache_write_tokens.label("cache_write_tokens"),
+                ApiUsageDaily.cost_cents.label("cost_cents"),
+            ).where(
+                ApiUsageDaily.organization_id == org_id,
+                ApiUsageDaily.day >= start_date,
+                ApiUsageDaily.day <= min(end_date, through),
+            )
+        )
+
+    # Days not yet rolled up (normally just today): a range on created_at, so the
+    # (organization_id, created_at) index applies
+    raw_start = start_date if through is None else max(start_date, through + timedelta(days=1))
+    parts.append(
+        select(
+            utc_day(ApiUsage.created_at).label("day"),
+            ApiUsage.service.label("service"),
+            func.coalesce(ApiUsage.model_name, "").label("model_name"),
+            func.coalesce(ApiUsage.endpoint, "").label("endpoint"),
+            literal(1).label("calls"),
+            ApiUsage.tokens_in.label("tokens_in"),
+            ApiUsage.tokens_out.label("tokens_out"),
+            ApiUsage.cache_read_tokens.label("cache_read_tokens"),
+            ApiUsage.cache_write_tokens.label("cache_write_tokens"),
+            ApiUsage.cost_cents.label("cost_cents"),
+        ).where(
+            ApiUsage.organization_id == org_id,
+            ApiUsage.created_at >= day_start(raw_start),
+            ApiUsage.created_at < day_start(end_date + timedelta(days=1)),
+        )
+    )
+    return (union_all(*parts) if len(parts) > 1 else parts[0]).subquery("usage_rows")
 
 
 async def get_usage_summary(
@@ -15,21 +72,17 @@ async def get_usage_summary(
     start_date: date | None = None,
     end_date: date | None = None,
 ) -> UsageSummaryResponse:
-    if not end_date:
-        end_date = date.today()
-    if not start_date:
-        start_date = end_date - timedelta(days=30)
+    start_date, end_date = _default_range(start_date, end_date)
+    usage = _usage_rows(org_id, start_date, end_date, await rolled_through(db))
 
     # Totals
     totals_q = select(
-        func.coalesce(func.sum(ApiUsage.cost_cents), 0).label("total_cost"),
-        func.coalesce(func.sum(ApiUsage.tokens_in), 0).label("total_in"),
-        func.coalesce(func.sum(ApiUsage.tokens_out), 0).label("total_out"),
-        func.count(ApiUsage.id).label("total_calls"),
-    ).where(
-        ApiUsage.organization_id == org_id,
-        cast(ApiUsage.created_at, Date) >= start_date,
-        cast(ApiUsage.created_at, Date) <= end_date,
+        func.coalesce(func.sum(usage.c.cost_cents), 0).label("total_cost"),
+        func.coalesce(func.sum(usage.c.tokens_in), 0).label("total_in"),
+        func.coalesce(func.sum(usage.c.tokens_out), 0).label("total_out"),
+        func.coalesce(func.sum(usage.c.cache_read_tokens), 0).label("total_cache_read"),
+        func.coalesce(func.sum(usage.c.cache_write_tokens), 0).label("total_cache_write"),
+        func.coalesce(func.sum(usage.c.calls), 0).label("total_calls"),
     )
     totals_result = await db.execute(totals_q)
     totals = totals_result.one()
@@ -37,18 +90,13 @@ async def get_usage_summary(
     # Daily breakdown
     daily_q = (
         select(
-            cast(ApiUsage.created_at, Date).label("day"),
-            func.sum(ApiUsage.cost_cents).label("cost"),
-            func.sum(ApiUsage.tokens_in).label("t_in"),
-            func.sum(ApiUsage.tokens_out).label("t_out"),
-        )
-        .where(
-            ApiUsage.organization_id == org_id,
-            cast(ApiUsage.created_at, Date) >= start_date,
-            cast(ApiUsage.created_at, Date) <= end_date,
+            usage.c.day,
+            func.sum(usage.c.cost_cents).label("cost"),
+            func.sum(usage.c.tokens_in).label("t_in"),
+            func.sum(usage.c.tokens_out).label("t_out"),
         )
-        .group_by(cast(ApiUsage.created_at, Date))
-        .order_by(cast(ApiUsage.created_at, Date))
+        .group_by(usage.c.day)
+        .order_by(usage.c.day)
     )
     daily_result = await db.execute(daily_q)
     daily_rows = daily_result.all()
@@ -58,11 +106,15 @@ async def get_usage_summary(
         for row in daily_rows
     ]
 
+    cache_read, cache_write = int(totals.total_cache_read), int(totals.total_cache_write)
     return UsageSummaryResponse(
         total_cost_cents=float(totals.total_cost),
         total_tokens_in=int(totals.total_in),
         total_tokens_out=int(totals.total_out),
         total_calls=int(totals.total_calls),
+        total_cache_read_tokens=cache_read,
+        total_cache_write_tokens=cache_write,
+        cache_savings_cents=round(cache_savings_cents(cache_read, cache_write), 4),
         by_date=by_date,
     )
 
@@ -74,35 +126,28 @@ async def get_usage_breakdown(
     start_date: date | None = None,
     end_date: date | None = None,
 ) -> UsageBreakdownResponse:
-    if not end_date:
-        end_date = date.today()
-    if not start_date:
-        start_date = end_date - timedelta(days=30)
+    start_date, end_date = _default_range(start_date, end_date)
+    usage = _usage_rows(org_id, start_date, end_date, await rolled_through(db))
 
     if group_by == "service":
-        group_col = ApiUsage.service
+        group_col = usage.c.service
     elif group_by == "model":
-        group_col = ApiUsage.model_name
+        group_col = usage.c.model_name
     elif group_by == "endpoint":
-        group_col = ApiUsage.endpoint
+        group_col = usage.c.endpoint
     else:
-        group_col = ApiUsage.service
+        group_col = usage.c.service
 
     q = (
         select(
             group_col.label("name"),
-            func.sum(ApiUsage.cost_cents).label("cost"),
-            func.sum(ApiUsage.tokens_in).label("t_in"),
-            func.sum(ApiUsage.tokens_out).label("t_out"),
-            func.count(ApiUsage.id).label("calls"),
-        )
-        .where(
-            ApiUsage.organization_id == org_id,
-            cast(ApiUsage.created_at, Date) >= start_date,
-            cast(ApiUsage.created_at, Date) <= end_date,
+            func.sum(usage.c.cost_cents).label("cost"),
+            func.sum(usage.c.tokens_in).label("t_in"),
+            func.sum(usage.c.tokens_out).label("t_out"),
+            func.sum(usage.c.calls).label("calls"),
         )
         .group_by(group_col)
-        .order_by(func.sum(ApiUsage.cost_cents).desc())
+        .order_by(func.sum(usage.c.cost_cents).desc())
     )
     result = await db.execute(q)
     rows = result.all()
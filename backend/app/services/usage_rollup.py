@@ -0,0 +1,103 @@
+"""Daily rollup of ``api_usage`` into ``api_usage_daily``.
+
+The ``usage.rollup`` job runs periodically in the worker and compacts every
+completed (UTC) day into one row per (org, day, service, model, endpoint). The
+most recent rolled-up days are recomputed on each run so late rows, such as
+replayed telemetry, are still counted. Readers use the rollup up to
+``rolled_through`` and merge raw rows only for the days after it.
+"""
+
+import logging
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import unit_of_work
+from app.models.api_usage import ApiUsage
+from app.models.api_usage_daily import ApiUsageDaily
+from app.services.jobs import register_job, register_periodic
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_JOB = "usage.rollup"
+COMPACT_CHUNK_DAYS = 31
+
+_KEY = ("organization_id", "day", "service", "model_name", "endpoint")
+_TOTALS = ("calls", "tokens_in", "tokens_out", "cache_read_tokens", "cache_write_tokens", "cost_cents")
+
+
+def utc_day(column):
+    """The UTC calendar day of a timestamptz column."""
+    return cast(func.timezone("UTC", column), Date)
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+async def rolled_through(db: AsyncSession) -> date | None:
+    """The last day present in the rollup; later days must be read from ``api_usage``."""
+    result = await db.execute(select(func.max(ApiUsageDaily.day)))
+    return result.scalar_one()
+
+
+async def compact_days(db: AsyncSession, first: date, last: date) -> None:
+    """(Re)compute the rollup rows for ``first``..``last`` (inclusive) from the raw rows."""
+    day = utc_day(ApiUsage.created_at)
+    model_name = func.coalesce(ApiUsage.model_name, "")
+    endpoint = func.coalesce(ApiUsage.endpoint, "")
+    source = (
+        select(
+            func.gen_random_uuid(),
+            ApiUsage.organization_id,
+            day,
+            ApiUsage.service,
+            model_name,
+            endpoint,
+            func.count(),
+            func.sum(ApiUsage.tokens_in),
+            func.sum(ApiUsage.tokens_out),
+            func.sum(ApiUsage.cache_read_tokens),
+            func.sum(ApiUsage.cache_write_tokens),
+            func.sum(ApiUsage.cost_cents),
+        )
+        .where(ApiUsage.created_at >= day_start(first), ApiUsage.created_at < day_start(last + timedelta(days=1)))
+        .group_by(ApiUsage.organization_id, day, ApiUsage.service, model_name, endpoint)
+    )
+    stmt = pg_insert(ApiUsageDaily).from_select(["id", *_KEY, *_TOTALS], source)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=list(_KEY),
+            set_={name: stmt.excluded[name] for name in _TOTALS} | {"updated_at": func.now()},
+        )
+    )
+
+
+@register_job(ROLLUP_JOB)
+async def run_rollup(payload: dict) -> None:
+    """Compact every completed day not yet rolled up, re-rolling the last few."""
+    yesterday = datetime.now(UTC).date() - timedelta(days=1)
+    async with unit_of_work() as db:
+        through = await rolled_through(db)
+        if through is None:
+            oldest = (await db.execute(select(func.min(ApiUsage.created_at)))).scalar_one()
+            if oldest is None:
+                return
+            first = oldest.astimezone(UTC).date()
+        else:
+            first = through - timedelta(days=max(settings.usage_rollup_lookback_days, 1) - 1)
+
+    # Oldest chunk first, each committed on its own, so rolled_through only ever
+    # advances past days that are complete
+    while first <= yesterday:
+        last = min(first + timedelta(days=COMPACT_CHUNK_DAYS - 1), yesterday)
+        async with unit_of_work() as db:
+            await compact_days(db, first, last)
+        logger.info("Rolled up api_usage for %s..%s", first, last)
+        first = last + timedelta(days=1)
+
+
+register_periodic(ROLLUP_JOB, settings.usage_rollup_interval_seconds)
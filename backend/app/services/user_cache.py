@@ -0,0 +1,179 @@
+"""Short-lived cache of authenticated users, so most requests authenticate without a query.
+
+``load_user`` looks the token's user up in a bounded in-process LRU, then Redis,
+and only then in the database. Entries hold the columns routes read from the
+current user (never the password hash) and expire after
+``auth_cache_memory_ttl_seconds`` in memory and ``auth_cache_ttl_seconds`` in Redis.
+
+Code that changes a user's role, organization, password or profile must call
+``invalidate_user``. It drops this process's entry and replaces the Redis entry
+with a tombstone that also refuses new entries for ``INVALIDATION_HOLD_SECONDS``,
+so a request that read the row before the change committed cannot cache it
+again. Other processes drop their in-memory copy when it expires.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.lru import MemoryLRU
+from app.core.metrics import (
+    AUTH_CACHE_DB_LOOKUPS_SAVED,
+    AUTH_CACHE_ERRORS,
+    AUTH_CACHE_INVALIDATIONS,
+    AUTH_CACHE_LOOKUPS,
+)
+from app.core.redis import get_redis
+from app.models.enums import UserRole
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "incube:auth_user:"
+TOMBSTONE = "-"
+# Longer than a request holds an uncommitted change to a user
+INVALIDATION_HOLD_SECONDS = 30
+MEMORY_MAX_BYTES = 8 * 1024 * 1024
+
+_DATETIME_FIELDS = ("email_verified_at", "created_at", "updated_at")
+
+# Each UserCacheStats field, published as a Prometheus counter (see /api/metrics)
+_STAT_COUNTERS = {
+    "memory_hits": AUTH_CACHE_LOOKUPS.labels("memory_hit"),
+    "redis_hits": AUTH_CACHE_LOOKUPS.labels("redis_hit"),
+    "misses": AUTH_CACHE_LOOKUPS.labels("miss"),
+    "invalidations": AUTH_CACHE_INVALIDATIONS,
+    "errors": AUTH_CACHE_ERRORS,
+}
+
+
+@dataclass
+class UserCacheStats:
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    errors: int = 0
+
+    @property
+    def db_lookups_saved(self) -> int:
+        return self.memory_hits + self.redis_hits
+
+    def count(self, stat: str) -> None:
+        setattr(self, stat, getattr(self, stat) + 1)
+        _STAT_COUNTERS[stat].inc()
+        if stat in ("memory_hits", "redis_hits"):
+            AUTH_CACHE_DB_LOOKUPS_SAVED.inc()
+
+
+def _serialize(user: User) -> str:
+    return json.dumps({
+        "id": str(user.id),
+        "organization_id": str(user.organization_id),
+        "email": user.email,
+        "name": user.name,
+        "role": UserRole(user.role).value,
+        "avatar_url": user.avatar_url,
+        **{field: value.isoformat() if (value := getattr(user, field)) else None for field in _DATETIME_FIELDS},
+    })
+
+
+def _deserialize(raw: str) -> User:
+    """A detached User carrying the cached columns; ``password_hash`` is not among them."""
+    data = json.loads(raw)
+    return User(
+        id=uuid.UUID(data["id"]),
+        organization_id=uuid.UUID(data["organization_id"]),
+        email=data["email"],
+        name=data["name"],
+        role=UserRole(data["role"]),
+        avatar_url=data["avatar_url"],
+        **{field: datetime.fromisoformat(data[field]) if data[field] else None for field in _DATETIME_FIELDS},
+    )
+
+
+class UserCache:
+    """Two-tier (memory + Redis) user cache. Redis errors degrade to the memory tier and the database."""
+
+    def __init__(self, max_entries: int, memory_ttl_seconds: int, ttl_seconds: int):
+        self.memory_ttl_seconds = memory_ttl_seconds
+        self.ttl_seconds = ttl_seconds
+        self.stats = UserCacheStats()
+        self._memory = MemoryLRU(max_entries, MEMORY_MAX_BYTES)
+
+    async def get(self, user_id: uuid.UUID) -> User | None:
+        raw = self._memory.get(str(user_id))
+        if raw is not None:
+            self.stats.count("memory_hits")
+            return _deserialize(raw)
+
+        try:
+            raw = await get_redis().get(REDIS_KEY_PREFIX + str(user_id))
+        except Exception as exc:
+            self.stats.count("errors")
+            logger.warning("Auth cache Redis lookup failed: %s", exc)
+            raw = None
+
+        if raw is None or raw == TOMBSTONE:
+            self.stats.count("misses")
+            return None
+
+        self.stats.count("redis_hits")
+        self._memory.set(str(user_id), raw, self.memory_ttl_seconds)
+        return _deserialize(raw)
+
+    async def set(self, user: User) -> None:
+        raw = _serialize(user)
+        try:
+            # NX: an invalidation tombstone (or a fresher entry) wins
+            stored = await get_redis().set(REDIS_KEY_PREFIX + str(user.id), raw, ex=self.ttl_seconds, nx=True)
+        except Exception as exc:
+            self.stats.count("errors")
+            logger.warning("Auth cache Redis store failed: %s", exc)
+            stored = True
+        if stored:
+            self._memory.set(str(user.id), raw, self.memory_ttl_seconds)
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        self._memory.pop(str(user_id))
+        self.stats.count("invalidations")
+        try:
+            await get_redis().set(REDIS_KEY_PREFIX + str(user_id), TOMBSTONE, ex=INVALIDATION_HOLD_SECONDS)
+        except Exception as exc:
+            self.stats.count("errors")
+            logger.warning("Auth cache Redis invalidation failed: %s", exc)
+
+
+user_cache = UserCache(
+    max_entries=settings.auth_cache_memory_max_entries,
+    memory_ttl_seconds=settings.auth_cache_memory_ttl_seconds,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+
+
+async def load_user(db: AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The user with ``user_id``, from the cache when possible."""
+    if settings.auth_cache_enabled:
+        user = await user_cache.get(user_id)
+        if user is not None:
+            return user
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if user is not None and settings.auth_cache_enabled:
+        await user_cache.set(user)
+    return user
+
+
+async def invalidate_user(user_id: uuid.UUID) -> None:
+    """Forget a cached user after changing their role, organization, password or profile."""
+    if settings.auth_cache_enabled:
+        await user_cache.invalidate(user_id)
@@ -5,12 +5,15 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import NotFoundError, ValidationError
+from app.db.pagination import paginate
 from app.models.bank_instance import BankInstance
 from app.models.enums import BankType, JourneyStatus, PerspectiveStatus
 from app.models.journey import Journey
 from app.models.perspective import Perspective
 from app.models.vdba import Vdba
+from app.schemas.common import CountMode, PaginationMeta
 from app.schemas.vdba import VdbaCreate
+from app.services import dashboard_stats
 from app.services.notify import notify_vdba_published
 
 
@@ -95,11 +98,15 @@ async def publish_journey(
     db.add(vdba)
 
     # Mark journey as completed
+    old_status = journey.status
     journey.status = JourneyStatus.COMPLETED.value
     journey.completed_at = datetime.now(UTC)
     journey.perspectives_completed = 12
 
     await db.flush()
+    await dashboard_stats.bump(
+        db, org_id, total_vdbas=1, **dashboard_stats.journey_status_deltas(old_status, journey.status),
+    )
 
     if user_id:
         await notify_vdba_published(db, org_id, user_id, body.title)
@@ -112,19 +119,14 @@ async def list_vdbas(
     org_id: uuid.UUID,
     page: int = 1,
     per_page: int = 20,
-) -> tuple[list[Vdba], int]:
-    """List VDBAs for an organization with pagination."""
+    cursor: str | None = None,
+    count: CountMode | None = None,
+) -> tuple[list[Vdba], PaginationMeta]:
+    """List VDBAs for an organization, most recently published first, with pagination."""
     base = select(Vdba).where(Vdba.organization_id == org_id)
-
-    total_result = await db.execute(select(func.count()).select_from(base.subquery()))
-    total = total_result.scalar_one()
-
-    offset = (page - 1) * per_page
-    result = await db.execute(
-        base.order_by(Vdba.published_at.desc()).offset(offset).limit(per_page)
+    return await paginate(
+        db, base, Vdba.published_at, Vdba.id, page=page, per_page=per_page, cursor=cursor, count=count
     )
-    vdbas = list(result.scalars().all())
-    return vdbas, total
 
 
 async def get_vdba(
@@ -7,20 +7,28 @@ import json
 import logging
 import time
 import uuid
+from dataclasses import dataclass
 
 import anthropic
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.config import settings
 from app.core.errors import NotFoundError
+from app.db.session import unit_of_work
 from app.models.agent_session import AgentSession
+from app.models.journey import Journey
 from app.models.perspective import Perspective
 from app.models.vibe_analysis import VibeAnalysis
 from app.models.vibe_session import VibeSession
-from app.services.agents.base import COST_PER_INPUT_TOKEN, COST_PER_OUTPUT_TOKEN
+from app.schemas.common import decode_cursor, encode_cursor
+from app.schemas.vibe import VibeSessionResponse
+from app.services.agents.base import cacheable_system, token_cost_cents
+from app.services.agents.client import get_anthropic_client, llm_slot
 from app.services.agents.prompts import VALID_AGENT_NAMES
-from app.services.vibe_minio import download_audio, ensure_bucket, get_minio_client, upload_audio
+from app.services.dashboard_stats import bump_for_perspective, record_agent_costs
+from app.services.minio import download_audio, get_minio_client, upload_audio
 from app.services.vibe_prompts import VIBE_ANALYSIS_SYSTEM, build_vibe_analysis_prompt
 from app.services.whisper import transcribe_audio
 
@@ -36,7 +44,6 @@ async def create_vibe_session(
 ) -> VibeSession:
     """Upload audio to MinIO and create a VibeSession record."""
     client = get_minio_client()
-    await ensure_bucket(client)
     minio_key = await upload_audio(client, audio_data, str(perspective_id))
 
     session = VibeSession(
@@ -48,56 +55,74 @@ async def create_vibe_session(
     )
     db.add(session)
     await db.flush()
+    await bump_for_perspective(db, perspective_id, total_vibes=1)
     return session
 
 
-async def transcribe_vibe(db: AsyncSession, vibe_session_id: uuid.UUID) -> None:
-    """Run Whisper transcription on a vibe session's audio."""
+async def transcribe_vibe(db: AsyncSession, vibe_session_id: uuid.UUID) -> VibeSession:
+    """Run Whisper transcription on a vibe session's audio.
+
+    Safe to retry: if a transcript is already stored, Whisper is not called again.
+    Post-vibe analysis runs as a separate job stage (see ``vibe_jobs``).
+    """
     result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_session_id))
     vibe = result.scalar_one_or_none()
     if not vibe:
         raise NotFoundError(f"Vibe session {vibe_session_id} not found")
 
-    # Download audio from MinIO
-    client = get_minio_client()
-    audio_data = await download_audio(client, vibe.audio_minio_key)
+    if vibe.transcript_text is None:
+        # Download audio from MinIO
+        client = get_minio_client()
+        audio_data = await download_audio(client, vibe.audio_minio_key)
 
-    # Transcribe
-    transcription = await transcribe_audio(audio_data)
+        # Transcribe
+        transcription = await transcribe_audio(audio_data)
+        vibe.transcript_text = transcription["text"]
+        vibe.transcription_cost_cents = transcription["cost_cents"]
 
-    # Update vibe session
-    vibe.transcript_text = transcription["text"]
-    vibe.transcription_cost_cents = transcription["cost_cents"]
     vibe.status = "analyzing"
     await db.flush()
+    return vibe
+
 
-    # Run post-vibe analysis
-    await run_post_vibe_analysis(db, vibe_session_id)
+@dataclass
+class _AgentAnalysisResult:
+    """One agent's post-vibe output, buffered until the bulk write."""
+
+    agent_name: str
+    model: str
+    content_text: str
+    content_json: dict
+    input_tokens: int
+    output_tokens: int
+    cost_cents: float
+    duration_ms: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 async def _run_single_agent_analysis(
     agent_name: str,
     transcript: str,
-    perspective: Perspective,
-    vibe_session_id: uuid.UUID,
-    db: AsyncSession,
-) -> VibeAnalysis | None:
-    """Run a single agent's post-vibe analysis and save results."""
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    dimension: str | None,
+    phase: str | None,
+    organization_id: uuid.UUID | None = None,
+) -> _AgentAnalysisResult | None:
+    """Run a single agent's post-vibe analysis. Touches no DB state so calls can run in parallel."""
+    client = get_anthropic_client()
     model = settings.default_agent_model
 
-    user_prompt = build_vibe_analysis_prompt(
-        agent_name, transcript, dimension=perspective.dimension, phase=perspective.phase
-    )
+    user_prompt = build_vibe_analysis_prompt(agent_name, transcript, dimension=dimension, phase=phase)
 
     start = time.monotonic()
     try:
-        response = await client.messages.create(
-            model=model,
-            max_tokens=4096,
-            system=VIBE_ANALYSIS_SYSTEM,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
+        async with llm_slot(organization_id):
+            response = await client.messages.create(
+                model=model,
+                max_tokens=4096,
+                system=cacheable_system(VIBE_ANALYSIS_SYSTEM),
+                messages=[{"role": "user", "content": user_prompt}],
+            )
     except anthropic.APIError:
         logger.exception("Anthropic API error for vibe analysis agent %s", agent_name)
         return None
@@ -106,7 +131,9 @@ async def _run_single_agent_analysis(
     content_text = response.content[0].text
     input_tokens = response.usage.input_tokens
     output_tokens = response.usage.output_tokens
-    cost_cents = (input_tokens * COST_PER_INPUT_TOKEN + output_tokens * COST_PER_OUTPUT_TOKEN) * 100
+    cache_read_tokens = response.usage.cache_read_input_tokens or 0
+    cache_write_tokens = response.usage.cache_creation_input_tokens or 0
+    cost_cents = token_cost_cents(input_tokens, output_tokens, cache_read_tokens, cache_write_tokens)
 
     # Parse JSON content — handle markdown-wrapped JSON
     try:
@@ -125,81 +152,164 @@ async def _run_single_agent_analysis(
             "suggestedEdits": [],
         }
 
-    # Save agent session for tracking
-    agent_session = AgentSession(
-        perspective_id=perspective.id,
+    return _AgentAnalysisResult(
         agent_name=agent_name,
-        model_used=model,
-        system_prompt_version="v1",
+        model=model,
+        content_text=content_text,
+        content_json=content_json,
         input_tokens=input_tokens,
         output_tokens=output_tokens,
         cost_cents=round(cost_cents, 4),
-        request_payload={"type": "post_vibe", "vibe_session_id": str(vibe_session_id)},
-        response_payload={"content": content_text},
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
         duration_ms=duration_ms,
     )
-    db.add(agent_session)
+
+
+async def _save_vibe_analyses(
+    db: AsyncSession,
+    vibe: VibeSession,
+    results: list[_AgentAnalysisResult],
+) -> None:
+    """Replace the session's analyses with ``results`` and mark it complete."""
+    # Delete existing analyses for this session (in case of re-analysis)
+    await db.execute(delete(VibeAnalysis).where(VibeAnalysis.vibe_session_id == vibe.id))
+
+    agent_sessions = [
+        AgentSession(
+            id=uuid.uuid4(),
+            perspective_id=vibe.perspective_id,
+            agent_name=r.agent_name,
+            model_used=r.model,
+            system_prompt_version="v1",
+            input_tokens=r.input_tokens,
+            output_tokens=r.output_tokens,
+            cache_read_tokens=r.cache_read_tokens,
+            cache_write_tokens=r.cache_write_tokens,
+            cost_cents=r.cost_cents,
+            request_payload={"type": "post_vibe", "vibe_session_id": str(vibe.id)},
+            response_payload={"content": r.content_text},
+            duration_ms=r.duration_ms,
+        )
+        for r in results
+    ]
+    db.add_all(agent_sessions)
     await db.flush()
+    await record_agent_costs(db, [(s.perspective_id, s.cost_cents) for s in agent_sessions])
+
+    db.add_all([
+        VibeAnalysis(
+            vibe_session_id=vibe.id,
+            agent_name=r.agent_name,
+            analysis_type="post_vibe",
+            content=r.content_json,
+            agent_session_id=agent_session.id,
+        )
+        for r, agent_session in zip(results, agent_sessions, strict=True)
+    ])
 
-    # Save vibe analysis record
-    analysis = VibeAnalysis(
-        vibe_session_id=vibe_session_id,
-        agent_name=agent_name,
-        analysis_type="post_vibe",
-        content=content_json,
-        agent_session_id=agent_session.id,
-    )
-    db.add(analysis)
+    vibe.status = "complete"
     await db.flush()
-    return analysis
 
 
-async def run_post_vibe_analysis(db: AsyncSession, vibe_session_id: uuid.UUID) -> None:
-    """Run all 9 agents on the transcript in parallel."""
-    result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_session_id))
-    vibe = result.scalar_one_or_none()
-    if not vibe:
-        raise NotFoundError(f"Vibe session {vibe_session_id} not found")
+async def run_post_vibe_analysis(vibe_session_id: uuid.UUID) -> None:
+    """Run all 9 agents on the transcript in parallel.
 
-    if not vibe.transcript_text:
-        raise ValueError("Vibe session has no transcript — transcribe first")
+    Context is read and results are written in two short units of work; no session
+    (or pooled connection) is held while the agents are waiting on the LLM.
+    """
+    async with unit_of_work() as db:
+        result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_session_id))
+        vibe = result.scalar_one_or_none()
+        if not vibe:
+            raise NotFoundError(f"Vibe session {vibe_session_id} not found")
 
-    # Get perspective for context
-    p_result = await db.execute(select(Perspective).where(Perspective.id == vibe.perspective_id))
-    perspective = p_result.scalar_one_or_none()
-    if not perspective:
-        raise NotFoundError(f"Perspective {vibe.perspective_id} not found")
+        if not vibe.transcript_text:
+            raise ValueError("Vibe session has no transcript — transcribe first")
 
-    # Delete existing analyses for this session (in case of re-analysis)
-    existing = await db.execute(
-        select(VibeAnalysis).where(VibeAnalysis.vibe_session_id == vibe_session_id)
-    )
-    for old_analysis in existing.scalars().all():
-        await db.delete(old_analysis)
-    await db.flush()
+        # Get perspective for context
+        p_result = await db.execute(select(Perspective).where(Perspective.id == vibe.perspective_id))
+        perspective = p_result.scalar_one_or_none()
+        if not perspective:
+            raise NotFoundError(f"Perspective {vibe.perspective_id} not found")
+
+        # Organization scopes the per-org LLM concurrency slot
+        org_result = await db.execute(select(Journey.organization_id).where(Journey.id == perspective.journey_id))
+        organization_id = org_result.scalar_one_or_none()
 
-    # Run all agents in parallel
-    # Note: we use asyncio.gather but each coroutine shares the same db session,
-    # which is acceptable for SQLAlchemy async sessions with careful flushing.
-    tasks = [
-        _run_single_agent_analysis(name, vibe.transcript_text, perspective, vibe_session_id, db)
+        transcript = vibe.transcript_text
+        dimension, phase = perspective.dimension, perspective.phase
+
+    # Run all agents in parallel; results are buffered and written in one batch
+    outcomes = await asyncio.gather(*(
+        _run_single_agent_analysis(name, transcript, dimension, phase, organization_id)
         for name in VALID_AGENT_NAMES
-    ]
-    await asyncio.gather(*tasks)
+    ))
+    results = [r for r in outcomes if r is not None]
 
-    # Mark complete
-    vibe.status = "complete"
-    await db.flush()
+    async with unit_of_work() as db:
+        result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_session_id))
+        vibe = result.scalar_one_or_none()
+        if not vibe:
+            raise NotFoundError(f"Vibe session {vibe_session_id} not found")
+        await _save_vibe_analyses(db, vibe, results)
 
 
-async def list_vibe_sessions(db: AsyncSession, perspective_id: uuid.UUID) -> list[VibeSession]:
-    """List vibe sessions for a perspective, newest first."""
-    result = await db.execute(
-        select(VibeSession)
+async def list_vibe_sessions(
+    db: AsyncSession,
+    perspective_id: uuid.UUID,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[VibeSessionResponse], str | None]:
+    """List vibe sessions for a perspective, newest first, with their analysis counts.
+
+    One query: counts come from a grouped subquery and ``transcript_text`` is never
+    loaded, only tested for NULL. With ``limit``, returns a page plus the cursor for
+    the next one (None on the last page); pass it back as ``cursor``.
+    """
+    in_perspective = select(VibeSession.id).where(VibeSession.perspective_id == perspective_id)
+    counts = (
+        select(VibeAnalysis.vibe_session_id, func.count().label("analyses_count"))
+        .where(VibeAnalysis.vibe_session_id.in_(in_perspective))
+        .group_by(VibeAnalysis.vibe_session_id)
+        .subquery()
+    )
+    query = (
+        select(
+            VibeSession,
+            VibeSession.transcript_text.is_not(None).label("has_transcript"),
+            func.coalesce(counts.c.analyses_count, 0).label("analyses_count"),
+        )
+        .outerjoin(counts, counts.c.vibe_session_id == VibeSession.id)
+        .options(load_only(VibeSession.id, VibeSession.duration_seconds, VibeSession.status, VibeSession.created_at))
         .where(VibeSession.perspective_id == perspective_id)
-        .order_by(VibeSession.created_at.desc())
+        .order_by(VibeSession.created_at.desc(), VibeSession.id.desc())
     )
-    return list(result.scalars().all())
+    if cursor is not None:
+        query = query.where(tuple_(VibeSession.created_at, VibeSession.id) < tuple_(*decode_cursor(cursor)))
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1].VibeSession
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    items = [
+        VibeSessionResponse(
+            id=row.VibeSession.id,
+            duration_seconds=row.VibeSession.duration_seconds,
+            status=row.VibeSession.status,
+            has_transcript=row.has_transcript,
+            analyses_count=row.analyses_count,
+            created_at=row.VibeSession.created_at,
+        )
+        for row in rows
+    ]
+    return items, next_cursor
 
 
 async def get_vibe_session_detail(db: AsyncSession, vibe_id: uuid.UUID) -> dict:
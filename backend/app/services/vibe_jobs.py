@@ -0,0 +1,68 @@
+"""Background job stages for vibe processing: transcribe -> analyze.
+
+Each stage runs in its own DB transaction and records its progress on
+``VibeSession.status``. A stage that fails is retried by the job queue; once
+all attempts are exhausted the session is marked ``failed``.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+
+from sqlalchemy import select
+
+from app.core.errors import NotFoundError
+from app.db.session import async_session_factory
+from app.models.vibe_session import VibeSession
+from app.services.jobs import NonRetryableJobError, enqueue, register_job
+from app.services.vibe import run_post_vibe_analysis, transcribe_vibe
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIBE_JOB = "vibe.transcribe"
+ANALYZE_JOB = "vibe.analyze"
+
+
+async def enqueue_transcription(vibe_session_id: uuid.UUID) -> str:
+    """Queue the transcribe stage (which queues analysis on success). Returns the job id."""
+    return await enqueue(TRANSCRIBE_JOB, {"vibe_session_id": str(vibe_session_id)})
+
+
+async def enqueue_analysis(vibe_session_id: uuid.UUID) -> str:
+    """Queue the post-vibe analysis stage. Returns the job id."""
+    return await enqueue(ANALYZE_JOB, {"vibe_session_id": str(vibe_session_id)})
+
+
+async def _mark_failed(payload: dict) -> None:
+    vibe_session_id = uuid.UUID(payload["vibe_session_id"])
+    async with async_session_factory() as db:
+        result = await db.execute(select(VibeSession).where(VibeSession.id == vibe_session_id))
+        vibe = result.scalar_one_or_none()
+        if vibe:
+            vibe.status = "failed"
+            await db.commit()
+
+
+@register_job(TRANSCRIBE_JOB, on_failure=_mark_failed)
+async def transcribe_stage(payload: dict) -> None:
+    vibe_session_id = uuid.UUID(payload["vibe_session_id"])
+    async with async_session_factory() as db:
+        try:
+            await transcribe_vibe(db, vibe_session_id)
+        except NotFoundError as exc:
+            raise NonRetryableJobError(str(exc)) from exc
+        await db.commit()
+
+    # Transcript is committed, so a retry of this stage skips Whisper and only re-enqueues
+    await enqueue_analysis(vibe_session_id)
+
+
+@register_job(ANALYZE_JOB, on_failure=_mark_failed)
+async def analyze_stage(payload: dict) -> None:
+    vibe_session_id = uuid.UUID(payload["vibe_session_id"])
+    try:
+        # Manages its own short-lived sessions around the LLM fan-out
+        await run_post_vibe_analysis(vibe_session_id)
+    except (NotFoundError, ValueError) as exc:
+        raise NonRetryableJobError(str(exc)) from exc
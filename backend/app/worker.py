@@ -0,0 +1,45 @@
+"""Background job worker entry point.
+
+Run with: python -m app.worker
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.core.logging_config import configure_logging
+from app.core.redis import close_redis
+from app.core.tracing import configure_tracing, shutdown_tracing
+from app.db.session import engine
+from app.services import boomerang_runs, partitions, usage_rollup, vibe_jobs  # noqa: F401  (registers job handlers)
+from app.services.agents import telemetry  # noqa: F401  (registers the telemetry replay job)
+from app.services.agents.client import close_anthropic_client
+from app.services.jobs import run_worker
+from app.services.minio import close_minio_client
+
+configure_logging(settings)
+configure_tracing(settings, "incube-worker")
+logger = logging.getLogger("incube.worker")
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Worker starting with concurrency=%d", settings.worker_concurrency)
+    try:
+        await run_worker(stop)
+    finally:
+        await close_anthropic_client()
+        await close_redis()
+        await close_minio_client()
+        await engine.dispose()
+        shutdown_tracing()
+    logger.info("Worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
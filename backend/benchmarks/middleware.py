@@ -0,0 +1,175 @@
+"""Benchmark the per-request cost of the request-ID and logging middleware.
+
+Drives a minimal Starlette app directly through ASGI (no server, no sockets) with
+three middleware stacks: none, the previous ``BaseHTTPMiddleware`` pair
+(reproduced below), and the current pure-ASGI pair. Each scenario sends
+``--requests`` requests per run; the report is the median time per request and
+the overhead over the bare app. Log records are formatted (with the app's text
+formatter) and discarded, so formatting cost is included.
+
+Run with: python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core import logging_middleware
+from app.core.logging_config import DATE_FORMAT, TEXT_FORMAT, TextFormatter
+from app.core.logging_middleware import LoggingMiddleware
+from app.core.middleware import RequestIDMiddleware
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous LoggingMiddleware: request and response records, error bodies drained and replayed."""
+
+    async def dispatch(self, request, call_next):
+        request_id = getattr(request.state, "request_id", "unknown")
+        start = time.monotonic()
+        body = None
+        if request.method in logging_middleware.BODY_METHODS:
+            body = (await request.body()).decode("utf-8", errors="replace")[:1000] or None
+        logger = logging_middleware.logger
+        logger.info(f"[{request_id}] REQUEST  | {request.method} {request.url.path}\n  body={body}")
+        response = await call_next(request)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        response_body = None
+        if response.status_code >= 400:
+            parts = [chunk async for chunk in response.body_iterator]
+            full = b"".join(part if isinstance(part, bytes) else part.encode() for part in parts)
+
+            async def replay():
+                yield full
+
+            response.body_iterator = replay()
+            response_body = full.decode("utf-8", errors="replace")
+        level = logging.WARNING if response.status_code >= 400 else logging.INFO
+        logger.log(
+            level,
+            f"[{request_id}] RESPONSE | {request.method} {request.url.path} | {response.status_code} | "
+            f"{elapsed_ms:.1f}ms\n  response_body={response_body}",
+        )
+        return response
+
+
+class _DiscardHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+async def _ok(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok"})
+
+
+async def _create(request: Request) -> JSONResponse:
+    return JSONResponse(await request.json(), status_code=201)
+
+
+async def _missing(request: Request) -> JSONResponse:
+    return JSONResponse({"error": {"code": "NOT_FOUND", "message": "Goal not found"}}, status_code=404)
+
+
+def _app(stack: str) -> Starlette:
+    app = Starlette(routes=[
+        Route("/ok", _ok),
+        Route("/create", _create, methods=["POST"]),
+        Route("/missing", _missing),
+    ])
+    if stack == "legacy":
+        # Added innermost first, as main.py does
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyRequestIDMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+async def _request(app: Starlette, method: str, path: str, body: bytes = b"") -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        # Never disconnects; middleware listening for it is cancelled when the response ends
+        await asyncio.Future()
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def _per_request_us(app: Starlette, scenario: tuple, requests: int, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(requests):
+            await _request(app, *scenario)
+        samples.append((time.perf_counter() - start) / requests * 1e6)
+    return statistics.median(samples)
+
+
+async def main(requests: int, runs: int) -> None:
+    logger = logging_middleware.logger
+    handler = _DiscardHandler()
+    handler.setFormatter(TextFormatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    scenarios = {
+        "GET 200": ("GET", "/ok"),
+        "POST 201 (JSON body)": ("POST", "/create", b'{"title": "Grow revenue", "type": "custom"}'),
+        "GET 404 (error body)": ("GET", "/missing"),
+    }
+    apps = {stack: _app(stack) for stack in ("bare", "legacy", "asgi")}
+    for label, scenario in scenarios.items():
+        times = {stack: await _per_request_us(app, scenario, requests, runs) for stack, app in apps.items()}
+        legacy, asgi = times["legacy"] - times["bare"], times["asgi"] - times["bare"]
+        print(f"{label}:")
+        print(f"  bare app                 {times['bare']:8.1f} us/request")
+        print(f"  BaseHTTPMiddleware pair  {times['legacy']:8.1f} us/request  (+{legacy:.1f} us)")
+        print(f"  pure ASGI pair           {times['asgi']:8.1f} us/request  (+{asgi:.1f} us)")
+        if asgi > 0:
+            print(f"  overhead reduced {legacy / asgi:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="requests per run")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.runs))
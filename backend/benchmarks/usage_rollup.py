@@ -0,0 +1,147 @@
+"""Benchmark the usage endpoints' queries: raw ``api_usage`` scan vs the daily rollup.
+
+Seeds a scratch organization with ``--rows`` usage rows spread over ``--days``
+days, then times the legacy summary/breakdown queries (``cast(created_at, Date)``
+filters over raw rows) against ``usage.get_usage_summary``/``get_usage_breakdown``
+reading ``api_usage_daily``. Runs against ``DATABASE_URL``; the scratch org is
+deleted afterwards unless ``--keep`` is given.
+
+Run with: python -m benchmarks.usage_rollup --rows 10000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+
+from app.db.session import engine, unit_of_work
+from app.services import usage as usage_service
+from app.services.usage_rollup import compact_days
+
+LEGACY_SUMMARY = text("""
+    SELECT COALESCE(SUM(cost_cents), 0), COALESCE(SUM(tokens_in), 0), COALESCE(SUM(tokens_out), 0), COUNT(id)
+    FROM api_usage
+    WHERE organization_id = :org AND CAST(created_at AS DATE) >= :start AND CAST(created_at AS DATE) <= :end
+""")
+LEGACY_DAILY = text("""
+    SELECT CAST(created_at AS DATE) AS day, SUM(cost_cents), SUM(tokens_in), SUM(tokens_out)
+    FROM api_usage
+    WHERE organization_id = :org AND CAST(created_at AS DATE) >= :start AND CAST(created_at AS DATE) <= :end
+    GROUP BY CAST(created_at AS DATE) ORDER BY CAST(created_at AS DATE)
+""")
+LEGACY_BREAKDOWN = text("""
+    SELECT model_name, SUM(cost_cents), SUM(tokens_in), SUM(tokens_out), COUNT(id)
+    FROM api_usage
+    WHERE organization_id = :org AND CAST(created_at AS DATE) >= :start AND CAST(created_at AS DATE) <= :end
+    GROUP BY model_name ORDER BY SUM(cost_cents) DESC
+""")
+
+SEED = text("""
+    INSERT INTO api_usage (
+        id, organization_id, user_id, service, model_name, tokens_in, tokens_out,
+        cache_read_tokens, cache_write_tokens, cost_cents, endpoint, cached, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), :org, :user, 'claude',
+        (ARRAY['claude-sonnet-4-5', 'claude-haiku-4-5', 'claude-opus-4-1'])[1 + (g % 3)],
+        500 + (g % 1500), 100 + (g % 800), (g % 4) * 1000, 0, 0.25 + (g % 100) / 100.0,
+        (ARRAY['agents/chat', 'boomerang/specialist/lyra', 'axiom/verdict', 'vibe/analysis'])[1 + (g % 4)],
+        false,
+        now() - (random() * :days || ' days')::interval,
+        now()
+    FROM generate_series(1, :rows) AS g
+""")
+
+
+async def _timed(label: str, runs: int, fn) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(samples)
+    print(f"  {label:<34} median {median:9.1f} ms  (min {min(samples):.1f}, max {max(samples):.1f})")
+    return median
+
+
+async def main(rows: int, days: int, runs: int, keep: bool) -> None:
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+    async with unit_of_work() as db:
+        await db.execute(
+            text("INSERT INTO organizations (id, name, slug) VALUES (:id, 'Usage benchmark', :slug)"),
+            {"id": org_id, "slug": f"usage-bench-{org_id.hex[:8]}"},
+        )
+        await db.execute(
+            text(
+                "INSERT INTO users (id, organization_id, email, name, password_hash, role) "
+                "VALUES (:id, :org, :email, 'Benchmark', 'x', 'viewer')"
+            ),
+            {"id": user_id, "org": org_id, "email": f"bench-{user_id.hex[:8]}@example.com"},
+        )
+
+    print(f"Seeding {rows:,} api_usage rows over {days} days...")
+    start = time.perf_counter()
+    async with unit_of_work() as db:
+        await db.execute(SEED, {"org": org_id, "user": user_id, "rows": rows, "days": days})
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE api_usage"))
+    print(f"  seeded in {time.perf_counter() - start:.1f}s")
+
+    today = datetime.now(UTC).date()
+    first, yesterday = today - timedelta(days=days + 1), today - timedelta(days=1)
+    params = {"org": org_id, "start": today - timedelta(days=30), "end": today}
+
+    try:
+        print("Legacy (raw api_usage, cast(created_at, Date) filters):")
+
+        async def legacy_summary():
+            async with unit_of_work() as db:
+                await db.execute(LEGACY_SUMMARY, params)
+                await db.execute(LEGACY_DAILY, params)
+
+        async def legacy_breakdown():
+            async with unit_of_work() as db:
+                await db.execute(LEGACY_BREAKDOWN, params)
+
+        old_summary = await _timed("summary (totals + daily)", runs, legacy_summary)
+        old_breakdown = await _timed("breakdown by model", runs, legacy_breakdown)
+
+        start = time.perf_counter()
+        async with unit_of_work() as db:
+            await compact_days(db, first, yesterday)
+        print(f"Compacted {first}..{yesterday} in {time.perf_counter() - start:.1f}s")
+
+        print("Rollup (api_usage_daily + today's raw rows):")
+
+        async def rollup_summary():
+            async with unit_of_work() as db:
+                await usage_service.get_usage_summary(db, org_id)
+
+        async def rollup_breakdown():
+            async with unit_of_work() as db:
+                await usage_service.get_usage_breakdown(db, org_id, group_by="model")
+
+        new_summary = await _timed("summary (totals + daily)", runs, rollup_summary)
+        new_breakdown = await _timed("breakdown by model", runs, rollup_breakdown)
+
+        print(f"Speedup: summary {old_summary / new_summary:.1f}x, breakdown {old_breakdown / new_breakdown:.1f}x")
+    finally:
+        if not keep:
+            async with unit_of_work() as db:
+                await db.execute(text("DELETE FROM organizations WHERE id = :id"), {"id": org_id})
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded organization and its rows")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.days, args.runs, args.keep))
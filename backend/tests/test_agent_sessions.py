@@ -0,0 +1,56 @@
+"""Tests for the latest-output-per-agent loader."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import boomerang
+from app.services.agent_sessions import latest_agent_outputs, latest_per_agent_query
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_latest_per_agent_query_uses_distinct_on():
+    sql = _sql(latest_per_agent_query(uuid.uuid4(), agent_names=["lyra", "mira"]))
+
+    assert "SELECT DISTINCT ON (agent_sessions.agent_name)" in sql
+    assert "ORDER BY agent_sessions.agent_name, agent_sessions.created_at DESC" in sql
+    assert "agent_sessions.agent_name IN" in sql
+
+
+@pytest.mark.asyncio
+async def test_latest_agent_outputs_reads_only_content():
+    db = MagicMock()
+    result = MagicMock()
+    result.all.return_value = [("dex", "dex output"), ("lyra", ""), ("mira", None)]
+    db.execute = AsyncMock(return_value=result)
+
+    outputs = await latest_agent_outputs(db, uuid.uuid4())
+
+    db.execute.assert_awaited_once()
+    sql = _sql(db.execute.await_args.args[0])
+    assert "agent_sessions.response_payload ->> " in sql
+    assert "request_payload" not in sql
+    # Agents whose latest output is empty are left out
+    assert outputs == {"dex": "dex output"}
+
+
+@pytest.mark.asyncio
+async def test_run_boomerang_with_audit_loads_outputs_once():
+    db = MagicMock()
+    outputs = {"lyra": "- finding one\n- finding two", "vela": "A short note."}
+    with (
+        patch.object(boomerang, "latest_agent_outputs", AsyncMock(return_value=outputs)) as mock_latest,
+        patch.object(boomerang, "_build_decision_audit", AsyncMock(return_value=[])),
+    ):
+        result = await boomerang.run_boomerang_with_audit(db, uuid.uuid4())
+
+    mock_latest.assert_awaited_once()
+    assert set(mock_latest.await_args.args[2]) == set(boomerang.SPECIALIST_NAMES)
+    # Reported in specialist order
+    assert result.agents_completed == [n for n in boomerang.SPECIALIST_NAMES if n in outputs]
+    assert result.agent_assessments["lyra"]["key_findings"] == ["finding one", "finding two"]
@@ -194,6 +194,113 @@ def test_cost_calculation():
     assert abs(cost_cents - 125.0) < 0.001
 
 
+def test_prompt_cache_token_pricing():
+    from app.services.agents.base import cache_savings_cents, token_cost_cents
+
+    # Cache reads bill at 10% of input, writes at 125%
+    assert abs(token_cost_cents(0, 0, cache_read_tokens=1_000_000) - 2.5) < 0.001
+    assert abs(token_cost_cents(0, 0, cache_write_tokens=1_000_000) - 31.25) < 0.001
+    # 1M reads save 22.5 cents; one 100K write costs 0.625 cents extra
+    assert abs(cache_savings_cents(1_000_000, 100_000) - 21.875) < 0.001
+
+
+def test_cacheable_system_marks_prompt_for_caching():
+    from unittest.mock import patch
+
+    from app.services.agents.base import cacheable_system
+
+    with patch("app.services.agents.base.settings.llm_prompt_caching", True):
+        blocks = cacheable_system("persona")
+    assert blocks == [{"type": "text", "text": "persona", "cache_control": {"type": "ephemeral"}}]
+
+    with patch("app.services.agents.base.settings.llm_prompt_caching", False):
+        assert cacheable_system("persona") == "persona"
+
+
+# --- Streaming latency ---
+
+
+def test_percentile_interpolates_like_percentile_cont():
+    from app.services.agents.latency import percentile
+
+    assert percentile([], 0.5) is None
+    assert percentile([40.0], 0.99) == 40.0
+    assert percentile([30.0, 10.0, 20.0, 40.0], 0.5) == 25.0
+    assert abs(percentile([10.0, 20.0, 30.0, 40.0], 0.95) - 38.5) < 1e-9
+
+
+def test_stream_timing_session_fields():
+    from unittest.mock import patch
+
+    from app.services.agents.latency import StreamTiming
+
+    timing = StreamTiming(start=100.0)
+    # First delta 0.8s in, then gaps of 50ms, 50ms and 100ms
+    with patch("app.services.agents.latency.time.monotonic", side_effect=[100.8, 100.85, 100.9, 101.0]):
+        for _ in range(4):
+            timing.token()
+
+    fields = timing.session_fields(output_tokens=40)
+    assert fields["ttft_ms"] == 800
+    assert fields["inter_token_p50_ms"] == 50.0
+    assert fields["inter_token_p99_ms"] == 99.0
+    assert fields["output_tokens_per_second"] == 200.0
+
+
+def test_stream_timing_without_tokens():
+    from app.services.agents.latency import StreamTiming
+
+    assert StreamTiming().session_fields(output_tokens=0) == {
+        "ttft_ms": None,
+        "inter_token_p50_ms": None,
+        "inter_token_p95_ms": None,
+        "inter_token_p99_ms": None,
+        "output_tokens_per_second": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_chat_stores_stream_latency_on_session():
+    import uuid
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock, patch
+
+    from app.models.agent_session import AgentSession
+    from app.services.agents.base import AgentContext, BaseAgent
+
+    class FakeStream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+        @property
+        async def text_stream(self):
+            for text in ("Hello", " there"):
+                yield text
+
+        async def get_final_message(self):
+            usage = SimpleNamespace(
+                input_tokens=10, output_tokens=2, cache_read_input_tokens=0, cache_creation_input_tokens=0,
+            )
+            return SimpleNamespace(usage=usage, stop_reason="end_turn")
+
+    client = MagicMock()
+    client.messages.stream.return_value = FakeStream()
+    telemetry = MagicMock()
+    context = AgentContext(perspective_id=uuid.uuid4(), telemetry=telemetry)
+
+    with patch("app.services.agents.base.get_anthropic_client", return_value=client):
+        events = [e async for e in BaseAgent("lyra").chat("hi", context, MagicMock())]
+
+    session = next(row for call in telemetry.add.call_args_list for row in call.args if isinstance(row, AgentSession))
+    assert session.ttft_ms is not None
+    assert session.inter_token_p50_ms is not None
+    done = json.loads(events[-1].split("data: ", 1)[1])
+    assert done["ttft_ms"] == session.ttft_ms
+
+
 # --- Axiom parsing ---
 
 
@@ -250,3 +357,158 @@ def test_parse_verdict_invalid_fallback():
 
     verdict = _parse_verdict("Not valid JSON")
     assert verdict.resolution == "action_required"
+
+
+# --- Shared client and concurrency governor ---
+
+
+def test_agents_share_one_anthropic_client():
+    from app.services.agents.base import AGENT_REGISTRY
+    from app.services.agents.client import get_anthropic_client
+
+    assert AGENT_REGISTRY["lyra"]._client is AGENT_REGISTRY["axiom"]._client
+    assert AGENT_REGISTRY["lyra"]._client is get_anthropic_client()
+
+
+@pytest.mark.asyncio
+async def test_governor_caps_global_concurrency():
+    import asyncio
+
+    from app.services.agents.client import ConcurrencyGovernor
+
+    governor = ConcurrencyGovernor(max_concurrency=2, max_per_org=10)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with governor.slot():
+            peak = max(peak, governor.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+    assert governor.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_governor_caps_per_org_concurrency():
+    import asyncio
+    import uuid
+
+    from app.services.agents.client import ConcurrencyGovernor
+
+    governor = ConcurrencyGovernor(max_concurrency=10, max_per_org=1)
+    org_a, org_b = uuid.uuid4(), uuid.uuid4()
+    active: dict[uuid.UUID, int] = {org_a: 0, org_b: 0}
+    peaks: dict[uuid.UUID, int] = {org_a: 0, org_b: 0}
+
+    async def call(org_id):
+        async with governor.slot(org_id):
+            active[org_id] += 1
+            peaks[org_id] = max(peaks[org_id], active[org_id])
+            await asyncio.sleep(0.01)
+            active[org_id] -= 1
+
+    await asyncio.gather(*(call(org) for org in [org_a, org_a, org_a, org_b, org_b]))
+    assert peaks == {org_a: 1, org_b: 1}
+
+
+@pytest.mark.asyncio
+async def test_governor_forgets_idle_orgs():
+    import asyncio
+    import uuid
+
+    from app.services.agents.client import ConcurrencyGovernor
+
+    governor = ConcurrencyGovernor(max_concurrency=10, max_per_org=1)
+    org_id = uuid.uuid4()
+
+    async def call():
+        async with governor.slot(org_id):
+            assert org_id in governor._per_org
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(3)))
+    assert governor._per_org == {}
+
+    # A caller cancelled while queued behind the per-org cap releases its entry too
+    async with governor.slot(org_id):
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert governor._per_org == {}
+
+
+# --- Concurrent Axiom debate ---
+
+
+def _sse_names(events: list[str]) -> list[str]:
+    return [e.split("\n", 1)[0].removeprefix("event: ") for e in events]
+
+
+@pytest.mark.asyncio
+async def test_stream_challenge_debates_concurrently():
+    import asyncio
+    import uuid
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.services.agents.axiom import AxiomChallenger, Challenge, Verdict
+    from app.services.agents.base import AgentContext
+
+    challenges = [
+        Challenge(f"challenge {i}", "high", ["lyra", "mira"], "evidence") for i in range(3)
+    ]
+    active = 0
+    peak = 0
+
+    async def respond(agent, text, context, db, *, db_lock=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return f"{agent.name} on {text}", None
+
+    challenger = AxiomChallenger()
+    with (
+        patch.object(challenger, "challenge", AsyncMock(return_value=(challenges, "raw"))),
+        patch.object(challenger, "get_agent_response", side_effect=respond),
+        patch.object(challenger, "evaluate", AsyncMock(return_value=Verdict("resolved", "ok"))),
+        patch("app.services.agents.axiom.settings.axiom_challenge_concurrency", 3),
+    ):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in challenger.stream_challenge({}, context, MagicMock())]
+
+    names = _sse_names(events)
+    assert names.count("axiom_challenge") == 3
+    assert names.count("challenge_response") == 6
+    assert names.count("axiom_verdict") == 3
+    assert peak == 6
+
+
+@pytest.mark.asyncio
+async def test_stream_challenge_fatal_error_aborts_debate():
+    import uuid
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.services.agents.axiom import AxiomChallenger, Challenge
+    from app.services.agents.base import AgentContext, FatalAgentError
+
+    challenges = [Challenge("only challenge", "high", ["lyra"], "evidence")]
+    challenger = AxiomChallenger()
+    evaluate = AsyncMock()
+    with (
+        patch.object(challenger, "challenge", AsyncMock(return_value=(challenges, "raw"))),
+        patch.object(
+            challenger, "get_agent_response",
+            AsyncMock(side_effect=FatalAgentError("no credits", "credits_exhausted")),
+        ),
+        patch.object(challenger, "evaluate", evaluate),
+    ):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in challenger.stream_challenge({}, context, MagicMock())]
+
+    assert _sse_names(events) == ["axiom_challenge", "agent_error", "boomerang_error"]
+    evaluate.assert_not_called()
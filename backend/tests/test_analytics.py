@@ -1,13 +1,16 @@
 import uuid
 from datetime import UTC, datetime
+from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.core.errors import NotFoundError
+from app.models.enums import JourneyStatus
 from app.schemas.analytics import DashboardStats, JourneyAnalytics
 from app.services import analytics as analytics_service
+from app.services.dashboard_stats import journey_status_deltas, record_agent_costs
 
 
 def _make_journey_ns(**kwargs) -> SimpleNamespace:
@@ -18,6 +21,8 @@ def _make_journey_ns(**kwargs) -> SimpleNamespace:
         "status": "active",
         "perspectives_completed": 0,
         "total_cost_cents": 0,
+        "archived_cost_cents": Decimal("0"),
+        "archived_sessions": 0,
         "completed_at": None,
         "created_at": datetime.now(UTC),
         "updated_at": datetime.now(UTC),
@@ -85,6 +90,33 @@ async def test_get_journey_analytics():
     assert analytics.agent_sessions_count == 25
 
 
+@pytest.mark.asyncio
+async def test_get_journey_analytics_includes_archived_sessions():
+    """Sessions from retired partitions still count via the journey's archived totals."""
+    db = _make_db_mock()
+    org_id = uuid.uuid4()
+    journey_id = uuid.uuid4()
+    journey = _make_journey_ns(
+        id=journey_id, organization_id=org_id, archived_cost_cents=Decimal("40.5"), archived_sessions=10,
+    )
+
+    journey_result = MagicMock()
+    journey_result.scalar_one_or_none.return_value = journey
+    completed_result = MagicMock()
+    completed_result.scalar_one.return_value = 3
+    cost_result = MagicMock()
+    cost_result.one.return_value = (Decimal("110"), 5)
+    db.execute = AsyncMock(side_effect=[journey_result, completed_result, cost_result])
+
+    analytics = await analytics_service.get_journey_analytics(db, journey_id, org_id)
+
+    assert analytics.total_cost_cents == 150
+    assert analytics.agent_sessions_count == 15
+    # Partitions older than the journey are excluded by the created_at bound
+    cost_query = str(db.execute.await_args_list[2].args[0])
+    assert "agent_sessions.created_at >=" in cost_query
+
+
 @pytest.mark.asyncio
 async def test_get_journey_analytics_not_found():
     """Journey analytics should raise NotFoundError for missing journey."""
@@ -152,40 +184,27 @@ async def test_get_journey_analytics_all_completed():
 
 @pytest.mark.asyncio
 async def test_get_dashboard_stats():
-    """Dashboard stats should aggregate correctly across all org data."""
+    """Dashboard stats should come from the org's materialized stats row."""
     db = _make_db_mock()
     org_id = uuid.uuid4()
     vdbas = [_make_vdba_ns(organization_id=org_id) for _ in range(2)]
 
-    # Mock sequence: total_journeys, active, completed, vdba_count, cost_sum,
-    #               vibes_count, emails_count, recent_vdbas
-    total_j = MagicMock()
-    total_j.scalar_one.return_value = 5
-
-    active_j = MagicMock()
-    active_j.scalar_one.return_value = 3
-
-    completed_j = MagicMock()
-    completed_j.scalar_one.return_value = 2
-
-    vdba_count = MagicMock()
-    vdba_count.scalar_one.return_value = 2
-
-    cost_sum = MagicMock()
-    cost_sum.scalar_one.return_value = 1000
-
-    vibes = MagicMock()
-    vibes.scalar_one.return_value = 10
-
-    emails = MagicMock()
-    emails.scalar_one.return_value = 15
+    # Mock sequence: stats row, recent_vdbas
+    stats_row = MagicMock()
+    stats_row.scalar_one_or_none.return_value = SimpleNamespace(
+        total_journeys=5,
+        active_journeys=3,
+        completed_journeys=2,
+        total_vdbas=2,
+        total_cost_cents=Decimal("1000.4567"),
+        total_vibes=10,
+        total_emails=15,
+    )
 
     recent = MagicMock()
     recent.scalars.return_value.all.return_value = vdbas
 
-    db.execute = AsyncMock(
-        side_effect=[total_j, active_j, completed_j, vdba_count, cost_sum, vibes, emails, recent]
-    )
+    db.execute = AsyncMock(side_effect=[stats_row, recent])
 
     stats = await analytics_service.get_dashboard_stats(db, org_id)
 
@@ -198,26 +217,23 @@ async def test_get_dashboard_stats():
     assert stats.total_vibes == 10
     assert stats.total_emails == 15
     assert len(stats.recent_vdbas) == 2
+    assert db.execute.await_count == 2
 
 
 @pytest.mark.asyncio
 async def test_get_dashboard_stats_empty_org():
-    """Dashboard stats should handle an org with no data."""
+    """Dashboard stats should handle an org with no data (no stats row yet)."""
     db = _make_db_mock()
     org_id = uuid.uuid4()
 
-    results = []
-    for val in [0, 0, 0, 0, 0, 0, 0]:
-        m = MagicMock()
-        m.scalar_one.return_value = val
-        results.append(m)
+    stats_row = MagicMock()
+    stats_row.scalar_one_or_none.return_value = None
 
     # Empty recent VDBAs
     recent = MagicMock()
     recent.scalars.return_value.all.return_value = []
-    results.append(recent)
 
-    db.execute = AsyncMock(side_effect=results)
+    db.execute = AsyncMock(side_effect=[stats_row, recent])
 
     stats = await analytics_service.get_dashboard_stats(db, org_id)
 
@@ -231,6 +247,43 @@ async def test_get_dashboard_stats_empty_org():
     assert stats.recent_vdbas == []
 
 
+def test_journey_status_deltas():
+    """Status transitions should move journeys between the active/completed counters."""
+    assert journey_status_deltas(None, "active") == {"active_journeys": 1}
+    assert journey_status_deltas(JourneyStatus.ACTIVE, "completed") == {"active_journeys": -1, "completed_journeys": 1}
+    assert journey_status_deltas("completed", "archived") == {"completed_journeys": -1}
+    assert journey_status_deltas("archived", "archived") == {}
+
+
+@pytest.mark.asyncio
+async def test_record_agent_costs_adds_deltas_per_journey_and_org():
+    """Agent costs should be added to journey totals in one statement, then to each org in one upsert."""
+    from sqlalchemy.dialects import postgresql
+
+    db = _make_db_mock()
+    org_id = uuid.uuid4()
+    p1, p2 = uuid.uuid4(), uuid.uuid4()
+    journey_result = MagicMock()
+    journey_result.all.return_value = [(org_id, Decimal("0.75")), (org_id, Decimal("0.1"))]
+    db.execute = AsyncMock(side_effect=[journey_result, MagicMock()])
+
+    await record_agent_costs(db, [(p1, 0.25), (p1, Decimal("0.5")), (p2, 0.1), (uuid.uuid4(), 0)])
+
+    journey_update, org_upsert = (call.args[0] for call in db.execute.await_args_list)
+    journey_sql = str(journey_update.compile(dialect=postgresql.dialect()))
+    assert "SET total_cost_cents=(journeys.total_cost_cents + anon_1.cost_cents)" in journey_sql
+    assert "agent_sessions" not in journey_sql
+    org_params = org_upsert.compile(dialect=postgresql.dialect()).params
+    assert [v for k, v in org_params.items() if k.startswith("total_cost_cents")] == [pytest.approx(0.85)]
+
+
+@pytest.mark.asyncio
+async def test_record_agent_costs_noop_without_sessions():
+    db = _make_db_mock()
+    await record_agent_costs(db, [])
+    db.execute.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_journey_analytics_schema():
     """JourneyAnalytics schema should validate correctly."""
@@ -260,3 +313,33 @@ async def test_dashboard_stats_schema():
     )
     assert data.total_journeys == 5
     assert data.recent_vdbas == []
+
+
+@pytest.mark.asyncio
+async def test_get_latency_report():
+    """Latency rows become per agent/model/intersection percentile groups over a UTC window."""
+    db = _make_db_mock()
+    latency_result = MagicMock()
+    latency_result.all.return_value = [
+        (
+            "lyra", "claude-haiku-4-5-20251001", "architecture", "generate", 12, 10,
+            2100.0, 4800.0, 6000.0,  # duration_ms
+            640.0, 1500.0, 2200.0,  # ttft_ms
+            18.5, 60.0, 140.0,  # inter-token gaps
+            95.123, 70.0, None,  # output tokens per second
+        ),
+    ]
+    db.execute = AsyncMock(return_value=latency_result)
+
+    report = await analytics_service.get_latency_report(
+        db, uuid.uuid4(), start=datetime(2026, 10, 1), end=datetime(2026, 10, 8, tzinfo=UTC)
+    )
+
+    assert report.start == datetime(2026, 10, 1, tzinfo=UTC)
+    [group] = report.groups
+    assert (group.agent_name, group.dimension, group.phase) == ("lyra", "architecture", "generate")
+    assert (group.sessions, group.streamed_sessions) == (12, 10)
+    assert group.ttft_ms.p95 == 1500.0
+    assert group.inter_token_ms.p99 == 140.0
+    assert group.output_tokens_per_second.p50 == 95.12
+    assert group.output_tokens_per_second.p99 is None
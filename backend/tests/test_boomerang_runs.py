@@ -0,0 +1,226 @@
+"""Tests for resumable boomerang runs: checkpoints, resume, and event replay."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import boomerang_runs
+from app.services.agents.axiom import AxiomChallenger, Verdict
+from app.services.agents.base import AgentContext, BaseAgent, ChatResult
+from app.services.agents.checkpoint import BoomerangCheckpoint
+from app.services.agents.orchestrator import SPECIALIST_AGENTS, BoomerangOrchestrator
+
+
+def _names(events: list[str]) -> list[str]:
+    return [e.split("\n", 1)[0].removeprefix("event: ") for e in events]
+
+
+def test_checkpoint_roundtrip():
+    checkpoint = BoomerangCheckpoint(
+        specialists={"lyra": "out"},
+        challenges=[{"challenge_text": "c", "severity": "high", "targeted_agents": ["lyra"], "evidence_needed": ""}],
+        responses={0: {"lyra": "resp"}},
+        verdicts={0: {"resolution": "resolved", "resolution_text": "ok"}},
+    )
+    data = checkpoint.to_dict()
+    assert set(data["responses"]) == {"0"}
+    assert BoomerangCheckpoint.from_dict(data) == checkpoint
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_saves_snapshot_on_each_step():
+    saved: list[dict] = []
+
+    async def on_save(data):
+        saved.append(data)
+
+    checkpoint = BoomerangCheckpoint(on_save=on_save)
+    await checkpoint.record_specialist("lyra", "out")
+    await checkpoint.record_response(2, "mira", "resp")
+
+    assert saved[0]["specialists"] == {"lyra": "out"}
+    assert saved[1]["responses"] == {"2": {"mira": "resp"}}
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_checkpointed_specialists():
+    done = {name: f"{name} output" for name in SPECIALIST_AGENTS[:5]}
+    checkpoint = BoomerangCheckpoint(specialists=dict(done))
+    raw_chat = AsyncMock(return_value=ChatResult(content="fresh", input_tokens=1, output_tokens=1))
+
+    async def no_axiom(*args, **kwargs):
+        return
+        yield
+
+    db = MagicMock()
+    db.flush = AsyncMock()
+    orchestrator = BoomerangOrchestrator()
+    with (
+        patch.object(BaseAgent, "raw_chat", raw_chat),
+        patch.object(orchestrator._challenger, "stream_challenge", side_effect=no_axiom),
+    ):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in orchestrator.run(context, "prompt", db, checkpoint=checkpoint)]
+
+    assert raw_chat.await_count == len(SPECIALIST_AGENTS) - 5
+    assert _names(events).count("agent_start") == len(SPECIALIST_AGENTS) - 5
+    assert set(checkpoint.specialists) == set(SPECIALIST_AGENTS)
+    assert checkpoint.specialists["lyra"] == done["lyra"]
+
+
+@pytest.mark.asyncio
+async def test_stream_challenge_resumes_from_checkpoint():
+    checkpoint = BoomerangCheckpoint(
+        specialists={"lyra": "a", "mira": "b"},
+        challenges=[
+            {"challenge_text": "first", "severity": "high", "targeted_agents": ["lyra"], "evidence_needed": ""},
+            {"challenge_text": "second", "severity": "low", "targeted_agents": ["lyra", "mira"], "evidence_needed": ""},
+        ],
+        responses={0: {"lyra": "done"}, 1: {"lyra": "done"}},
+        verdicts={0: {"resolution": "resolved", "resolution_text": "ok"}},
+    )
+    challenger = AxiomChallenger()
+    generate = AsyncMock()
+    respond = AsyncMock(return_value=("mira answer", None))
+    evaluate = AsyncMock(return_value=Verdict("accepted_risk", "fine"))
+
+    with (
+        patch.object(challenger, "challenge", generate),
+        patch.object(challenger, "get_agent_response", respond),
+        patch.object(challenger, "evaluate", evaluate),
+    ):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in challenger.stream_challenge({}, context, MagicMock(), checkpoint=checkpoint)]
+
+    generate.assert_not_called()
+    assert respond.await_count == 1
+    assert respond.await_args.args[0].name == "mira"
+    assert evaluate.await_count == 1
+    assert evaluate.await_args.args[1] == {"lyra": "done", "mira": "mira answer"}
+    assert _names(events) == ["challenge_response", "axiom_verdict"]
+    assert checkpoint.verdicts[1] == {"resolution": "accepted_risk", "resolution_text": "fine"}
+
+
+def _checkpoint_with_one_challenge(**kwargs) -> BoomerangCheckpoint:
+    return BoomerangCheckpoint(
+        specialists={"lyra": "a"},
+        challenges=[
+            {"challenge_text": "only", "severity": "high", "targeted_agents": ["lyra"], "evidence_needed": ""},
+        ],
+        on_save=AsyncMock(side_effect=ConnectionError("database unavailable")),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_response_checkpoint_aborts_the_debate():
+    checkpoint = _checkpoint_with_one_challenge()
+    challenger = AxiomChallenger()
+    evaluate = AsyncMock(return_value=Verdict("resolved", "ok"))
+
+    with (
+        patch.object(challenger, "get_agent_response", AsyncMock(return_value=("answer", None))),
+        patch.object(challenger, "evaluate", evaluate),
+    ):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in challenger.stream_challenge({}, context, MagicMock(), checkpoint=checkpoint)]
+
+    assert _names(events) == ["boomerang_error"]
+    assert '"error_type": "checkpoint"' in events[0]
+    evaluate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_verdict_checkpoint_aborts_the_debate():
+    checkpoint = _checkpoint_with_one_challenge(responses={0: {"lyra": "done"}})
+    challenger = AxiomChallenger()
+
+    with patch.object(challenger, "evaluate", AsyncMock(return_value=Verdict("resolved", "ok"))):
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in challenger.stream_challenge({}, context, MagicMock(), checkpoint=checkpoint)]
+
+    assert _names(events) == ["boomerang_error"]
+    assert '"error_type": "checkpoint"' in events[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_specialist_checkpoint_aborts_the_run():
+    checkpoint = BoomerangCheckpoint(on_save=AsyncMock(side_effect=ConnectionError("database unavailable")))
+    result = ChatResult(content="out", input_tokens=1, output_tokens=1)
+    challenger = MagicMock()
+
+    record_usage = AsyncMock()
+
+    with (
+        patch.object(BaseAgent, "raw_chat", AsyncMock(return_value=result)),
+        patch("app.services.agents.orchestrator.record_chat_usage", record_usage),
+    ):
+        orchestrator = BoomerangOrchestrator()
+        orchestrator._challenger = challenger
+        context = AgentContext(perspective_id=uuid.uuid4())
+        events = [e async for e in orchestrator.run(context, "goal", MagicMock(), checkpoint=checkpoint)]
+
+    names = _names(events)
+    assert names[-2:] == ["boomerang_error", "boomerang_complete"]
+    assert '"error_type": "checkpoint"' in events[-2]
+    challenger.stream_challenge.assert_not_called()
+    # The call that finished is billed even though its checkpoint failed
+    record_usage.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_run_events_replays_with_ids_and_stops_at_end():
+    run_id = uuid.uuid4()
+    key = boomerang_runs.stream_key(run_id)
+    redis = MagicMock()
+    redis.xread = AsyncMock(side_effect=[
+        [[key, [("1-0", {"sse": "event: a\ndata: {}\n\n"}), ("2-0", {"sse": "event: b\ndata: {}\n\n"})]]],
+        [[key, [("3-0", {boomerang_runs.END_FIELD: "1"})]]],
+    ])
+
+    with patch.object(boomerang_runs, "get_redis", return_value=redis):
+        events = [e async for e in boomerang_runs.stream_run_events(run_id, "0-5")]
+
+    assert events == ["id: 1-0\nevent: a\ndata: {}\n\n", "id: 2-0\nevent: b\ndata: {}\n\n"]
+    assert redis.xread.await_args_list[0].args[0] == {key: "0-5"}
+    assert redis.xread.await_args_list[1].args[0] == {key: "2-0"}
+
+
+def test_is_stream_id():
+    assert boomerang_runs.is_stream_id("1700000000000-0")
+    assert not boomerang_runs.is_stream_id("abc")
+
+
+@pytest.mark.asyncio
+async def test_run_boomerang_commits_failed_status_when_enqueue_fails():
+    from types import SimpleNamespace
+
+    from app.api.routes import agents as agents_routes
+    from app.core.errors import AppError
+    from app.schemas.agent import BoomerangRequest
+
+    perspective = SimpleNamespace(
+        id=uuid.uuid4(), journey_id=uuid.uuid4(), dimension="architecture", phase="generate",
+    )
+    journey_result = MagicMock()
+    journey_result.scalar_one_or_none.return_value = None
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=journey_result)
+    db.commit = AsyncMock()
+    db.flush = AsyncMock()
+    run = SimpleNamespace(id=uuid.uuid4(), status="queued", error=None)
+    user = SimpleNamespace(id=uuid.uuid4(), organization_id=uuid.uuid4())
+
+    with (
+        patch.object(agents_routes, "_get_perspective", AsyncMock(return_value=perspective)),
+        patch.object(agents_routes, "org_cache_enabled", AsyncMock(return_value=False)),
+        patch.object(boomerang_runs, "create_run", AsyncMock(return_value=run)),
+        patch.object(boomerang_runs, "start_run", AsyncMock(side_effect=ConnectionError("redis down"))),
+        pytest.raises(AppError),
+    ):
+        await agents_routes.run_boomerang(uuid.uuid4(), BoomerangRequest(), user, db)
+
+    assert (run.status, run.error) == ("failed", "Could not queue run")
+    # Once after creating the run, once for the failed status
+    assert db.commit.await_count == 2
@@ -0,0 +1,47 @@
+"""Tests for database pool configuration and statistics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.config import Settings
+from app.db import pool as pool_module
+from app.db.pool import InstrumentedPool, PoolStats, engine_options, pool_snapshot
+
+
+def test_engine_options_from_settings():
+    options = engine_options(Settings(db_pool_size=4, db_max_overflow=2, db_statement_cache_size=50))
+
+    assert options["poolclass"] is InstrumentedPool
+    assert (options["pool_size"], options["max_overflow"]) == (4, 2)
+    assert options["connect_args"] == {"prepared_statement_cache_size": 50}
+
+
+def test_pgbouncer_mode_disables_statement_caching():
+    connect_args = engine_options(Settings(db_pgbouncer=True))["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_checkouts_overflow_and_timeouts():
+    pool = InstrumentedPool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    with patch.object(pool_module, "pool_stats", PoolStats()) as stats:
+        held = [await greenlet_spawn(pool.connect), await greenlet_spawn(pool.connect)]
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        engine = MagicMock()
+        engine.sync_engine.pool = pool
+        snapshot = pool_snapshot(engine)
+
+    assert len(held) == 2
+    assert (stats.checkouts, stats.overflow_checkouts, stats.timeouts) == (2, 1, 1)
+    assert stats.wait_seconds_max >= 0.01
+    assert (snapshot["checked_out"], snapshot["overflow"], snapshot["timeouts"]) == (2, 1, 1)
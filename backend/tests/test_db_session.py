@@ -0,0 +1,31 @@
+"""Tests for the request-scoped database session."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api import deps
+from app.db import session as db_session
+from app.db.session import release_connection
+
+
+def test_routes_and_auth_share_one_session_dependency():
+    # FastAPI caches a dependency per request by identity, so there must be only one get_db
+    assert deps.get_db is db_session.get_db
+
+
+def test_require_role_returns_one_dependency_per_role():
+    assert deps.require_role("editor") is deps.require_role("editor")
+    assert deps.require_role("editor") is not deps.require_role("admin")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_transaction", [True, False])
+async def test_release_connection_ends_open_transaction(in_transaction):
+    session = MagicMock()
+    session.in_transaction.return_value = in_transaction
+    session.commit = AsyncMock()
+
+    await release_connection(session)
+
+    assert session.commit.await_count == int(in_transaction)
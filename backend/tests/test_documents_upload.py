@@ -1,10 +1,19 @@
+import io
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.api.routes.documents import RangeNotSatisfiableError, parse_range
+from app.core.config import settings
 from app.core.errors import ValidationError
-from app.services.minio import ALLOWED_TYPES, MAX_FILE_SIZE, _sanitize_filename, upload_file
+from app.services.minio import (
+    ALLOWED_TYPES,
+    MAX_FILE_SIZE,
+    _sanitize_filename,
+    open_file_stream,
+    upload_file,
+)
 
 
 class TestFileValidation:
@@ -48,6 +57,23 @@ class TestFileValidation:
         await upload_file(client, b"data", "test.pdf", "application/pdf", str(uuid.uuid4()))
         client.make_bucket.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bucket_check_is_memoized_until_upload_fails(self):
+        client = AsyncMock()
+        client.bucket_exists = AsyncMock(return_value=True)
+        client.put_object = AsyncMock()
+
+        await upload_file(client, b"data", "a.pdf", "application/pdf", "p")
+        await upload_file(client, b"data", "b.pdf", "application/pdf", "p")
+        assert client.bucket_exists.await_count == 1
+
+        client.put_object = AsyncMock(side_effect=RuntimeError("NoSuchBucket"))
+        with pytest.raises(RuntimeError):
+            await upload_file(client, b"data", "c.pdf", "application/pdf", "p")
+        client.put_object = AsyncMock()
+        await upload_file(client, b"data", "d.pdf", "application/pdf", "p")
+        assert client.bucket_exists.await_count == 2
+
     @pytest.mark.asyncio
     async def test_upload_key_format(self):
         perspective_id = str(uuid.uuid4())
@@ -59,6 +85,28 @@ class TestFileValidation:
         assert key.startswith(f"perspectives/{perspective_id}/")
         assert "my_report.pdf" in key
 
+    @pytest.mark.asyncio
+    async def test_upload_streams_file_in_parts(self):
+        client = AsyncMock()
+        client.bucket_exists = AsyncMock(return_value=True)
+        client.put_object = AsyncMock()
+        stream = io.BytesIO(b"data")
+
+        await upload_file(client, stream, "test.pdf", "application/pdf", str(uuid.uuid4()), length=4)
+        args, kwargs = client.put_object.call_args
+        assert args[2] is stream
+        assert kwargs["length"] == 4
+        assert kwargs["part_size"] == settings.minio_part_size
+        assert kwargs["num_parallel_uploads"] == settings.minio_parallel_uploads
+
+    @pytest.mark.asyncio
+    async def test_upload_rejects_oversized_stream_before_reading(self):
+        client = AsyncMock()
+        stream = MagicMock()
+        with pytest.raises(ValidationError, match="maximum size"):
+            await upload_file(client, stream, "big.pdf", "application/pdf", "p", length=MAX_FILE_SIZE + 1)
+        stream.read.assert_not_called()
+
 
 class TestSanitizeFilename:
     def test_removes_spaces(self):
@@ -90,7 +138,8 @@ class TestDocumentServiceMocked:
             mock_upload.return_value = "perspectives/test/uuid_file.pdf"
 
             mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=b"pdf content")
+            mock_file.file = io.BytesIO(b"pdf content")
+            mock_file.size = None
             mock_file.content_type = "application/pdf"
             mock_file.filename = "test.pdf"
 
@@ -102,7 +151,11 @@ class TestDocumentServiceMocked:
 
             doc = await create_document(mock_db, uuid.uuid4(), uuid.uuid4(), mock_file)
             mock_upload.assert_called_once()
+            assert mock_upload.call_args.args[1] is mock_file.file
+            assert mock_upload.call_args.kwargs["length"] == len(b"pdf content")
+            mock_file.read.assert_not_called()
             mock_db.add.assert_called_once()
+            assert doc.file_size == len(b"pdf content")
             assert doc.filename == "test.pdf"
             assert doc.file_type == "application/pdf"
 
@@ -131,3 +184,52 @@ class TestDocumentServiceMocked:
             await delete_document(mock_db, uuid.uuid4())
             mock_delete.assert_called_once_with(mock_client, "perspectives/test/uuid_file.pdf")
             mock_db.delete.assert_called_once_with(mock_doc)
+
+
+class TestDownloadStreaming:
+    @pytest.mark.asyncio
+    async def test_open_file_stream_yields_chunks_and_releases(self):
+        async def iter_chunked(size):
+            for chunk in (b"ab", b"cd"):
+                yield chunk
+
+        response = MagicMock()
+        response.content.iter_chunked = iter_chunked
+        response.release = AsyncMock()
+        client = MagicMock()
+        client.get_object = AsyncMock(return_value=response)
+
+        chunks = await open_file_stream(client, "key", offset=10, length=4)
+        assert [c async for c in chunks] == [b"ab", b"cd"]
+        assert client.get_object.call_args.kwargs == {"offset": 10, "length": 4}
+        response.close.assert_called_once()
+        response.release.assert_awaited_once()
+
+
+class TestParseRange:
+    def test_no_header_sends_whole_file(self):
+        assert parse_range(None, 100) is None
+
+    def test_explicit_range(self):
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+
+    def test_open_ended_range(self):
+        assert parse_range("bytes=90-", 100) == (90, 99)
+
+    def test_end_clamped_to_size(self):
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+
+    def test_suffix_range(self):
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=-500", 100) == (0, 99)
+
+    def test_malformed_and_multi_range_ignored(self):
+        assert parse_range("items=0-9", 100) is None
+        assert parse_range("bytes=0-9,20-29", 100) is None
+        assert parse_range("bytes=9-0", 100) is None
+
+    def test_unsatisfiable(self):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range("bytes=100-", 100)
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range("bytes=-0", 100)
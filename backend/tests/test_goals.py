@@ -67,8 +67,10 @@ async def test_list_goals_service():
 
     db.execute = AsyncMock(side_effect=[count_result, list_result])
 
-    result_goals, total = await goal_service.list_goals(db, org_id, page=1, per_page=20)
-    assert total == 3
+    result_goals, pagination = await goal_service.list_goals(db, org_id, page=1, per_page=20)
+    assert pagination.total == 3
+    assert pagination.total_pages == 1
+    assert pagination.next_cursor is None
     assert len(result_goals) == 3
 
 
@@ -0,0 +1,155 @@
+"""Tests for the Redis-backed job queue and vibe job stages."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import jobs
+from app.services.jobs import Job, NonRetryableJobError, register_job, retry_delay_seconds, run_next_job
+
+
+def _make_redis_mock(job: Job | None) -> MagicMock:
+    redis = MagicMock()
+    redis.blmove = AsyncMock(return_value=job.id if job else None)
+    redis.get = AsyncMock(return_value=job.to_json() if job else None)
+    redis.set = AsyncMock()
+    redis.zadd = AsyncMock()
+    redis.zrem = AsyncMock(return_value=1)
+    redis.lrem = AsyncMock()
+    redis.lpush = AsyncMock()
+    return redis
+
+
+def _saved_statuses(redis: MagicMock) -> list[str]:
+    return [Job.from_json(call.args[1]).status for call in redis.set.call_args_list]
+
+
+def test_job_json_roundtrip():
+    job = Job(id="abc", kind="test.kind", payload={"x": 1}, attempts=2)
+    restored = Job.from_json(job.to_json())
+    assert restored == job
+
+
+def test_retry_delay_grows_and_caps():
+    assert retry_delay_seconds(2) == retry_delay_seconds(1) * 2
+    assert retry_delay_seconds(50) == jobs.MAX_RETRY_DELAY_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_run_next_job_empty_queue():
+    redis = _make_redis_mock(None)
+    assert await run_next_job(redis) is False
+    redis.zadd.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_next_job_success():
+    handler = AsyncMock()
+    register_job("test.success")(handler)
+    job = Job(id=str(uuid.uuid4()), kind="test.success", payload={"a": 1})
+    redis = _make_redis_mock(job)
+
+    assert await run_next_job(redis) is True
+
+    handler.assert_awaited_once_with({"a": 1})
+    assert _saved_statuses(redis)[-1] == "succeeded"
+    redis.zrem.assert_awaited_with(jobs.INFLIGHT_KEY, job.id)
+    redis.lrem.assert_awaited_with(jobs.PROCESSING_KEY, 1, job.id)
+
+
+@pytest.mark.asyncio
+async def test_run_next_job_extends_visibility_while_running():
+    import asyncio
+
+    async def slow_handler(payload: dict) -> None:
+        await asyncio.sleep(0.05)
+
+    register_job("test.slow")(slow_handler)
+    job = Job(id=str(uuid.uuid4()), kind="test.slow", payload={})
+    redis = _make_redis_mock(job)
+
+    with patch("app.services.jobs.settings.job_visibility_timeout_seconds", 0.03):
+        assert await run_next_job(redis) is True
+
+    inflight = [c for c in redis.zadd.call_args_list if c.args[0] == jobs.INFLIGHT_KEY]
+    # The claim, then at least one heartbeat that only updates a still-claimed job
+    assert len(inflight) >= 2
+    assert inflight[-1].kwargs == {"xx": True}
+
+
+@pytest.mark.asyncio
+async def test_run_next_job_schedules_retry():
+    register_job("test.flaky")(AsyncMock(side_effect=RuntimeError("boom")))
+    job = Job(id=str(uuid.uuid4()), kind="test.flaky", payload={}, max_attempts=3)
+    redis = _make_redis_mock(job)
+
+    await run_next_job(redis)
+
+    assert _saved_statuses(redis)[-1] == "retrying"
+    delayed_calls = [c for c in redis.zadd.call_args_list if c.args[0] == jobs.DELAYED_KEY]
+    assert len(delayed_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_next_job_final_failure_calls_hook():
+    on_failure = AsyncMock()
+    register_job("test.broken", on_failure=on_failure)(AsyncMock(side_effect=RuntimeError("boom")))
+    job = Job(id=str(uuid.uuid4()), kind="test.broken", payload={"v": 1}, attempts=2, max_attempts=3)
+    redis = _make_redis_mock(job)
+
+    await run_next_job(redis)
+
+    assert _saved_statuses(redis)[-1] == "failed"
+    on_failure.assert_awaited_once_with({"v": 1})
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_fails_immediately():
+    on_failure = AsyncMock()
+    register_job("test.fatal", on_failure=on_failure)(AsyncMock(side_effect=NonRetryableJobError("gone")))
+    job = Job(id=str(uuid.uuid4()), kind="test.fatal", payload={}, max_attempts=3)
+    redis = _make_redis_mock(job)
+
+    await run_next_job(redis)
+
+    assert _saved_statuses(redis)[-1] == "failed"
+    on_failure.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_kind_fails():
+    job = Job(id=str(uuid.uuid4()), kind="test.unregistered", payload={})
+    redis = _make_redis_mock(job)
+
+    await run_next_job(redis)
+
+    assert _saved_statuses(redis)[-1] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_enqueue_transcription_uses_vibe_job_kind():
+    from app.services import vibe_jobs
+
+    vibe_id = uuid.uuid4()
+    with patch("app.services.vibe_jobs.enqueue", AsyncMock(return_value="job-1")) as mock_enqueue:
+        job_id = await vibe_jobs.enqueue_transcription(vibe_id)
+
+    assert job_id == "job-1"
+    mock_enqueue.assert_awaited_once_with(vibe_jobs.TRANSCRIBE_JOB, {"vibe_session_id": str(vibe_id)})
+
+
+@pytest.mark.asyncio
+async def test_periodic_job_enqueued_once_per_interval():
+    redis = MagicMock()
+    redis.set = AsyncMock(side_effect=[True, None])
+
+    with (
+        patch.dict(jobs._PERIODIC, {"test.periodic": 60}, clear=True),
+        patch.object(jobs, "enqueue", AsyncMock()) as mock_enqueue,
+    ):
+        await jobs._enqueue_periodic_jobs(redis)
+        await jobs._enqueue_periodic_jobs(redis)
+
+    mock_enqueue.assert_awaited_once_with("test.periodic", {})
+    assert redis.set.call_args.kwargs == {"nx": True, "ex": 60}
@@ -0,0 +1,64 @@
+"""Tests for log formatting and the queued logging pipeline."""
+
+import io
+import json
+import logging
+from unittest.mock import patch
+
+from app.core import logging_config
+from app.core.config import Settings
+from app.core.logging_config import JsonFormatter, RequestIDFilter, TextFormatter
+from app.core.middleware import request_id_var
+
+
+def _request_record() -> logging.LogRecord:
+    record = logging.LogRecord("incube.requests", logging.WARNING, __file__, 1, "[%s] GET /x | %d", ("r1", 404), None)
+    record.request_id = "r1"
+    record.http = {"method": "GET", "status": 404, "query": None, "auth": "absent", "response_body": "nope"}
+    return record
+
+
+def test_text_formatter_appends_request_details():
+    line = TextFormatter("%(levelname)s | %(message)s").format(_request_record())
+
+    assert line == "WARNING | [r1] GET /x | 404 | auth=absent | response_body=nope"
+
+
+def test_json_formatter_emits_one_object_without_empty_fields():
+    entry = json.loads(JsonFormatter().format(_request_record()))
+
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "incube.requests"
+    assert entry["message"] == "[r1] GET /x | 404"
+    assert entry["request_id"] == "r1"
+    assert entry["http"] == {"method": "GET", "status": 404, "auth": "absent", "response_body": "nope"}
+
+
+def test_request_id_filter_tags_records_from_context():
+    record = logging.LogRecord("incube.worker", logging.INFO, __file__, 1, "hello", (), None)
+    token = request_id_var.set("r2")
+    try:
+        RequestIDFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    assert record.request_id == "r2"
+
+
+def test_configure_logging_writes_through_queue_listener():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    root.handlers = []
+    try:
+        with patch.object(logging_config.sys, "stderr", stream):
+            logging_config.configure_logging(Settings(log_format="json", log_level="INFO"))
+        logging.getLogger("incube.test").info("queued %s", "message")
+        logging_config.stop_logging()
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+    [line] = stream.getvalue().splitlines()
+    entry = json.loads(line)
+    assert (entry["logger"], entry["message"]) == ("incube.test", "queued message")
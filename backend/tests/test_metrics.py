@@ -0,0 +1,93 @@
+"""Tests for the Prometheus metrics and their instrumentation."""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from starlette.responses import StreamingResponse
+
+from app.core import metrics
+from app.core.metrics import MetricsMiddleware, record_llm_call, render_metrics
+
+
+def _value(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _client() -> AsyncClient:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    @app.get("/items/{item_id}/events")
+    async def item_events(item_id: int) -> StreamingResponse:
+        async def events():
+            yield "event: done\ndata: {}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.add_middleware(MetricsMiddleware)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_http_latency_labelled_by_route_template():
+    name = "incube_http_request_duration_seconds_count"
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    unmatched = {"method": "GET", "route": "unmatched", "status": "404"}
+    before, before_unmatched = _value(name, **labels), _value(name, **unmatched)
+
+    async with _client() as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/nowhere/3")
+
+    assert _value(name, **labels) == before + 2
+    assert _value(name, **unmatched) == before_unmatched + 1
+
+
+@pytest.mark.asyncio
+async def test_sse_streams_go_to_their_own_histogram():
+    route = "/items/{item_id}/events"
+    before = _value("incube_sse_stream_duration_seconds_count", route=route)
+
+    async with _client() as client:
+        await client.get("/items/1/events")
+
+    assert _value("incube_sse_stream_duration_seconds_count", route=route) == before + 1
+    assert _value("incube_http_request_duration_seconds_count", method="GET", route=route, status="200") == 0
+
+
+def test_llm_call_records_latency_and_tokens():
+    labels = {"agent": "axiom", "model": "test-model"}
+    before = _value("incube_llm_tokens_total", kind="output", **labels)
+
+    record_llm_call("axiom", "test-model", "raw", 1.5, input_tokens=100, output_tokens=40)
+    record_llm_call("axiom", "test-model", "raw", 0.2, error=True)
+
+    assert _value("incube_llm_tokens_total", kind="output", **labels) == before + 40
+    assert _value("incube_llm_request_duration_seconds_count", mode="raw", outcome="error", **labels) >= 1
+
+
+def test_db_statements_timed_by_type():
+    before = _value("incube_db_query_duration_seconds_count", statement="SELECT")
+    before_other = _value("incube_db_query_duration_seconds_count", statement="OTHER")
+
+    for statement in ("  SELECT 1", "select id from goals", "COMMIT"):
+        context = SimpleNamespace()
+        metrics._before_cursor_execute(None, None, statement, None, context, False)
+        metrics._after_cursor_execute(None, None, statement, None, context, False)
+
+    assert _value("incube_db_query_duration_seconds_count", statement="SELECT") == before + 2
+    assert _value("incube_db_query_duration_seconds_count", statement="OTHER") == before_other + 1
+
+
+def test_render_metrics_exposes_incube_metrics():
+    body, content_type = render_metrics()
+
+    assert content_type.startswith("text/plain")
+    assert b"incube_http_request_duration_seconds" in body
@@ -0,0 +1,167 @@
+"""Tests for the request-ID and request logging middleware."""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core import logging_middleware
+from app.core.logging_middleware import LoggingMiddleware
+from app.core.middleware import RequestIDMiddleware, request_id_var
+
+
+async def _echo(request: Request) -> JSONResponse:
+    body = await request.json()
+    return JSONResponse({"request_id": request.state.request_id, "context_id": request_id_var.get(), **body})
+
+
+async def _reject(request: Request) -> JSONResponse:
+    await request.body()
+    return JSONResponse({"error": {"code": "VALIDATION_ERROR", "message": "Bad password"}}, status_code=422)
+
+
+async def _missing(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("x" * 5000, status_code=404)
+
+
+async def _stream_error(request: Request) -> StreamingResponse:
+    async def chunks():
+        yield b"first "
+        yield b"second"
+
+    return StreamingResponse(chunks(), status_code=500)
+
+
+async def _boom(request: Request) -> None:
+    raise RuntimeError("kaboom")
+
+
+def _client(**options) -> AsyncClient:
+    app = Starlette(routes=[
+        Route("/echo", _echo, methods=["POST"]),
+        Route("/reject", _reject, methods=["POST"]),
+        Route("/missing", _missing),
+        Route("/stream-error", _stream_error),
+        Route("/boom", _boom),
+        Route("/api/health", _missing),
+    ])
+    app.add_middleware(LoggingMiddleware, **options)
+    app.add_middleware(RequestIDMiddleware)
+    return AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test")
+
+
+def _records(caplog) -> list[logging.LogRecord]:
+    return [r for r in caplog.records if r.name == logging_middleware.logger.name]
+
+
+@pytest.mark.asyncio
+async def test_one_record_per_request_with_request_id(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        response = await client.post("/echo?x=1", json={"title": "Goal"}, headers={"Authorization": "Bearer t"})
+
+    data = response.json()
+    assert response.headers["X-Request-ID"] == data["request_id"] == data["context_id"]
+    [record] = _records(caplog)
+    assert record.request_id == data["request_id"]
+    assert record.http["status"] == 200
+    assert record.http["query"] == "x=1"
+    assert record.http["auth"] == "present"
+    # Bodies are only logged for errors and slow requests
+    assert record.http["request_body"] is None
+    assert record.http["response_body"] is None
+    assert record.http["slow"] is None
+    assert f"[{data['request_id']}] POST /echo | 200 |" in record.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_error_body_is_bounded_and_still_delivered(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        response = await client.get("/missing")
+
+    assert response.text == "x" * 5000
+    [record] = _records(caplog)
+    assert record.levelno == logging.WARNING
+    body = record.http["response_body"]
+    assert body.startswith("x" * logging_middleware.MAX_RESPONSE_BODY_LOG_LENGTH + "...")
+    assert "total 5000 bytes" in body
+
+
+@pytest.mark.asyncio
+async def test_streamed_error_body_passes_through(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        response = await client.get("/stream-error")
+
+    assert response.text == "first second"
+    [record] = _records(caplog)
+    assert record.levelno == logging.ERROR
+    assert record.http["response_body"] == "first second"
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_logged_once(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        response = await client.get("/boom")
+
+    assert response.status_code == 500
+    [record] = _records(caplog)
+    assert record.http["error"] == "RuntimeError: kaboom"
+
+
+@pytest.mark.asyncio
+async def test_health_checks_not_logged(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        await client.get("/api/health")
+
+    assert _records(caplog) == []
+
+
+@pytest.mark.asyncio
+async def test_error_record_has_redacted_bodies_and_query(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client() as client:
+        await client.post("/reject?token=abc&page=2", json={"email": "a@b.co", "password": "hunter2"})
+
+    [record] = _records(caplog)
+    assert record.levelno == logging.WARNING
+    assert record.http["query"] == "token=[REDACTED]&page=2"
+    assert record.http["request_body"] == '{"email":"a@b.co","password":"[REDACTED]"}'
+    assert "hunter2" not in record.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_successful_requests_are_sampled(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client(sample_rate=0.0) as client:
+        await client.post("/echo", json={"title": "Goal"})
+        await client.get("/missing")
+
+    # The 200 is sampled out; the 404 is always logged
+    [record] = _records(caplog)
+    assert record.http["status"] == 404
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_always_logged_with_body(caplog):
+    caplog.set_level(logging.INFO, logger=logging_middleware.logger.name)
+    async with _client(sample_rate=0.0, slow_request_ms=0) as client:
+        await client.post("/echo", json={"title": "Goal"})
+
+    [record] = _records(caplog)
+    assert record.levelno == logging.WARNING
+    assert record.http["slow"] is True
+    assert record.http["request_body"] == '{"title":"Goal"}'
+
+
+def test_redact_handles_truncated_json_and_form_bodies():
+    assert logging_middleware.redact('{"refresh_token": "eyJhbGciOi') == '{"refresh_token": "[REDACTED]"'
+    assert logging_middleware.redact('{"new_password":null,"name":"x"}') == '{"new_password":"[REDACTED]","name":"x"}'
+    assert logging_middleware.redact("username=a&password=b") == "username=a&password=[REDACTED]"
@@ -0,0 +1,93 @@
+"""Tests for page-number and keyset-cursor pagination of list queries."""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.errors import ValidationError
+from app.db.pagination import estimate_count, paginate
+from app.models.goal import Goal
+from app.schemas.common import decode_cursor, encode_cursor
+
+
+def _goals(*days: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=uuid.uuid4(), created_at=datetime(2025, 1, day, tzinfo=UTC)) for day in days]
+
+
+def _result(items: list) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = items
+    return result
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    created_at, row_id = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC), uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(datetime(2025, 1, 1), uuid.uuid4())[:-4]])
+def test_invalid_cursor_rejected(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_page_request_counts_and_returns_next_cursor():
+    goals = _goals(5, 4, 3)
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 7
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[count_result, _result(goals)])
+
+    items, meta = await paginate(db, select(Goal), Goal.created_at, Goal.id, page=2, per_page=2)
+
+    assert items == goals[:2]
+    assert (meta.page, meta.total, meta.total_pages, meta.total_estimated) == (2, 7, 4, False)
+    assert decode_cursor(meta.next_cursor) == (goals[1].created_at, goals[1].id)
+    sql = _sql(db.execute.await_args.args[0])
+    assert "ORDER BY goals.created_at DESC, goals.id DESC" in sql
+    assert "LIMIT %(param_1)s OFFSET %(param_2)s" in sql
+
+
+@pytest.mark.asyncio
+async def test_cursor_request_seeks_without_counting():
+    goals = _goals(3, 2)
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=_result(goals))
+    cursor = encode_cursor(datetime(2025, 1, 4, tzinfo=UTC), uuid.uuid4())
+
+    items, meta = await paginate(db, select(Goal), Goal.created_at, Goal.id, page=9, per_page=2, cursor=cursor)
+
+    db.execute.assert_awaited_once()
+    assert items == goals
+    assert (meta.page, meta.total, meta.total_pages, meta.next_cursor) == (None, None, None, None)
+    sql = _sql(db.execute.await_args.args[0])
+    assert "(goals.created_at, goals.id) < (" in sql
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_reads_the_plan():
+    connection = MagicMock()
+    plan = [{"Plan": {"Node Type": "Index Scan", "Plan Rows": 1234}}]
+    connection.exec_driver_sql = AsyncMock(return_value=MagicMock(scalar_one=MagicMock(return_value=json.dumps(plan))))
+    db = MagicMock()
+    db.connection = AsyncMock(return_value=connection)
+    org_id = uuid.uuid4()
+
+    total = await estimate_count(db, select(Goal).where(Goal.organization_id == org_id))
+
+    assert total == 1234
+    sql = connection.exec_driver_sql.await_args.args[0]
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert str(org_id) in sql
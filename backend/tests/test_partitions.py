@@ -0,0 +1,151 @@
+"""Tests for monthly partition maintenance and retention."""
+
+import gzip
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import partitions
+from app.services.partitions import add_months, partition_month, partition_name
+
+
+def _fake_unit_of_work(sessions: list[MagicMock]):
+    @asynccontextmanager
+    async def unit_of_work():
+        db = MagicMock()
+        db.execute = AsyncMock()
+        sessions.append(db)
+        yield db
+
+    return unit_of_work
+
+
+def _sql(db: MagicMock) -> list[str]:
+    return [str(call.args[0]) for call in db.execute.await_args_list]
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert add_months(date(2025, 1, 1), -24) == date(2023, 1, 1)
+
+
+def test_partition_names_round_trip():
+    name = partition_name("agent_sessions", date(2025, 3, 1))
+    assert name == "agent_sessions_p2025_03"
+    assert partition_month("agent_sessions", name) == date(2025, 3, 1)
+    # Other tables' partitions and anything not created by us are ignored
+    assert partition_month("api_usage", name) is None
+    assert partition_month("agent_sessions", "agent_sessions_unpartitioned") is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_each_month():
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    await partitions.ensure_partitions(db, "api_usage", date(2025, 12, 15), date(2026, 2, 1))
+
+    statements = _sql(db)
+    assert len(statements) == 3
+    assert statements[0] == (
+        "CREATE TABLE IF NOT EXISTS api_usage_p2025_12 PARTITION OF api_usage "
+        "FOR VALUES FROM ('2025-12-01T00:00:00+00:00') TO ('2026-01-01T00:00:00+00:00')"
+    )
+    assert "api_usage_p2026_02" in statements[2]
+
+
+@pytest.mark.asyncio
+async def test_drop_partition_folds_session_totals_first():
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    await partitions.drop_partition(db, "agent_sessions", "agent_sessions_p2024_01")
+
+    fold, detach, drop = _sql(db)
+    assert fold.startswith("UPDATE journeys") and "FROM agent_sessions_p2024_01" in fold
+    assert detach == "ALTER TABLE agent_sessions DETACH PARTITION agent_sessions_p2024_01"
+    assert drop == "DROP TABLE agent_sessions_p2024_01"
+
+
+@pytest.mark.asyncio
+async def test_archive_partition_uploads_gzipped_json_lines():
+    rows = ['{"id": "a"}', '{"id": "b"}']
+
+    async def stream(_statement):
+        async def result():
+            for row in rows:
+                yield (row,)
+
+        return result()
+
+    uploaded = {}
+
+    async def fake_put_object(client, key, data, content_type, length=None):
+        uploaded.update(key=key, body=data.read(), content_type=content_type, length=length)
+
+    @asynccontextmanager
+    async def unit_of_work():
+        db = MagicMock()
+        db.stream = stream
+        yield db
+
+    with (
+        patch.object(partitions, "unit_of_work", unit_of_work),
+        patch.object(partitions, "put_object", fake_put_object),
+        patch.object(partitions, "get_minio_client", MagicMock()),
+    ):
+        key = await partitions.archive_partition("agent_sessions", "agent_sessions_p2024_01")
+
+    assert key == "archive/agent_sessions/agent_sessions_p2024_01.jsonl.gz"
+    assert uploaded["content_type"] == "application/gzip"
+    assert uploaded["length"] == len(uploaded["body"])
+    lines = gzip.decompress(uploaded["body"]).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_api_usage_partition_kept_until_rolled_up():
+    sessions: list[MagicMock] = []
+    with (
+        patch.object(partitions, "unit_of_work", _fake_unit_of_work(sessions)),
+        patch.object(partitions, "rolled_through", AsyncMock(return_value=date(2024, 1, 30))),
+        patch.object(partitions, "archive_partition", AsyncMock()) as mock_archive,
+    ):
+        retired = await partitions.retire_partition("api_usage", "api_usage_p2024_01", date(2024, 1, 1))
+
+    assert retired is False
+    mock_archive.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_maintain_partitions_retires_only_expired_months():
+    sessions: list[MagicMock] = []
+    names = {
+        "agent_sessions": ["agent_sessions_p2024_09", "agent_sessions_p2024_10", "agent_sessions_p2025_10"],
+        "api_usage": ["api_usage_p2024_09"],
+    }
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 10, 16, tzinfo=UTC)
+
+    with (
+        patch.object(partitions, "unit_of_work", _fake_unit_of_work(sessions)),
+        patch.object(partitions, "datetime", FixedDatetime),
+        patch.object(partitions, "ensure_partitions", AsyncMock()) as mock_ensure,
+        patch.object(partitions, "list_partitions", AsyncMock(side_effect=lambda db, table: names[table])),
+        patch.object(partitions, "retire_partition", AsyncMock()) as mock_retire,
+        patch.object(partitions.settings, "agent_sessions_retention_months", 12),
+        patch.object(partitions.settings, "api_usage_retention_months", 0),
+        patch.object(partitions.settings, "partition_premake_months", 3),
+    ):
+        await partitions.maintain_partitions({})
+
+    assert mock_ensure.await_args_list[0].args[1:] == ("agent_sessions", date(2025, 10, 1), date(2026, 1, 1))
+    # Cutoff is 2024-10: only September goes; api_usage retention is disabled
+    mock_retire.assert_awaited_once_with("agent_sessions", "agent_sessions_p2024_09", date(2024, 9, 1))
@@ -0,0 +1,94 @@
+"""Tests for the content-addressed prompt store."""
+
+import hashlib
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.agents.base import AgentContext, persist_rows
+from app.services.agents.prompt_store import (
+    expand_payload,
+    expand_request_payloads,
+    prompt_hash,
+    store_prompts,
+    stored_prompt,
+)
+
+
+def test_prompt_hash_is_sha256_hex():
+    assert prompt_hash("You are Lyra.") == hashlib.sha256(b"You are Lyra.").hexdigest()
+    assert stored_prompt("You are Lyra.").hash == prompt_hash("You are Lyra.")
+
+
+def test_expand_payload_restores_known_prompts():
+    ref = prompt_hash("system text")
+    payload = {"message": "hi", "system_ref": ref, "prompt_ref": "unknown"}
+
+    expanded = expand_payload(payload, {ref: "system text"})
+
+    assert expanded == {"message": "hi", "system": "system text", "prompt_ref": "unknown"}
+    assert payload["system_ref"] == ref  # input untouched
+
+
+@pytest.mark.asyncio
+async def test_store_prompts_inserts_each_hash_once_in_order():
+    db = MagicMock()
+    db.execute = AsyncMock()
+
+    await store_prompts(db, [stored_prompt("b"), stored_prompt("a"), stored_prompt("b")])
+
+    stmt = db.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (hash) DO NOTHING" in str(compiled)
+    hashes = [value for key, value in compiled.params.items() if key.startswith("hash")]
+    assert hashes == sorted([prompt_hash("a"), prompt_hash("b")])
+
+
+@pytest.mark.asyncio
+async def test_store_prompts_noop_without_prompts():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    await store_prompts(db, [])
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_persist_rows_stores_prompts_instead_of_adding_them():
+    from app.models.agent_session import AgentSession
+
+    db = MagicMock()
+    db.flush = AsyncMock()
+    db.execute = AsyncMock()
+    prompt = stored_prompt("system text")
+    session = AgentSession(
+        perspective_id=uuid.uuid4(), agent_name="lyra", request_payload={"system_ref": prompt.hash},
+    )
+
+    await persist_rows(db, AgentContext(perspective_id=uuid.uuid4()), prompt, session)
+
+    db.add_all.assert_called_once_with([session])
+    assert "prompts" in str(db.execute.await_args_list[0].args[0])
+
+
+@pytest.mark.asyncio
+async def test_expand_request_payloads_uses_one_lookup():
+    ref = prompt_hash("system text")
+    sessions = [
+        SimpleNamespace(request_payload={"message": "one", "system_ref": ref}),
+        SimpleNamespace(request_payload={"message": "two", "system_ref": ref}),
+        SimpleNamespace(request_payload={"type": "verdict", "challenge": "c"}),
+    ]
+    db = MagicMock()
+    lookup = MagicMock()
+    lookup.all.return_value = [(ref, "system text")]
+    db.execute = AsyncMock(return_value=lookup)
+
+    payloads = await expand_request_payloads(db, sessions)
+
+    db.execute.assert_awaited_once()
+    assert payloads[0] == {"message": "one", "system": "system text"}
+    assert payloads[1]["system"] == "system text"
+    assert payloads[2] == {"type": "verdict", "challenge": "c"}
@@ -0,0 +1,124 @@
+"""Tests for the content-addressed raw_chat response cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.lru import MemoryLRU
+from app.services.agents.cache import ResponseCache, response_cache_key
+
+
+def test_cache_key_is_deterministic():
+    a = response_cache_key("model", "system", "message", 4096)
+    b = response_cache_key("model", "system", "message", 4096)
+    assert a == b
+    assert len(a) == 64
+
+
+def test_cache_key_changes_with_each_input():
+    base = response_cache_key("model", "system", "message", 4096)
+    assert response_cache_key("other", "system", "message", 4096) != base
+    assert response_cache_key("model", "other", "message", 4096) != base
+    assert response_cache_key("model", "system", "other", 4096) != base
+    assert response_cache_key("model", "system", "message", 1024) != base
+
+
+def test_memory_lru_evicts_least_recently_used():
+    lru = MemoryLRU(max_entries=2, max_bytes=1024)
+    lru.set("a", "1", 60)
+    lru.set("b", "2", 60)
+    assert lru.get("a") == "1"  # touch a so b becomes the LRU entry
+    lru.set("c", "3", 60)
+    assert lru.get("b") is None
+    assert lru.get("a") == "1"
+    assert lru.get("c") == "3"
+
+
+def test_memory_lru_evicts_by_size():
+    lru = MemoryLRU(max_entries=100, max_bytes=10)
+    lru.set("a", "x" * 6, 60)
+    lru.set("b", "y" * 6, 60)
+    assert lru.get("a") is None
+    assert lru.get("b") == "y" * 6
+    assert lru.size_bytes == 6
+
+
+def test_memory_lru_skips_oversized_values():
+    lru = MemoryLRU(max_entries=10, max_bytes=4)
+    lru.set("a", "too large", 60)
+    assert len(lru) == 0
+
+
+def test_memory_lru_expires_entries():
+    lru = MemoryLRU(max_entries=10, max_bytes=1024)
+    lru.set("a", "1", 0)
+    assert lru.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_response_cache_tiers_and_stats():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=[None, "from redis"])
+    redis.set = AsyncMock()
+    cache = ResponseCache(max_entries=10, max_bytes=1024, ttl_seconds=60)
+
+    with patch("app.services.agents.cache.get_redis", return_value=redis):
+        assert await cache.get("k1") is None
+        await cache.set("k1", "value")
+        assert await cache.get("k1") == "value"
+        assert await cache.get("k2") == "from redis"
+        assert await cache.get("k2") == "from redis"
+
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 2
+    assert cache.stats.redis_hits == 1
+    assert cache.stats.stores == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_redis_error_is_a_miss():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    cache = ResponseCache(max_entries=10, max_bytes=1024, ttl_seconds=60)
+
+    with patch("app.services.agents.cache.get_redis", return_value=redis):
+        assert await cache.get("k") is None
+
+    assert cache.stats.errors == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_raw_chat_cache_hit_skips_api_call():
+    from app.services.agents.base import BaseAgent
+
+    agent = BaseAgent("lyra")
+    with (
+        patch("app.services.agents.base.response_cache") as mock_cache,
+        patch("app.services.agents.base.get_anthropic_client") as mock_client,
+    ):
+        mock_cache.enabled = True
+        mock_cache.get = AsyncMock(return_value="cached answer")
+        result = await agent.raw_chat("hello", "system")
+
+    assert result.cached is True
+    assert result.content == "cached answer"
+    assert result.input_tokens == 0 and result.output_tokens == 0
+    mock_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_record_api_usage_cached_is_free():
+    import uuid
+
+    from app.services.agents.base import AgentContext, record_api_usage
+
+    db = MagicMock()
+    db.flush = AsyncMock()
+    context = AgentContext(perspective_id=uuid.uuid4(), organization_id=uuid.uuid4(), user_id=uuid.uuid4())
+
+    await record_api_usage(db, context, "lyra", "model", 1000, 500, "test", cached=True)
+
+    [usage] = db.add_all.call_args.args[0]
+    assert usage.cost_cents == 0
+    assert usage.cached is True
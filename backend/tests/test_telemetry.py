@@ -0,0 +1,139 @@
+"""Tests for the write-behind telemetry buffer."""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.agent_session import AgentSession
+from app.models.api_usage import ApiUsage
+from app.models.axiom_challenge import AxiomChallenge
+from app.services.agents import telemetry
+from app.services.agents.base import AgentContext, persist_rows
+from app.services.agents.telemetry import TelemetryBuffer, serialize_rows
+
+
+def _fake_unit_of_work(sessions: list[MagicMock], fail: bool = False):
+    @asynccontextmanager
+    async def unit_of_work():
+        db = MagicMock()
+        db.flush = AsyncMock(side_effect=RuntimeError("db down") if fail else None)
+        db.execute = AsyncMock()
+        sessions.append(db)
+        yield db
+
+    return unit_of_work
+
+
+def _session_row() -> AgentSession:
+    return AgentSession(perspective_id=uuid.uuid4(), agent_name="lyra", input_tokens=10, output_tokens=5)
+
+
+def _usage_row() -> ApiUsage:
+    return ApiUsage(
+        organization_id=uuid.uuid4(), user_id=uuid.uuid4(), service="claude",
+        model_name="m", tokens_in=10, tokens_out=5, cost_cents=0.5, endpoint="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_assigns_id_and_timestamp():
+    buffer = TelemetryBuffer(flush_interval=60)
+    row = _session_row()
+    buffer.add(row)
+    assert row.id is not None
+    assert row.created_at is not None
+    assert len(buffer) == 1
+    buffer._timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_one_batch_per_table_in_fk_order():
+    sessions: list[MagicMock] = []
+    buffer = TelemetryBuffer(flush_interval=60)
+    usage, session = _usage_row(), _session_row()
+    challenge = AxiomChallenge(perspective_id=uuid.uuid4(), challenge_text="c", severity="high")
+
+    with patch.object(telemetry, "unit_of_work", _fake_unit_of_work(sessions)):
+        buffer.add(challenge, usage, session)
+        written = await buffer.flush()
+        await buffer.aclose()
+
+    assert written == 3
+    assert len(sessions) == 1
+    batches = [call.args[0] for call in sessions[0].add_all.call_args_list]
+    assert batches == [[session], [usage], [challenge]]
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows():
+    sessions: list[MagicMock] = []
+    buffer = TelemetryBuffer(flush_interval=60)
+    buffer.add(_session_row())
+
+    with patch.object(telemetry, "unit_of_work", _fake_unit_of_work(sessions, fail=True)):
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+    assert len(buffer) == 1
+    buffer._timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_close_dead_letters_rows_it_cannot_write():
+    sessions: list[MagicMock] = []
+    buffer = TelemetryBuffer(flush_interval=60)
+    row = _usage_row()
+    buffer.add(row)
+
+    with (
+        patch.object(telemetry, "unit_of_work", _fake_unit_of_work(sessions, fail=True)),
+        patch.object(telemetry, "enqueue", AsyncMock(return_value="job-1")) as mock_enqueue,
+        patch.object(telemetry.asyncio, "sleep", AsyncMock()),
+    ):
+        await buffer.aclose()
+
+    assert len(sessions) == telemetry.FINAL_FLUSH_ATTEMPTS
+    kind, payload = mock_enqueue.await_args.args
+    assert kind == telemetry.REPLAY_JOB
+    assert payload["rows"][0]["table"] == "api_usage"
+    assert payload["rows"][0]["values"]["id"] == str(row.id)
+    assert len(buffer) == 0
+
+
+def test_serialize_rows_is_json_safe():
+    import json
+
+    row = _usage_row()
+    row.id = uuid.uuid4()
+    records = serialize_rows([row])
+    assert json.loads(json.dumps(records)) == records
+
+
+@pytest.mark.asyncio
+async def test_persist_rows_without_buffer_flushes_directly():
+    db = MagicMock()
+    db.flush = AsyncMock()
+    db.execute = AsyncMock()
+    context = AgentContext(perspective_id=uuid.uuid4())
+    row = _session_row()
+
+    await persist_rows(db, context, row)
+
+    db.add_all.assert_called_once_with([row])
+    db.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_persist_rows_with_buffer_skips_db():
+    db = MagicMock()
+    db.flush = AsyncMock()
+    buffer = TelemetryBuffer(flush_interval=60)
+    context = AgentContext(perspective_id=uuid.uuid4(), telemetry=buffer)
+
+    await persist_rows(db, context, _session_row())
+
+    db.flush.assert_not_awaited()
+    assert len(buffer) == 1
+    buffer._timer.cancel()
@@ -0,0 +1,134 @@
+"""Tests for optional OpenTelemetry tracing."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core import tracing
+from app.core.config import Settings
+from app.core.middleware import RequestIDMiddleware, request_id_var
+
+
+@pytest.fixture
+def traces(tmp_path):
+    """Enable tracing to an OTLP JSON file; returns a function reading the exported spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    path = tmp_path / "{service}.jsonl"
+    tracing.configure_tracing(Settings(tracing_enabled=True, tracing_file_path=str(path)), "test")
+
+    def read() -> list[dict]:
+        tracing.shutdown_tracing()
+        spans = []
+        for line in (tmp_path / "test.jsonl").read_text().splitlines():
+            for resource_spans in json.loads(line)["resourceSpans"]:
+                for scope_spans in resource_spans["scopeSpans"]:
+                    spans.extend(scope_spans["spans"])
+        return spans
+
+    yield read
+    tracing.shutdown_tracing()
+
+
+def _attributes(span: dict) -> dict:
+    return {attr["key"]: next(iter(attr["value"].values())) for attr in span.get("attributes", [])}
+
+
+def test_span_is_a_noop_when_tracing_is_off():
+    with tracing.span("anything", {"a": 1}) as current:
+        current.set_attributes({"b": 2})
+
+    assert current.is_recording() is False
+    assert tracing.inject_context() == {}
+
+
+def test_spans_nest_and_carry_the_request_id(traces):
+    token = request_id_var.set("req-1")
+    try:
+        with tracing.span("boomerang.run"), tracing.span("llm.raw_chat", {"incube.agent": "lyra"}) as current:
+            current.set_attributes({"gen_ai.usage.output_tokens": 12})
+    finally:
+        request_id_var.reset(token)
+
+    by_name = {span["name"]: span for span in traces()}
+    run, call = by_name["boomerang.run"], by_name["llm.raw_chat"]
+    assert call["parentSpanId"] == run["spanId"]
+    assert call["traceId"] == run["traceId"]
+    assert len(run["traceId"]) == 32
+    assert _attributes(call) == {
+        "incube.agent": "lyra",
+        "incube.request_id": "req-1",
+        "gen_ai.usage.output_tokens": "12",
+    }
+
+
+def test_trace_continues_from_injected_context(traces):
+    with tracing.span("POST /api/perspectives/{perspective_id}/boomerang"):
+        carrier = tracing.inject_context()
+
+    with tracing.continue_trace(carrier), tracing.span("job boomerang_run"):
+        pass
+
+    request, job = traces()
+    assert "traceparent" in carrier
+    assert job["traceId"] == request["traceId"]
+    assert job["parentSpanId"] == request["spanId"]
+
+
+@pytest.mark.asyncio
+async def test_request_span_named_by_route_and_linked_to_request_id(traces):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        return {"id": item_id}
+
+    app.add_middleware(tracing.TracingMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    parent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/items/7", headers={"traceparent": parent})
+
+    [server] = traces()
+    attributes = _attributes(server)
+    assert server["name"] == "GET /items/{item_id}"
+    assert server["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+    assert attributes["incube.request_id"] == response.headers["X-Request-ID"]
+    assert attributes["http.response.status_code"] == "200"
+
+
+@pytest.mark.asyncio
+async def test_started_span_is_current_only_while_the_inner_generator_runs(traces):
+    from opentelemetry import trace
+
+    seen: list[str] = []
+
+    async def events():
+        seen.append(trace.get_current_span().name)
+        with tracing.span("llm.raw_chat"):
+            pass
+        yield "first"
+        yield "second"
+
+    async def stream():
+        current = tracing.start_span("boomerang.axiom")
+        try:
+            async for event in tracing.iterate_in_span(current, events()):
+                yield event
+        finally:
+            current.end()
+
+    with tracing.span("boomerang.run"):
+        outer = trace.get_current_span()
+        generator = stream()
+        assert await anext(generator) == "first"
+        # Between yields the caller's span is still the current one
+        assert trace.get_current_span() is outer
+        # Closed early, as on a client disconnect: the span still ends
+        await generator.aclose()
+
+    by_name = {span["name"]: span for span in traces()}
+    assert seen == ["boomerang.axiom"]
+    assert by_name["boomerang.axiom"]["parentSpanId"] == by_name["boomerang.run"]["spanId"]
+    assert by_name["llm.raw_chat"]["parentSpanId"] == by_name["boomerang.axiom"]["spanId"]
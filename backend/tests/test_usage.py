@@ -4,6 +4,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.schemas.settings import DailyUsage, UsageBreakdownResponse, UsageEntry, UsageSummaryResponse
 from app.services import usage as usage_service
@@ -15,6 +16,12 @@ def _make_db_mock() -> MagicMock:
     return db
 
 
+def _rolled_through(day: date | None = None) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one.return_value = day
+    return result
+
+
 @pytest.mark.asyncio
 async def test_get_usage_summary():
     db = _make_db_mock()
@@ -22,7 +29,8 @@ async def test_get_usage_summary():
 
     totals_result = MagicMock()
     totals_result.one.return_value = SimpleNamespace(
-        total_cost=150.5, total_in=10000, total_out=5000, total_calls=25
+        total_cost=150.5, total_in=10000, total_out=5000, total_calls=25,
+        total_cache_read=40000, total_cache_write=2000,
     )
 
     daily_result = MagicMock()
@@ -31,7 +39,7 @@ async def test_get_usage_summary():
         SimpleNamespace(day=date(2025, 1, 2), cost=100.5, t_in=7000, t_out=3500),
     ]
 
-    db.execute = AsyncMock(side_effect=[totals_result, daily_result])
+    db.execute = AsyncMock(side_effect=[_rolled_through(), totals_result, daily_result])
 
     summary = await usage_service.get_usage_summary(
         db, org_id, start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
@@ -41,6 +49,9 @@ async def test_get_usage_summary():
     assert summary.total_tokens_in == 10000
     assert summary.total_tokens_out == 5000
     assert summary.total_calls == 25
+    assert summary.total_cache_read_tokens == 40000
+    assert summary.total_cache_write_tokens == 2000
+    assert summary.cache_savings_cents > 0
     assert len(summary.by_date) == 2
     assert summary.by_date[0].date == date(2025, 1, 1)
 
@@ -52,16 +63,18 @@ async def test_get_usage_summary_defaults_date_range():
 
     totals_result = MagicMock()
     totals_result.one.return_value = SimpleNamespace(
-        total_cost=0, total_in=0, total_out=0, total_calls=0
+        total_cost=0, total_in=0, total_out=0, total_calls=0,
+        total_cache_read=0, total_cache_write=0,
     )
     daily_result = MagicMock()
     daily_result.all.return_value = []
 
-    db.execute = AsyncMock(side_effect=[totals_result, daily_result])
+    db.execute = AsyncMock(side_effect=[_rolled_through(), totals_result, daily_result])
 
     summary = await usage_service.get_usage_summary(db, org_id)
     assert summary.total_cost_cents == 0
     assert summary.total_calls == 0
+    assert summary.cache_savings_cents == 0
     assert summary.by_date == []
 
 
@@ -75,7 +88,7 @@ async def test_get_usage_breakdown_by_service():
         SimpleNamespace(name="claude", cost=120.0, t_in=8000, t_out=4000, calls=20),
         SimpleNamespace(name="whisper", cost=30.5, t_in=2000, t_out=1000, calls=5),
     ]
-    db.execute = AsyncMock(return_value=result)
+    db.execute = AsyncMock(side_effect=[_rolled_through(), result])
 
     breakdown = await usage_service.get_usage_breakdown(
         db, org_id, group_by="service", start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
@@ -96,7 +109,7 @@ async def test_get_usage_breakdown_by_model():
     result.all.return_value = [
         SimpleNamespace(name="claude-haiku-4-5-20251001", cost=80.0, t_in=6000, t_out=3000, calls=15),
     ]
-    db.execute = AsyncMock(return_value=result)
+    db.execute = AsyncMock(side_effect=[_rolled_through(), result])
 
     breakdown = await usage_service.get_usage_breakdown(db, org_id, group_by="model")
     assert len(breakdown.breakdown) == 1
@@ -110,12 +123,32 @@ async def test_get_usage_breakdown_empty():
 
     result = MagicMock()
     result.all.return_value = []
-    db.execute = AsyncMock(return_value=result)
+    db.execute = AsyncMock(side_effect=[_rolled_through(), result])
 
     breakdown = await usage_service.get_usage_breakdown(db, org_id, group_by="service")
     assert breakdown.breakdown == []
 
 
+def test_usage_rows_read_rollup_then_raw_rows_after_it():
+    org_id = uuid.uuid4()
+    rows = usage_service._usage_rows(org_id, date(2025, 1, 1), date(2025, 1, 31), date(2025, 1, 29))
+    sql = str(rows.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "FROM api_usage_daily" in sql
+    assert "api_usage_daily.day <= '2025-01-29'" in sql
+    # Only the days after the rollup are read raw, by created_at range
+    assert "api_usage.created_at >= '2025-01-30" in sql
+    assert "api_usage.created_at < '2025-02-01" in sql
+
+
+def test_usage_rows_without_rollup_reads_raw_only():
+    rows = usage_service._usage_rows(uuid.uuid4(), date(2025, 1, 1), date(2025, 1, 31), None)
+    sql = str(rows.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "api_usage_daily" not in sql
+    assert "api_usage.created_at >= '2025-01-01" in sql
+
+
 def test_daily_usage_schema():
     d = DailyUsage(date=date(2025, 1, 1), cost_cents=50.0, tokens_in=1000, tokens_out=500)
     assert d.date == date(2025, 1, 1)
@@ -0,0 +1,169 @@
+"""Tests for the authenticated-user cache and token-claim principals."""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.errors import UnauthorizedError
+from app.core.security import create_access_token
+from app.models.enums import UserRole
+from app.services import auth as auth_service
+from app.services import user_cache as user_cache_module
+from app.services.user_cache import TOMBSTONE, UserCache, _serialize
+
+
+def _user(**overrides) -> SimpleNamespace:
+    defaults = {
+        "id": uuid.uuid4(),
+        "organization_id": uuid.uuid4(),
+        "email": "ada@example.com",
+        "name": "Ada",
+        "role": "editor",
+        "avatar_url": None,
+        "password_hash": "$2b$12$secret",
+        "email_verified_at": datetime(2025, 1, 1, tzinfo=UTC),
+        "created_at": datetime(2024, 12, 1, tzinfo=UTC),
+        "updated_at": datetime(2025, 1, 1, tzinfo=UTC),
+    }
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+def _redis(get_value=None, set_result=True) -> MagicMock:
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=get_value)
+    redis.set = AsyncMock(return_value=set_result)
+    return redis
+
+
+def _patched(cache: UserCache, redis: MagicMock):
+    return patch.multiple(user_cache_module, user_cache=cache, get_redis=MagicMock(return_value=redis))
+
+
+def _db_returning(user) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_serialized_user_omits_password_hash():
+    raw = _serialize(_user())
+    assert "password_hash" not in raw
+    assert "secret" not in raw
+
+
+@pytest.mark.asyncio
+async def test_miss_loads_from_db_then_serves_from_memory():
+    cache = UserCache(max_entries=10, memory_ttl_seconds=60, ttl_seconds=300)
+    user = _user()
+    db = _db_returning(user)
+    redis = _redis()
+
+    with _patched(cache, redis):
+        first = await user_cache_module.load_user(db, user.id)
+        second = await user_cache_module.load_user(db, user.id)
+
+    assert first is user
+    db.execute.assert_awaited_once()
+    assert redis.set.await_args.kwargs == {"ex": 300, "nx": True}
+    assert (second.id, second.organization_id, second.role) == (user.id, user.organization_id, UserRole.EDITOR)
+    assert second.email_verified_at == user.email_verified_at
+    assert (cache.stats.misses, cache.stats.memory_hits, cache.stats.db_lookups_saved) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_skips_db():
+    cache = UserCache(max_entries=10, memory_ttl_seconds=60, ttl_seconds=300)
+    user = _user(role="admin")
+    db = _db_returning(None)
+
+    with _patched(cache, _redis(get_value=_serialize(user))):
+        cached = await user_cache_module.load_user(db, user.id)
+
+    db.execute.assert_not_awaited()
+    assert cached.role == UserRole.ADMIN
+    assert cache.stats.redis_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidated_user_is_not_recached_while_tombstoned():
+    cache = UserCache(max_entries=10, memory_ttl_seconds=60, ttl_seconds=300)
+    user = _user()
+    redis = _redis()
+
+    with _patched(cache, redis):
+        await user_cache_module.load_user(_db_returning(user), user.id)
+        await user_cache_module.invalidate_user(user.id)
+        assert redis.set.await_args.args[1] == TOMBSTONE
+
+        # A request that read the row before the change committed: Redis refuses the entry (NX)
+        redis.get.return_value = TOMBSTONE
+        redis.set.return_value = None
+        db = _db_returning(user)
+        await user_cache_module.load_user(db, user.id)
+        await user_cache_module.load_user(db, user.id)
+
+    assert db.execute.await_count == 2
+    assert cache.stats.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_db_and_memory():
+    cache = UserCache(max_entries=10, memory_ttl_seconds=60, ttl_seconds=300)
+    user = _user()
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    redis.set = AsyncMock(side_effect=ConnectionError("down"))
+    db = _db_returning(user)
+
+    with _patched(cache, redis):
+        await user_cache_module.load_user(db, user.id)
+        await user_cache_module.load_user(db, user.id)
+
+    db.execute.assert_awaited_once()
+    assert cache.stats.errors == 2
+
+
+def test_token_principal_from_claims():
+    user_id, org_id = uuid.uuid4(), uuid.uuid4()
+    principal = auth_service.get_token_principal(create_access_token(str(user_id), str(org_id), "viewer"))
+    assert (principal.id, principal.organization_id, principal.role) == (user_id, org_id, "viewer")
+
+
+def test_token_principal_rejects_malformed_claims():
+    with pytest.raises(UnauthorizedError):
+        auth_service.get_token_principal(create_access_token("not-a-uuid", str(uuid.uuid4()), "viewer"))
+
+
+@pytest.mark.asyncio
+async def test_cache_results_are_published_as_metrics():
+    from prometheus_client import REGISTRY
+
+    from app.core.metrics import render_metrics
+
+    def sample(name: str, **labels: str) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    before_saved = sample("incube_auth_cache_db_lookups_saved_total")
+    before_misses = sample("incube_auth_cache_lookups_total", result="miss")
+    before_redis = sample("incube_auth_cache_lookups_total", result="redis_hit")
+    cache = UserCache(max_entries=10, memory_ttl_seconds=60, ttl_seconds=300)
+    user = _user()
+
+    # A miss, then a memory hit; then, with a fresh memory tier, a Redis hit
+    with _patched(cache, _redis()):
+        await user_cache_module.load_user(_db_returning(user), user.id)
+        await user_cache_module.load_user(_db_returning(user), user.id)
+    with _patched(UserCache(10, 60, 300), _redis(get_value=_serialize(user))):
+        await user_cache_module.load_user(_db_returning(None), user.id)
+
+    assert sample("incube_auth_cache_lookups_total", result="miss") == before_misses + 1
+    assert sample("incube_auth_cache_lookups_total", result="redis_hit") == before_redis + 1
+    assert sample("incube_auth_cache_db_lookups_saved_total") == before_saved + 2
+    body, _content_type = render_metrics()
+    assert b"incube_auth_cache_db_lookups_saved_total" in body
@@ -97,7 +97,7 @@ async def test_publish_journey_success():
     version_result.scalar_one.return_value = 0
 
     db.execute = AsyncMock(
-        side_effect=[journey_result, count_result, bank_result, version_result]
+        side_effect=[journey_result, count_result, bank_result, version_result, MagicMock()]
     )
 
     body = VdbaCreate(title="My VDBA", description="desc", export_format="json")
@@ -206,7 +206,7 @@ async def test_publish_journey_version_increment():
     version_result.scalar_one.return_value = 1
 
     db.execute = AsyncMock(
-        side_effect=[journey_result, count_result, bank_result, version_result]
+        side_effect=[journey_result, count_result, bank_result, version_result, MagicMock()]
     )
 
     body = VdbaCreate(title="VDBA v2")
@@ -229,8 +229,8 @@ async def test_list_vdbas():
 
     db.execute = AsyncMock(side_effect=[count_result, list_result])
 
-    result, total = await vdba_service.list_vdbas(db, org_id, page=1, per_page=20)
-    assert total == 3
+    result, pagination = await vdba_service.list_vdbas(db, org_id, page=1, per_page=20)
+    assert pagination.total == 3
     assert len(result) == 3
 
 
@@ -222,14 +222,15 @@ class TestWhisperService:
 
 class TestVibeMinIO:
     def test_get_minio_client(self):
-        from app.services.vibe_minio import get_minio_client
+        from app.services.minio import get_minio_client
 
         client = get_minio_client()
         assert client is not None
+        assert get_minio_client() is client
 
     @pytest.mark.asyncio
     async def test_upload_audio_returns_key(self):
-        from app.services.vibe_minio import upload_audio
+        from app.services.minio import upload_audio
 
         mock_client = AsyncMock()
         mock_client.put_object = AsyncMock()
@@ -243,7 +244,7 @@ class TestVibeMinIO:
 
     @pytest.mark.asyncio
     async def test_download_audio_returns_bytes(self):
-        from app.services.vibe_minio import download_audio
+        from app.services.minio import download_audio
 
         mock_response = AsyncMock()
         mock_response.read = AsyncMock(return_value=b"audio data")
@@ -328,3 +329,129 @@ class TestVibeRoutes:
         fake_id = str(uuid.uuid4())
         response = await vibe_client.post(f"/api/vibes/{fake_id}/analyze")
         assert response.status_code != 405
+
+
+# --- Post-vibe analysis fan-out ---
+
+
+class TestPostVibeAnalysis:
+    @pytest.mark.asyncio
+    async def test_fan_out_holds_no_session_and_writes_once(self):
+        from contextlib import asynccontextmanager
+
+        from app.services import vibe as vibe_service
+        from app.services.agents.prompts import VALID_AGENT_NAMES
+
+        vibe = MagicMock(id=uuid.uuid4(), transcript_text="hello", perspective_id=uuid.uuid4())
+        perspective = MagicMock(dimension="architecture", phase="generate", journey_id=uuid.uuid4())
+        open_sessions = 0
+        sessions: list[MagicMock] = []
+
+        @asynccontextmanager
+        async def fake_unit_of_work():
+            nonlocal open_sessions
+            db = MagicMock()
+            db.flush = AsyncMock()
+            if not sessions:
+                db.execute = AsyncMock(side_effect=[
+                    MagicMock(scalar_one_or_none=MagicMock(return_value=vibe)),
+                    MagicMock(scalar_one_or_none=MagicMock(return_value=perspective)),
+                    MagicMock(scalar_one_or_none=MagicMock(return_value=uuid.uuid4())),
+                ])
+            else:
+                db.execute = AsyncMock(side_effect=[
+                    MagicMock(scalar_one_or_none=MagicMock(return_value=vibe)),
+                    MagicMock(),  # delete old analyses
+                    MagicMock(),  # refresh journey cost
+                    MagicMock(),  # bump org cost
+                ])
+            sessions.append(db)
+            open_sessions += 1
+            try:
+                yield db
+            finally:
+                open_sessions -= 1
+
+        async def fake_agent(name, transcript, dimension, phase, organization_id=None):
+            assert open_sessions == 0
+            if name == "axiom":
+                return None
+            return vibe_service._AgentAnalysisResult(
+                agent_name=name, model="m", content_text="{}", content_json={},
+                input_tokens=1, output_tokens=1, cost_cents=0.1, duration_ms=5,
+            )
+
+        with (
+            patch.object(vibe_service, "unit_of_work", fake_unit_of_work),
+            patch.object(vibe_service, "_run_single_agent_analysis", side_effect=fake_agent),
+        ):
+            await vibe_service.run_post_vibe_analysis(vibe.id)
+
+        assert len(sessions) == 2
+        added = [obj for call in sessions[1].add_all.call_args_list for obj in call.args[0]]
+        assert len(added) == 2 * (len(VALID_AGENT_NAMES) - 1)
+        assert vibe.status == "complete"
+
+
+# --- Listing ---
+
+
+class TestListVibeSessions:
+    @staticmethod
+    def _row(created_at: datetime, analyses: int = 0, has_transcript: bool = True):
+        from types import SimpleNamespace
+
+        vibe = SimpleNamespace(id=uuid.uuid4(), duration_seconds=60, status="complete", created_at=created_at)
+        return SimpleNamespace(VibeSession=vibe, has_transcript=has_transcript, analyses_count=analyses)
+
+    @pytest.mark.asyncio
+    async def test_single_query_with_counts_and_no_transcript_load(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.services.vibe import list_vibe_sessions
+
+        rows = [self._row(datetime(2025, 1, 2, tzinfo=UTC), analyses=9), self._row(datetime(2025, 1, 1, tzinfo=UTC))]
+        result = MagicMock()
+        result.all.return_value = rows
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        items, next_cursor = await list_vibe_sessions(db, uuid.uuid4())
+
+        db.execute.assert_awaited_once()
+        assert next_cursor is None
+        assert [item.analyses_count for item in items] == [9, 0]
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "count(*)" in sql and "GROUP BY vibe_analyses.vibe_session_id" in sql
+        assert "vibe_sessions.transcript_text IS NOT NULL" in sql
+        assert "vibe_sessions.transcript_text," not in sql
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_round_trip_cursor(self):
+        from app.schemas.common import decode_cursor
+        from app.services.vibe import list_vibe_sessions
+
+        rows = [self._row(datetime(2025, 1, day, tzinfo=UTC)) for day in (3, 2, 1)]
+        result = MagicMock()
+        result.all.return_value = rows
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        items, next_cursor = await list_vibe_sessions(db, uuid.uuid4(), limit=2)
+
+        assert len(items) == 2
+        assert decode_cursor(next_cursor) == (rows[1].VibeSession.created_at, rows[1].VibeSession.id)
+
+        db.execute.reset_mock()
+        await list_vibe_sessions(db, uuid.uuid4(), limit=2, cursor=next_cursor)
+        query = db.execute.await_args.args[0]
+        assert "(vibe_sessions.created_at, vibe_sessions.id) <" in str(query)
+        assert "LIMIT" in str(query)
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self):
+        from app.core.errors import ValidationError
+        from app.services.vibe import list_vibe_sessions
+
+        with pytest.raises(ValidationError):
+            await list_vibe_sessions(MagicMock(), uuid.uuid4(), limit=10, cursor="not-a-cursor")